@@ -64,9 +64,9 @@ class AppStyles:
     @staticmethod
     def get_color_palette(n_colors):
         """Get color palette for charts"""
-        import matplotlib.pyplot as plt
+        import matplotlib
         import numpy as np
-        return plt.cm.viridis(np.linspace(0, 1, n_colors))
+        return matplotlib.colormaps['viridis'](np.linspace(0, 1, n_colors))
     
     @staticmethod
     def get_group_text():
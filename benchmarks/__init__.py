@@ -0,0 +1,6 @@
+from .generators import generate_decision_matrix, generate_model
+
+__all__ = [
+    'generate_decision_matrix',
+    'generate_model'
+]
@@ -0,0 +1,36 @@
+import numpy as np
+from typing import List, Tuple
+from models.saw_model import SAWModel
+
+
+def generate_decision_matrix(n_alternatives: int, n_criteria: int, sparsity: float = 0.0,
+                             benefit_ratio: float = 0.5, seed: int = 0
+                             ) -> Tuple[np.ndarray, List[float], List[str]]:
+    """Generate a synthetic decision matrix, weights and criteria types"""
+    # sparsity: fraction of zero cells, benefit_ratio: share of benefit criteria
+    rng = np.random.default_rng(seed)
+    matrix = rng.uniform(1.0, 100.0, (n_alternatives, n_criteria)).round(2)
+    if sparsity > 0:
+        matrix[rng.random(matrix.shape) < sparsity] = 0.0
+
+    weights = rng.uniform(0.1, 1.0, n_criteria).round(3).tolist()
+    n_benefit = int(round(n_criteria * benefit_ratio))
+    criteria_types = ['benefit'] * n_benefit + ['cost'] * (n_criteria - n_benefit)
+    criteria_types = [criteria_types[i] for i in rng.permutation(n_criteria)]
+    return matrix, weights, criteria_types
+
+
+def generate_model(n_alternatives: int, n_criteria: int, sparsity: float = 0.0,
+                   benefit_ratio: float = 0.5, seed: int = 0) -> SAWModel:
+    """Generate a SAWModel loaded with synthetic data"""
+    matrix, weights, criteria_types = generate_decision_matrix(
+        n_alternatives, n_criteria, sparsity, benefit_ratio, seed)
+    model = SAWModel()
+    model.set_data(
+        [f"A{i + 1}" for i in range(n_alternatives)],
+        [f"C{j + 1}" for j in range(n_criteria)],
+        weights,
+        matrix.tolist(),
+        criteria_types
+    )
+    return model
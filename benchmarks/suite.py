@@ -0,0 +1,201 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+import matplotlib
+matplotlib.use('Agg')  # headless: never touch Tk
+import numpy as np
+
+from benchmarks.generators import generate_model
+from config.settings import AppConfig
+from utils.chart_renderer import render_png
+from utils.chart_utils import chart_job
+from utils.exporters import ResultExporter
+
+
+class BenchmarkSuite:
+    """Time and memory benchmarks for the model, sensitivity, export and chart paths"""
+
+    STAGES = ['normalize_matrix', 'calculate_scores', 'sensitivity_analysis',
+              'export_csv', 'render_saw_charts']
+
+    def __init__(self, repeats: int = 3, chart_max_alternatives: int = 300):
+        self.repeats = repeats
+        self.chart_max_alternatives = chart_max_alternatives
+        self.results: List[Dict[str, Any]] = []
+
+    def _stage_callables(self, model, workdir: str) -> Dict[str, Callable[[], Any]]:
+        """Build one zero-argument callable per stage (the model is pre-scored)"""
+        def normalize():
+            model.normalize_matrix()
+
+        def scores():
+            model.calculate_scores()
+
+        def sensitivity():
+            model.sensitivity_analysis(0, AppConfig.DEFAULT_SENSITIVITY_RANGE)
+
+        def export():
+            cwd = os.getcwd()
+            os.chdir(workdir)
+            try:
+                ResultExporter().export_to_csv(model.results, 'benchmark')
+            finally:
+                os.chdir(cwd)
+
+        def charts():
+            # Same pipeline as the app: build the figure and draw it to PNG with Agg
+            _, build = chart_job(model, 'hasil_saw')
+            render_png(build)
+
+        return {
+            'normalize_matrix': normalize,
+            'calculate_scores': scores,
+            'sensitivity_analysis': sensitivity,
+            'export_csv': export,
+            'render_saw_charts': charts
+        }
+
+    def _measure(self, func: Callable[[], Any], repeats: int) -> Dict[str, float]:
+        """Return timing statistics and peak traced memory of a callable"""
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+
+        # Separate traced run so tracemalloc overhead does not skew timings
+        tracemalloc.start()
+        try:
+            func()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        return {
+            'min_s': min(timings),
+            'median_s': statistics.median(timings),
+            'max_s': max(timings),
+            'peak_bytes': peak
+        }
+
+    def run_case(self, n_alternatives: int, n_criteria: int, sparsity: float = 0.0,
+                 benefit_ratio: float = 0.5, stages: Optional[List[str]] = None,
+                 seed: int = 0, dtype: str = 'float64') -> List[Dict[str, Any]]:
+        """Benchmark every stage for one synthetic data size"""
+        model = generate_model(n_alternatives, n_criteria, sparsity, benefit_ratio, seed)
+        model.set_dtype(dtype)
+        model.calculate_scores()
+        case = {
+            'n_alternatives': n_alternatives,
+            'n_criteria': n_criteria,
+            'sparsity': sparsity,
+            'benefit_ratio': benefit_ratio,
+            'dtype': dtype
+        }
+
+        records = []
+        with tempfile.TemporaryDirectory() as workdir:
+            callables = self._stage_callables(model, workdir)
+            for stage in stages or self.STAGES:
+                # A chart render takes seconds (and far longer traced), so it is timed once
+                repeats = 1 if stage == 'render_saw_charts' else self.repeats
+                record = dict(case, stage=stage, repeats=repeats)
+                if stage == 'render_saw_charts' and n_alternatives > self.chart_max_alternatives:
+                    record['skipped'] = f"more than {self.chart_max_alternatives} alternatives"
+                else:
+                    record.update(self._measure(callables[stage], repeats))
+                records.append(record)
+
+        if dtype != 'float64':
+            records.append(dict(case, stage='validate_dtype', validation=model.validate_dtype()))
+
+        self.results.extend(records)
+        return records
+
+    def report(self) -> Dict[str, Any]:
+        """Machine-readable report of all runs so far"""
+        return {
+            'meta': {
+                'timestamp': datetime.now().isoformat(timespec='seconds'),
+                'python': platform.python_version(),
+                'numpy': np.__version__,
+                'matplotlib': matplotlib.__version__,
+                'platform': platform.platform(),
+                'repeats': self.repeats
+            },
+            'results': self.results
+        }
+
+    @staticmethod
+    def compare(current: Dict[str, Any], baseline: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Median-time ratio (current / baseline) for every matching stage and size"""
+        def key(record):
+            return (record['stage'], record['n_alternatives'], record['n_criteria'],
+                    record['sparsity'], record['benefit_ratio'], record.get('dtype', 'float64'))
+
+        baseline_index = {key(r): r for r in baseline['results'] if 'median_s' in r}
+        comparison = []
+        for record in current['results']:
+            old = baseline_index.get(key(record))
+            if old is None or 'median_s' not in record:
+                continue
+            comparison.append({
+                'stage': record['stage'],
+                'n_alternatives': record['n_alternatives'],
+                'n_criteria': record['n_criteria'],
+                'dtype': record.get('dtype', 'float64'),
+                'time_ratio': record['median_s'] / old['median_s'] if old['median_s'] else None,
+                'memory_ratio': (record['peak_bytes'] / old['peak_bytes']
+                                 if old['peak_bytes'] else None)
+            })
+        return comparison
+
+
+def main():
+    """Run the benchmark suite from the command line"""
+    parser = argparse.ArgumentParser(description="SAW benchmark suite (headless)")
+    parser.add_argument('--sizes', nargs='+', default=['100x5', '1000x10', '10000x10', '100000x20'],
+                        help="ALTERNATIVESxCRITERIA pairs")
+    parser.add_argument('--sparsity', type=float, nargs='+', default=[0.0])
+    parser.add_argument('--benefit-ratio', type=float, nargs='+', default=[0.5])
+    parser.add_argument('--stages', nargs='+', choices=BenchmarkSuite.STAGES)
+    parser.add_argument('--dtype', nargs='+', choices=['float64', 'float32'], default=['float64'])
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--chart-max-alternatives', type=int, default=300,
+                        help="skip the chart stage above this many alternatives")
+    parser.add_argument('--output', help="write the JSON report to this file (default: stdout)")
+    parser.add_argument('--baseline', help="previous JSON report to compare against")
+    args = parser.parse_args()
+
+    suite = BenchmarkSuite(repeats=args.repeats, chart_max_alternatives=args.chart_max_alternatives)
+    for size in args.sizes:
+        n_alternatives, n_criteria = (int(v) for v in size.lower().split('x'))
+        for sparsity in args.sparsity:
+            for benefit_ratio in args.benefit_ratio:
+                for dtype in args.dtype:
+                    suite.run_case(n_alternatives, n_criteria, sparsity, benefit_ratio, args.stages,
+                                   dtype=dtype)
+
+    report = suite.report()
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            report['comparison'] = BenchmarkSuite.compare(report, json.load(f))
+
+    data = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(data)
+    else:
+        print(data)
+
+
+if __name__ == "__main__":
+    main()
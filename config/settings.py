@@ -28,15 +28,63 @@ class AppConfig:
     EXPORT_DATE_FORMAT = "%Y%m%d_%H%M%S"
     EXPORT_FILENAME_PREFIX = "hasil_saw_"
     
+    # Chart settings
+    CHART_RENDER_MODE = 'image'  # 'image': drawn off the Tk thread and shown as a picture; 'canvas': interactive
+    CHART_DPI = 100
+    CHART_CACHE_SIZE = 16  # rendered chart images kept for unchanged results
+    CHART_POLL_MS = 50  # how often the UI checks for a finished chart image
+    
+    # Project settings
+    PROJECT_EXTENSION = '.sawproj'
+    AUTOSAVE_INTERVAL_MS = 5000
+    LIVE_DEBOUNCE_MS = 80  # live mode: quiet time before a coalesced recompute
+    LIVE_TOP_K = 10  # live mode: alternatives shown in the live ranking
+    HISTORY_LIMIT = 500  # undo steps kept for model edits
+    DECISION_DB_PATH = None  # SQLite run history file; None = disabled (SAW_DECISION_DB also enables it)
+    
     # Calculation settings
     DEFAULT_SENSITIVITY_RANGE = 0.2
     SENSITIVITY_STEP = 0.02
+    COMPUTE_DTYPE = 'float64'  # 'float32' halves matrix memory; scores still accumulate in float64
+    DTYPE_TOLERANCE = 1e-5  # float32 vs float64 score differences tolerated by validate_dtype
+    SCORE_CHUNK_CELLS = 4_000_000  # max (steps x alternatives) cells scored at once
+    UPCAST_BLOCK_CELLS = 65_536  # float32 matrix cells widened to float64 per block (cache sized)
+    PARETO_BLOCK_ROWS = 1024  # rows checked per block by the Pareto front prefilter
+    PARETO_MAX_COMPARISONS = 500_000_000  # prefilter gives up (scores everything) beyond this
+    PARETO_MIN_VECTORS = 200  # weight vectors per query that justify building the front
+    MONTE_CARLO_SAMPLES = 10_000  # random weight vectors of the Monte Carlo winner analysis
+    AHP_TOLERANCE = 1e-12  # power iteration stops when the eigenvector moves less than this
+    AHP_MAX_ITERATIONS = 1000
+    AHP_MAX_CR = 0.1  # consistency ratio above this is reported as inconsistent
+    IMPUTATION_METHOD = 'mean'  # missing cells: 'mean', 'median', 'worst' per column; None rejects them
+    FUZZY_DEFUZZIFICATION = 'centroid'  # 'centroid' (l + m + u) / 3 or 'graded' (l + 4m + u) / 6
+    WHAT_IF_MARGIN = 1e-6  # score lead the weight solver requires over every competitor
+    WHAT_IF_BATCH = 32  # competitors added to the weight solver's LP per round
+    WHAT_IF_TARGET_OPTIONS = 500  # best-ranked alternatives listed as weight solver targets
+    RANK_OVERLAP_K = 10  # top-k size of the ranking overlap metric
+    INVERSION_BLOCK_CELLS = 1_000_000  # rank cells merged at once when counting Kendall discordant pairs
+    WEIGHT_MAP_GRID = 200  # grid points per axis of the two-criteria stability map
+    PARALLEL_WORKERS = None  # None = one worker process per CPU
+    PARALLEL_MIN_CELLS = 200_000  # smaller matrices are swept in-process
+    RANKING_MODE = 'fast'  # 'fast' or 'tie_aware' (compensated sums for near-ties)
+    TIE_TOLERANCE = 1e-9  # scores closer than this are reported as ties
+    TIE_BREAK = 'criteria'  # 'criteria', 'name' or 'input'
     STABILITY_THRESHOLDS = {
         'very_stable': 80,
         'stable': 60,
         'moderate': 40
     }
     
+    # Instrumentation settings (SAW_METRICS=1 also enables metrics)
+    METRICS_ENABLED = False
+    METRICS_LAST_N = 50
+    
+    # Scoring service settings
+    SERVICE_HOST = '127.0.0.1'
+    SERVICE_PORT = 8765
+    SERVICE_WORKERS = None  # None = one worker process per CPU
+    SERVICE_INLINE_MAX_CELLS = 50_000  # smaller models are scored on the event loop
+    
     # Group members
     GROUP_MEMBERS = [
         "RAIHAN ALVIAN NURYANSYAH"
@@ -1,12 +1,17 @@
+import os
 import tkinter as tk
-from tkinter import ttk
+from tkinter import ttk, filedialog, messagebox
 from models.saw_model import SAWModel
 from views.input_tab import InputTabView
 from views.calculation_tab import CalculationTabView
 from views.results_tab import ResultsTabView
 from views.sensitivity_tab import SensitivityTabView
 from views.group_tab import GroupTabView
+from views.diagnostics_panel import DiagnosticsPanel
 from utils.validators import DataValidator
+from utils.project_store import ProjectStore, ProjectAutosaver
+from utils.decision_store import DecisionStore
+from utils.chart_renderer import ChartRenderer
 from config.settings import AppConfig
 
 
@@ -16,7 +21,9 @@ class SPKSAWController:
     def __init__(self, root):
         self.root = root
         self.model = SAWModel()
+        self.model.recorder = DecisionStore.from_config()
         self.validator = DataValidator()
+        self.chart_renderer = ChartRenderer()
         
         # Create main notebook
         self.notebook = ttk.Notebook(self.root)
@@ -30,6 +37,17 @@ class SPKSAWController:
         text=AppConfig.WINDOW_TITLE, 
         style='Title.TLabel')
         title_label.pack(pady=10, before=self.notebook)
+        
+        # Hidden diagnostics panel
+        self.diagnostics = DiagnosticsPanel(self.root)
+        self.root.bind_all('<Control-Shift-D>', self.diagnostics.toggle)
+        
+        # Project persistence
+        self.project_store = ProjectStore()
+        self.autosaver = ProjectAutosaver(self.root, self.model, self.project_store)
+        self.project_path = None
+        self.autosave_var = tk.BooleanVar(value=False)
+        self.root.protocol('WM_DELETE_WINDOW', self.on_close)
     
     def _create_views(self):
         """Create all tab views"""
@@ -54,13 +72,122 @@ class SPKSAWController:
         """Get the data validator"""
         return self.validator
     
+    def get_chart_renderer(self):
+        """Get the off-thread chart renderer"""
+        return self.chart_renderer
+    
     def update_sensitivity_criteria(self):
         """Update criteria options in sensitivity tab"""
-        self.sensitivity_view.update_criteria_options(self.model.criteria)
+        model = self.model
+        tree_nodes = model.criteria_tree.names if model.weight_method == 'tree' else None
+        self.sensitivity_view.update_criteria_options(model.criteria, tree_nodes)
     
     def refresh_all_views(self):
         """Refresh all views after data changes"""
         self.calculation_view.clear_results()
         self.results_view.clear_results()
         self.sensitivity_view.clear_results()
-        self.update_sensitivity_criteria()
\ No newline at end of file
+        self.update_sensitivity_criteria()
+    
+    def build_menu(self, menubar):
+        """Add the project menu to the menubar"""
+        project_menu = tk.Menu(menubar, tearoff=0)
+        project_menu.add_command(label="Buka Proyek...", command=self.open_project, 
+                                 accelerator="Ctrl+O")
+        project_menu.add_command(label="Simpan Proyek", command=self.save_project, 
+                                 accelerator="Ctrl+S")
+        project_menu.add_command(label="Simpan Proyek Sebagai...", command=self.save_project_as)
+        project_menu.add_separator()
+        project_menu.add_checkbutton(label="Simpan Otomatis", variable=self.autosave_var, 
+                                     command=self._toggle_autosave)
+        menubar.add_cascade(label="Proyek", menu=project_menu)
+        
+        self.root.bind_all('<Control-o>', lambda e: self.open_project())
+        self.root.bind_all('<Control-s>', lambda e: self.save_project())
+    
+    def _check_saved_data(self):
+        """Projects are saved from the model, so the input must have been saved first"""
+        if not self.model.decision_matrix or len(self.model.decision_matrix) != len(self.model.alternatives):
+            messagebox.showwarning("Peringatan", "Simpan data input terlebih dahulu!")
+            return False
+        return True
+    
+    def open_project(self):
+        """Load a project and repopulate all views"""
+        path = filedialog.askopenfilename(
+            title="Buka Proyek",
+            filetypes=[("Proyek SAW", ProjectStore.METADATA_FILE), ("Semua file", "*.*")])
+        if not path:
+            return
+        
+        try:
+            self.autosaver.stop()
+            self.project_store.load(path, self.model)
+            self.project_path = self.project_store.normalize_path(path)
+        except Exception as e:
+            messagebox.showerror("Error", f"Gagal membuka proyek: {str(e)}")
+            return
+        
+        self.input_view.load_from_model()
+        self.refresh_all_views()
+        self._update_title()
+        if self.autosave_var.get():
+            self.autosaver.start(self.project_path)
+    
+    def save_project(self):
+        """Save to the current project path (asks for one the first time)"""
+        if self.project_path is None:
+            self.save_project_as()
+            return
+        if not self._check_saved_data():
+            return
+        
+        try:
+            self.project_store.save(self.model, self.project_path)
+        except Exception as e:
+            messagebox.showerror("Error", f"Gagal menyimpan proyek: {str(e)}")
+    
+    def save_project_as(self):
+        """Ask for a project path and save everything there"""
+        if not self._check_saved_data():
+            return
+        
+        path = filedialog.asksaveasfilename(
+            title="Simpan Proyek",
+            defaultextension=AppConfig.PROJECT_EXTENSION,
+            filetypes=[("Proyek SAW", f"*{AppConfig.PROJECT_EXTENSION}")])
+        if not path:
+            return
+        
+        self.project_path = self.project_store.normalize_path(path)
+        self.save_project()
+        self._update_title()
+        if self.autosave_var.get():
+            self.autosaver.start(self.project_path)
+    
+    def _toggle_autosave(self):
+        """Start or stop background autosave for the current project"""
+        if not self.autosave_var.get():
+            self.autosaver.stop()
+            return
+        if self.project_path is None:
+            self.save_project_as()
+            if self.project_path is None:
+                self.autosave_var.set(False)
+            return
+        self.autosaver.start(self.project_path)
+    
+    def _update_title(self):
+        """Show the project name in the window title"""
+        title = AppConfig.WINDOW_TITLE
+        if self.project_path:
+            title += f" - {os.path.basename(self.project_path)}"
+        self.root.title(title)
+    
+    def on_close(self):
+        """Flush pending autosave work before closing"""
+        self.autosaver.shutdown(flush=True)
+        self.chart_renderer.shutdown()
+        if self.model.recorder is not None:
+            self.model.recorder.close()
+        self.root.destroy()
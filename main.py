@@ -20,9 +20,9 @@ def main():
     controller = SPKSAWController(root)
     
     menubar = tk.Menu(root)
+    controller.build_menu(menubar)
     root.config(menu=menubar)
     
-    
     root.mainloop()
 
 
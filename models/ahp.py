@@ -0,0 +1,106 @@
+import numpy as np
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+from config.settings import AppConfig
+
+
+# Saaty's random consistency index for n = 1..15
+RANDOM_INDEX = (0.0, 0.0, 0.58, 0.90, 1.12, 1.24, 1.32, 1.41, 1.45, 1.49,
+                1.51, 1.48, 1.56, 1.57, 1.59)
+
+
+def random_index(n: int) -> float:
+    """Random consistency index; beyond Saaty's table the Alonso-Lamata fit is used"""
+    if n <= len(RANDOM_INDEX):
+        return RANDOM_INDEX[n - 1]
+    # Mean lambda_max of random matrices, lambda = 2.7699 n - 4.3513 (Alonso & Lamata, 2006)
+    return (1.7699 * n - 4.3513) / (n - 1)
+
+
+class AHPWeights:
+    """Pairwise comparison matrix of the criteria with its principal eigenvector"""
+
+    CACHE_SIZE = 32  # eigenvectors kept for recently seen matrices (undo, back and forth)
+
+    def __init__(self, n: int, matrix: Optional[np.ndarray] = None):
+        self.matrix = np.ones((n, n)) if matrix is None else np.array(matrix, dtype=float)
+        if self.matrix.shape != (n, n):
+            raise ValueError("Pairwise matrix must be (criteria x criteria)")
+        self._vector = np.full(n, 1.0 / n) if n else np.empty(0)  # warm start of the power iteration
+        self._cache: "OrderedDict[bytes, Tuple[np.ndarray, float]]" = OrderedDict()
+
+    def __len__(self):
+        return len(self.matrix)
+
+    def set_comparison(self, i: int, j: int, value: float):
+        """How much more important criteria i is than j (Saaty scale 1/9..9)"""
+        if value <= 0:
+            raise ValueError("Comparison must be positive")
+        if i == j:
+            return
+        self.matrix[i, j] = value
+        self.matrix[j, i] = 1.0 / value
+
+    def insert(self, index: int, comparisons: Optional[Tuple[np.ndarray, np.ndarray]] = None):
+        """Add a criteria that is (until compared) as important as every other one
+
+        comparisons is the (row, column) pair returned by remove() and restores them.
+        """
+        self.matrix = np.insert(np.insert(self.matrix, index, 1.0, axis=0), index, 1.0, axis=1)
+        if comparisons is not None:
+            self.matrix[index, :], self.matrix[:, index] = comparisons
+        self._vector = np.insert(self._vector, index, self._vector.mean() if len(self._vector) else 1.0)
+        self._vector /= self._vector.sum()
+
+    def remove(self, index: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Drop a criteria and return its comparisons as a (row, column) pair"""
+        comparisons = (self.matrix[index, :].copy(), self.matrix[:, index].copy())
+        self.matrix = np.delete(np.delete(self.matrix, index, axis=0), index, axis=1)
+        self._vector = np.delete(self._vector, index)
+        if len(self._vector):
+            self._vector /= self._vector.sum()
+        return comparisons
+
+    def _eigen(self) -> Tuple[np.ndarray, float]:
+        """Principal eigenvector (summing to one) and eigenvalue, cached per matrix"""
+        key = self.matrix.tobytes()
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self._vector = cached[0]
+            return cached
+
+        # Power iteration, warm-started from the previous matrix's eigenvector:
+        # after a single changed comparison it converges in a few steps
+        vector = self._vector
+        for _ in range(AppConfig.AHP_MAX_ITERATIONS):
+            product = self.matrix @ vector
+            new_vector = product / product.sum()
+            converged = np.abs(new_vector - vector).max() < AppConfig.AHP_TOLERANCE
+            vector = new_vector
+            if converged:
+                break
+        eigenvalue = float((self.matrix @ vector / vector).mean())
+
+        self._vector = vector
+        self._cache[key] = (vector, eigenvalue)
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return vector, eigenvalue
+
+    def weights(self) -> np.ndarray:
+        """Criteria weights (summing to one)"""
+        if not len(self):
+            return np.empty(0)
+        return self._eigen()[0]
+
+    def consistency(self) -> Dict[str, Any]:
+        """Eigenvalue, consistency index and ratio; CR <= AHP_MAX_CR is acceptable"""
+        n = len(self)
+        if n < 3:
+            return {'lambda_max': float(n), 'ci': 0.0, 'cr': 0.0, 'consistent': True}
+        _, eigenvalue = self._eigen()
+        ci = (eigenvalue - n) / (n - 1)
+        cr = ci / random_index(n)
+        return {'lambda_max': eigenvalue, 'ci': ci, 'cr': cr, 'consistent': cr <= AppConfig.AHP_MAX_CR}
@@ -0,0 +1,111 @@
+import numpy as np
+from typing import List, Tuple, Dict, Any, Optional, Sequence
+
+
+class BatchSAWModel:
+    """Vectorized SAW for many small decision problems scored in one pass"""
+
+    @staticmethod
+    def pack_problems(problems: Sequence[Tuple[Sequence[Sequence[float]], Sequence[float], Sequence[str]]]
+                      ) -> Dict[str, np.ndarray]:
+        """Pad a list of (decision_matrix, weights, criteria_types) into batch arrays"""
+        if not problems:
+            raise ValueError("No problems to pack")
+
+        n_problems = len(problems)
+        max_alternatives = max(len(matrix) for matrix, _, _ in problems)
+        max_criteria = max(len(weights) for _, weights, _ in problems)
+
+        matrices = np.zeros((n_problems, max_alternatives, max_criteria))
+        weights = np.zeros((n_problems, max_criteria))
+        is_benefit = np.ones((n_problems, max_criteria), dtype=bool)
+        alternative_mask = np.zeros((n_problems, max_alternatives), dtype=bool)
+        criteria_mask = np.zeros((n_problems, max_criteria), dtype=bool)
+
+        for p, (matrix, problem_weights, criteria_types) in enumerate(problems):
+            matrix = np.asarray(matrix, dtype=float)
+            n_alt, n_crit = matrix.shape
+            if len(problem_weights) != n_crit or len(criteria_types) != n_crit:
+                raise ValueError(f"Problem {p}: weights and criteria types must match the matrix columns")
+            if any(t not in ('benefit', 'cost') for t in criteria_types):
+                raise ValueError(f"Problem {p}: criteria types must be 'benefit' or 'cost'")
+            matrices[p, :n_alt, :n_crit] = matrix
+            weights[p, :n_crit] = problem_weights
+            is_benefit[p, :n_crit] = [t == 'benefit' for t in criteria_types]
+            alternative_mask[p, :n_alt] = True
+            criteria_mask[p, :n_crit] = True
+
+        return {
+            'matrices': matrices,
+            'weights': weights,
+            'is_benefit': is_benefit,
+            'alternative_mask': alternative_mask,
+            'criteria_mask': criteria_mask
+        }
+
+    @staticmethod
+    def normalize(matrices: np.ndarray, is_benefit: np.ndarray,
+                  alternative_mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """Normalize a (problems x alternatives x criteria) stack, ignoring padded rows"""
+        matrices = np.asarray(matrices, dtype=float)
+        is_benefit = np.broadcast_to(np.asarray(is_benefit, dtype=bool),
+                                     (matrices.shape[0], matrices.shape[2]))
+
+        if alternative_mask is None:
+            max_vals = matrices.max(axis=1)
+            min_vals = matrices.min(axis=1)
+        else:
+            valid_rows = np.asarray(alternative_mask, dtype=bool)[:, :, None]
+            max_vals = np.where(valid_rows, matrices, -np.inf).max(axis=1)
+            min_vals = np.where(valid_rows, matrices, np.inf).min(axis=1)
+
+        # Same rules as SAWModel.normalize_array, per problem
+        with np.errstate(divide='ignore', invalid='ignore'):
+            normalized = np.where(is_benefit[:, None, :],
+                                  matrices / max_vals[:, None, :],
+                                  min_vals[:, None, :] / matrices)
+        valid = np.where(is_benefit, max_vals > 0, min_vals > 0)
+        normalized = np.where(valid[:, None, :], normalized, 0.0)
+        if alternative_mask is not None:
+            normalized = np.where(valid_rows, normalized, 0.0)
+        return normalized
+
+    @classmethod
+    def score(cls, matrices: np.ndarray, weights: np.ndarray, is_benefit: np.ndarray,
+              alternative_mask: Optional[np.ndarray] = None,
+              criteria_mask: Optional[np.ndarray] = None,
+              rank: bool = False) -> Dict[str, Any]:
+        """Normalize and score every problem; padded alternatives get -inf"""
+        matrices = np.asarray(matrices, dtype=float)
+        if matrices.ndim != 3:
+            raise ValueError("Batch matrices must be (problems x alternatives x criteria)")
+
+        weights = np.broadcast_to(np.asarray(weights, dtype=float),
+                                  (matrices.shape[0], matrices.shape[2]))
+        if criteria_mask is not None:
+            weights = np.where(criteria_mask, weights, 0.0)
+
+        # Normalize weights per problem like SAWModel.set_data
+        totals = weights.sum(axis=1, keepdims=True)
+        weights = np.divide(weights, totals, out=np.array(weights, dtype=float), where=totals > 0)
+
+        normalized = cls.normalize(matrices, is_benefit, alternative_mask)
+        scores = np.einsum('pac,pc->pa', normalized, weights)
+        if alternative_mask is not None:
+            scores = np.where(alternative_mask, scores, -np.inf)
+
+        result = {
+            'scores': scores,
+            'winners': np.argmax(scores, axis=1),
+            'weights': weights
+        }
+        if rank:
+            result['rankings'] = np.argsort(-scores, axis=1, kind='stable')
+        return result
+
+    @classmethod
+    def score_problems(cls, problems: Sequence[Tuple[Sequence[Sequence[float]], Sequence[float], Sequence[str]]]
+                       ) -> List[int]:
+        """Convenience wrapper: winner index of each (matrix, weights, types) problem"""
+        packed = cls.pack_problems(problems)
+        return cls.score(**packed)['winners'].tolist()
@@ -0,0 +1,184 @@
+import numpy as np
+from typing import List, Dict, Any, Optional
+
+
+class CriteriaTree:
+    """Hierarchy of criteria categories with local weights
+
+    Leaves are the model's criteria. compile() lays the leaves out in depth-first
+    order so every node covers a contiguous leaf range; global weights and
+    per-node partial scores then come from one cumulative sum (segment sums).
+    """
+
+    def __init__(self):
+        self.names: List[str] = []
+        self.parents: List[int] = []  # -1 for top-level nodes
+        self.local_weights: List[float] = []
+        self.version = 0
+        self._compiled = None  # (criteria, version, layout)
+        self._partials = None  # (normalized matrix, criteria, version, partial scores)
+
+    def __len__(self):
+        return len(self.names)
+
+    def add_node(self, name: str, local_weight: float, parent: Optional[int] = None) -> int:
+        """Add a category or criteria node and return its id; leaves are matched to criteria by name"""
+        if parent is not None and not 0 <= parent < len(self.names):
+            raise ValueError(f"Unknown parent node: {parent}")
+        self.names.append(name)
+        self.parents.append(-1 if parent is None else parent)
+        self.local_weights.append(float(local_weight))
+        self.version += 1
+        return len(self.names) - 1
+
+    def set_local_weight(self, node: int, weight: float):
+        """Change the weight of a node relative to its siblings"""
+        self.local_weights[node] = float(weight)
+        self.version += 1
+
+    def node(self, name: str) -> int:
+        """Id of the node with the given name"""
+        return self.names.index(name)
+
+    @classmethod
+    def from_nested(cls, spec: Dict[str, Any]) -> 'CriteriaTree':
+        """Build from {'Biaya': {'weight': 0.4, 'children': {'Harga': 0.7, ...}}, 'Kualitas': 0.6}"""
+        tree = cls()
+
+        def add(items, parent):
+            for name, value in items.items():
+                if isinstance(value, dict):
+                    node = tree.add_node(name, value.get('weight', 1.0), parent)
+                    add(value.get('children', {}), node)
+                else:
+                    tree.add_node(name, value, parent)
+
+        add(spec, None)
+        return tree
+
+    # --- Layout --------------------------------------------------------------------
+
+    def compile(self, criteria: List[str]) -> Dict[str, np.ndarray]:
+        """Flatten the tree against the model's criteria (cached until the tree changes)"""
+        if self._compiled is not None and self._compiled[0] == criteria and self._compiled[1] == self.version:
+            return self._compiled[2]
+
+        n_nodes = len(self.names)
+        children: List[List[int]] = [[] for _ in range(n_nodes)]
+        roots = []
+        for node, parent in enumerate(self.parents):
+            (roots if parent < 0 else children[parent]).append(node)
+
+        # Local weights are normalized among siblings
+        local = np.asarray(self.local_weights, dtype=float)
+        for siblings in [roots] + children:
+            total = local[siblings].sum() if siblings else 0.0
+            if siblings and total > 0:
+                local[siblings] /= total
+
+        criteria_index = {name: j for j, name in enumerate(criteria)}
+        global_weights = np.zeros(n_nodes)
+        depth = np.zeros(n_nodes, dtype=int)
+        start = np.zeros(n_nodes, dtype=int)
+        end = np.zeros(n_nodes, dtype=int)
+        leaf_order: List[int] = []  # criteria index of every leaf, depth-first
+        leaf_nodes: List[int] = []
+        order: List[int] = []  # depth-first node order, for display
+
+        stack = [(node, 1.0, 0, False) for node in reversed(roots)]
+        while stack:
+            node, parent_weight, node_depth, closing = stack.pop()
+            if closing:
+                end[node] = len(leaf_order)
+                continue
+            global_weights[node] = parent_weight * local[node]
+            depth[node] = node_depth
+            start[node] = len(leaf_order)
+            order.append(node)
+            if children[node]:
+                stack.append((node, parent_weight, node_depth, True))
+                stack.extend((child, global_weights[node], node_depth + 1, False)
+                             for child in reversed(children[node]))
+            else:
+                if self.names[node] not in criteria_index:
+                    raise ValueError(f"Tree leaf '{self.names[node]}' is not a criteria")
+                leaf_order.append(criteria_index[self.names[node]])
+                leaf_nodes.append(node)
+                end[node] = len(leaf_order)
+
+        if sorted(leaf_order) != list(range(len(criteria))):
+            raise ValueError("Every criteria must appear exactly once as a tree leaf")
+
+        layout = {
+            'leaf_order': np.asarray(leaf_order, dtype=np.intp),
+            'leaf_nodes': np.asarray(leaf_nodes, dtype=np.intp),
+            'local_weights': local,
+            'global_weights': global_weights,
+            'parents': np.asarray(self.parents, dtype=np.intp),
+            'depth': depth,
+            'start': start,
+            'end': end,
+            'order': np.asarray(order, dtype=np.intp),
+            'roots': np.asarray(roots, dtype=np.intp)
+        }
+        self._compiled = (list(criteria), self.version, layout)
+        return layout
+
+    def criteria_weights(self, criteria: List[str]) -> np.ndarray:
+        """Global weight of every criteria, in the model's criteria order"""
+        layout = self.compile(criteria)
+        weights = np.zeros(len(criteria))
+        weights[layout['leaf_order']] = layout['global_weights'][layout['leaf_nodes']]
+        return weights
+
+    def local_weight(self, criteria: List[str], node: int) -> float:
+        """Weight of a node relative to its siblings (normalized)"""
+        return float(self.compile(criteria)['local_weights'][node])
+
+    # --- Roll-up -------------------------------------------------------------------
+
+    def partial_scores(self, normalized_matrix: np.ndarray, criteria: List[str]) -> np.ndarray:
+        """(alternatives x nodes) weighted score of every node's subtree (cached)"""
+        cached = self._partials
+        if cached is not None and cached[0] is normalized_matrix and cached[1] == criteria \
+                and cached[2] == self.version:
+            return cached[3]
+
+        layout = self.compile(criteria)
+        weights = self.criteria_weights(criteria)
+        leaf_order = layout['leaf_order']
+        contributions = np.asarray(normalized_matrix, dtype=np.float64)[:, leaf_order] * weights[leaf_order]
+        # Segment sums over the depth-first leaf layout
+        cumulative = np.zeros((len(contributions), len(leaf_order) + 1))
+        np.cumsum(contributions, axis=1, out=cumulative[:, 1:])
+        partials = cumulative[:, layout['end']] - cumulative[:, layout['start']]
+
+        self._partials = (normalized_matrix, list(criteria), self.version, partials)
+        return partials
+
+    def sensitivity_scores(self, normalized_matrix: np.ndarray, criteria: List[str], node: int,
+                           new_weights: np.ndarray) -> np.ndarray:
+        """(steps x alternatives) scores with the node's local weight set to each new weight
+
+        The node's subtree scales by new / old and its siblings by
+        (1 - new) / (1 - old), so the scores are a (steps x 3) @ (3 x alternatives)
+        product over cached partial scores instead of the matrix.
+        """
+        layout = self.compile(criteria)
+        partials = self.partial_scores(normalized_matrix, criteria)
+        old_weight = layout['local_weights'][node]
+        if old_weight >= 1:
+            raise ValueError("Node has no siblings to shift weight to")
+        if old_weight <= 0:
+            raise ValueError("Node has zero weight; its subtree cannot be scaled")
+
+        parent = layout['parents'][node]
+        total = partials[:, layout['roots']].sum(axis=1)
+        parent_scores = total if parent < 0 else partials[:, parent]
+        node_scores = partials[:, node]
+        basis = np.stack([total - parent_scores, node_scores, parent_scores - node_scores])
+
+        new_weights = np.asarray(new_weights, dtype=float)
+        factors = np.stack([np.ones_like(new_weights), new_weights / old_weight,
+                            (1 - new_weights) / (1 - old_weight)], axis=1)
+        return factors @ basis
@@ -0,0 +1,164 @@
+import numpy as np
+from typing import List, Optional, Tuple, Union
+
+from config.settings import AppConfig
+from models.intervals import is_interval, parse_interval
+
+
+# Linguistic ratings as triangular fuzzy numbers (l, m, u) on the 1..9 scale
+LINGUISTIC_SCALE = {
+    'sangat rendah': (1.0, 1.0, 3.0),
+    'rendah': (1.0, 3.0, 5.0),
+    'sedang': (3.0, 5.0, 7.0),
+    'tinggi': (5.0, 7.0, 9.0),
+    'sangat tinggi': (7.0, 9.0, 9.0)
+}
+LINGUISTIC_ABBREVIATIONS = {'sr': 'sangat rendah', 'r': 'rendah', 's': 'sedang',
+                            't': 'tinggi', 'st': 'sangat tinggi'}
+
+# Defuzzification as fixed (l, m, u) coefficients: both rules are linear, so the
+# defuzzified score of crisp weights equals defuzzified matrix @ weights
+DEFUZZIFICATION = {
+    'centroid': (1 / 3, 1 / 3, 1 / 3),
+    'graded': (1 / 6, 4 / 6, 1 / 6)
+}
+
+Cell = Union[None, float, Tuple[float, float, float]]
+
+
+def is_triangular(value) -> bool:
+    """True for an (l, m, u) cell or weight"""
+    return isinstance(value, (tuple, list, np.ndarray)) and len(value) == 3
+
+
+def triangular(value) -> Tuple[float, float, float]:
+    """(l, m, u) of a cell: crisp numbers become (x, x, x), intervals (low, mid, high), missing cells NaN"""
+    if value is None:
+        return (np.nan, np.nan, np.nan)
+    if is_interval(value):
+        low, high = (float(v) for v in value)
+        value = (low, (low + high) / 2, high)
+    if not is_triangular(value):
+        value = float(value)
+        return (value, value, value)
+    lower, middle, upper = (float(v) for v in value)
+    if np.isnan((lower, middle, upper)).any():
+        return (np.nan, np.nan, np.nan)
+    if not lower <= middle <= upper:
+        raise ValueError("Triangular fuzzy number needs l <= m <= u")
+    return (lower, middle, upper)
+
+
+def cell_value(triple) -> Cell:
+    """Inverse of triangular(): None, a crisp number or an (l, m, u) tuple"""
+    lower, middle, upper = (float(v) for v in triple)
+    if middle != middle:
+        return None
+    if lower == middle == upper:
+        return middle
+    return (lower, middle, upper)
+
+
+def crisp_value(value: Cell) -> Optional[float]:
+    """Defuzzified value of a cell; intervals give their midpoint, crisp cells and None pass through"""
+    if is_interval(value):
+        return float(sum(value)) / 2
+    if value is None or not is_triangular(value):
+        return value
+    return float(defuzzify(triangular(value)))
+
+
+def format_cell(value: Cell) -> str:
+    """Text of a cell in the input grid: '5', '3;5;7' or '3-7'"""
+    if value is None:
+        return ""
+    if is_triangular(value):
+        return ";".join(f"{v:g}" for v in value)
+    if is_interval(value):
+        return "-".join(f"{v:g}" for v in value)
+    return f"{value:g}"
+
+
+def parse_cell(text: str) -> Cell:
+    """Parse '5', '3;5;7', an interval '3-7' or a linguistic rating such as 'Tinggi' / 'T'"""
+    text = text.strip()
+    bounds = parse_interval(text)
+    if bounds is not None:
+        return triangular(bounds)
+    label = LINGUISTIC_ABBREVIATIONS.get(text.lower(), text.lower())
+    if label in LINGUISTIC_SCALE:
+        return LINGUISTIC_SCALE[label]
+    if ';' in text:
+        parts = text.split(';')
+        if len(parts) != 3:
+            raise ValueError("Format fuzzy: l;m;u")
+        return triangular([float(part) for part in parts])
+    return float(text)
+
+
+def defuzzify(fuzzy: np.ndarray, method: Optional[str] = None) -> np.ndarray:
+    """Crisp value of every (l, m, u) along the last axis"""
+    fuzzy = np.asarray(fuzzy)
+    coefficients = np.asarray(DEFUZZIFICATION[method or AppConfig.FUZZY_DEFUZZIFICATION],
+                              dtype=fuzzy.dtype if fuzzy.dtype == np.float32 else np.float64)
+    return fuzzy @ coefficients
+
+
+def normalize_fuzzy(matrix: np.ndarray, criteria_types: List[str], dtype=np.float64) -> np.ndarray:
+    """Normalize an (alternatives x criteria x 3) matrix column-wise
+
+    Benefit: (l / u*, m / u*, u / u*) with u* the column's largest upper bound.
+    Cost: (l- / u, l- / m, l- / l) with l- the column's smallest lower bound.
+    Crisp cells (x, x, x) normalize exactly like SAWModel.normalize_array.
+    """
+    matrix = np.asarray(matrix, dtype=dtype)
+    is_benefit = np.array([t == 'benefit' for t in criteria_types], dtype=bool)
+
+    upper_max = matrix.max(axis=0)[:, 2]
+    lower_min = matrix.min(axis=0)[:, 0]
+    # One select and one in-place scale: benefit cells are x * (1 / u*), cost
+    # cells l- * (1 / x) with the components reversed
+    with np.errstate(divide='ignore', invalid='ignore'):
+        scale = np.where(is_benefit, 1 / upper_max, lower_min)
+        normalized = np.where(is_benefit[:, None], matrix, np.reciprocal(matrix)[:, :, ::-1])
+        normalized *= scale[:, None]
+
+    # Columns without a positive extreme value stay zero
+    valid = np.where(is_benefit, upper_max > 0, lower_min > 0)
+    if not valid.all():
+        normalized[:, ~valid] = 0.0
+    return normalized
+
+
+def normalize_fuzzy_weights(weights: np.ndarray) -> np.ndarray:
+    """Scale (criteria x 3) weights so the middle values sum to one"""
+    weights = np.asarray(weights, dtype=float)
+    total = weights[:, 1].sum()
+    return weights / total if total > 0 else weights
+
+
+def score_weights(weights: np.ndarray, method: Optional[str] = None) -> np.ndarray:
+    """Flat (criteria * 3) weights w_ck * d_k: defuzzified scores are one matrix-vector
+    product over the (alternatives x criteria * 3) view of the normalized matrix"""
+    coefficients = np.asarray(DEFUZZIFICATION[method or AppConfig.FUZZY_DEFUZZIFICATION])
+    return (np.asarray(weights, dtype=float) * coefficients).reshape(-1)
+
+
+def fuzzy_scores(normalized: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """(alternatives x 3) fuzzy scores sum_j r_ij (x) w_j, accumulated in float64"""
+    n_alternatives, n_criteria, _ = normalized.shape
+    weights = np.asarray(weights, dtype=float)
+    # Block weights: column k of the (criteria * 3 x 3) matrix picks component k
+    block = np.zeros((n_criteria, 3, 3))
+    for k in range(3):
+        block[:, k, k] = weights[:, k]
+    block = block.reshape(-1, 3)
+
+    flat = normalized.reshape(n_alternatives, -1)
+    if flat.dtype == np.float64:
+        return flat @ block
+    rows = max(1, AppConfig.UPCAST_BLOCK_CELLS // max(1, flat.shape[1]))
+    scores = np.empty((n_alternatives, 3))
+    for start in range(0, n_alternatives, rows):
+        scores[start:start + rows] = flat[start:start + rows].astype(np.float64) @ block
+    return scores
@@ -0,0 +1,163 @@
+import numpy as np
+from typing import List, Dict, Any, Optional, Sequence
+
+from config.settings import AppConfig
+from models.batch_model import BatchSAWModel
+from models.saw_model import SAWModel
+from utils.instrumentation import timed
+
+
+class GroupSAWModel:
+    """SAW for a committee: many evaluators scoring the same alternatives and criteria"""
+
+    METHODS = ('arithmetic', 'geometric', 'borda', 'copeland')
+
+    def __init__(self, alternatives: List[str], criteria: List[str], criteria_types: List[str],
+                 matrices, weights, evaluators: Optional[List[str]] = None,
+                 evaluator_weights: Optional[Sequence[float]] = None):
+        matrices = np.asarray(matrices, dtype=float)
+        weights = np.asarray(weights, dtype=float)
+        if matrices.ndim != 3:
+            raise ValueError("Group matrices must be (evaluators x alternatives x criteria)")
+        n_evaluators, n_alternatives, n_criteria = matrices.shape
+        if n_alternatives != len(alternatives) or n_criteria != len(criteria):
+            raise ValueError("Matrix shape does not match alternatives and criteria")
+        if weights.ndim == 1:
+            weights = np.broadcast_to(weights, (n_evaluators, n_criteria))
+        if weights.shape != (n_evaluators, n_criteria):
+            raise ValueError("Weights must be (evaluators x criteria)")
+
+        self.alternatives = list(alternatives)
+        self.criteria = list(criteria)
+        self.criteria_types = list(criteria_types)
+        self.matrices = matrices
+        self.evaluators = list(evaluators) if evaluators else [f"E{e + 1}" for e in range(n_evaluators)]
+
+        # Every evaluator's weights sum to one, like SAWModel.set_data
+        totals = weights.sum(axis=1, keepdims=True)
+        self.weights = np.divide(weights, totals, out=np.array(weights), where=totals > 0)
+
+        importance = np.ones(n_evaluators) if evaluator_weights is None else \
+            np.asarray(evaluator_weights, dtype=float)
+        self.evaluator_weights = importance / importance.sum()
+
+    @property
+    def is_benefit(self) -> np.ndarray:
+        return np.array([t == 'benefit' for t in self.criteria_types], dtype=bool)
+
+    def evaluator_scores(self) -> np.ndarray:
+        """(evaluators x alternatives) SAW scores, all evaluators in one batch"""
+        return BatchSAWModel.score(self.matrices, self.weights, self.is_benefit)['scores']
+
+    # --- Input-level aggregation ---------------------------------------------------
+
+    def aggregate_inputs(self, method: str = 'arithmetic'):
+        """Consensus decision matrix and weights (weighted arithmetic or geometric mean)"""
+        importance = self.evaluator_weights
+        if method == 'arithmetic':
+            matrix = np.einsum('e,eac->ac', importance, self.matrices)
+            weights = importance @ self.weights
+        elif method == 'geometric':
+            with np.errstate(divide='ignore'):
+                matrix = np.exp(np.einsum('e,eac->ac', importance, np.log(self.matrices)))
+                weights = np.exp(importance @ np.log(self.weights))
+        else:
+            raise ValueError(f"Unknown input aggregation: {method}")
+        return matrix, weights / weights.sum()
+
+    def consensus_model(self, method: str = 'arithmetic') -> SAWModel:
+        """SAWModel loaded with the aggregated matrix and weights (for the regular tabs)"""
+        matrix, weights = self.aggregate_inputs(method)
+        model = SAWModel()
+        model.set_data(self.alternatives, self.criteria, weights.tolist(), matrix.tolist(),
+                       self.criteria_types)
+        return model
+
+    # --- Score-level aggregation ---------------------------------------------------
+
+    @staticmethod
+    def rank_positions(scores: np.ndarray) -> np.ndarray:
+        """0-based rank position of every alternative per evaluator (0 = best)"""
+        order = np.argsort(-scores, axis=1, kind='stable')
+        positions = np.empty_like(order)
+        np.put_along_axis(positions, order, np.arange(scores.shape[1])[None, :], axis=1)
+        return positions
+
+    def borda(self, positions: np.ndarray) -> np.ndarray:
+        """Importance-weighted Borda points: n - 1 for a first place down to 0"""
+        return self.evaluator_weights @ (positions.shape[1] - 1 - positions)
+
+    def copeland(self, positions: np.ndarray) -> np.ndarray:
+        """Pairwise majority wins minus losses of every alternative"""
+        n_evaluators, n_alternatives = positions.shape
+        copeland = np.zeros(n_alternatives)
+        # Rankings are strict, so i beats j when evaluators with more than half of
+        # the importance place i above j
+        chunk = max(1, AppConfig.SCORE_CHUNK_CELLS // max(1, n_evaluators * n_alternatives))
+        for start in range(0, n_alternatives, chunk):
+            rows = np.arange(start, min(start + chunk, n_alternatives))
+            above = positions[:, rows, None] < positions[:, None, :]
+            margin = 2 * np.einsum('e,eij->ij', self.evaluator_weights, above) - 1
+            margin[np.arange(len(rows)), rows] = 0.0
+            copeland[rows] = np.sign(margin.round(12)).sum(axis=1)
+        return copeland
+
+    # --- Dispersion ------------------------------------------------------------------
+
+    @staticmethod
+    def dispersion(scores: np.ndarray, positions: np.ndarray,
+                   consensus_positions: np.ndarray) -> Dict[str, Any]:
+        """How far the evaluators are from each other and from the consensus"""
+        n_evaluators, n_alternatives = positions.shape
+        # Kendall's W: 1 = all evaluators rank identically, 0 = no agreement
+        rank_sums = positions.sum(axis=0)
+        spread = ((rank_sums - rank_sums.mean()) ** 2).sum()
+        denominator = n_evaluators ** 2 * (n_alternatives ** 3 - n_alternatives)
+        kendall_w = 12 * spread / denominator if denominator else 1.0
+
+        # Spearman correlation of every evaluator with the consensus ranking
+        squared = ((positions - consensus_positions[None, :]) ** 2).sum(axis=1)
+        if n_alternatives > 1:
+            agreement = 1 - 6 * squared / (n_alternatives * (n_alternatives ** 2 - 1))
+        else:
+            agreement = np.ones(n_evaluators)
+
+        return {
+            'kendall_w': float(kendall_w),
+            'score_std': scores.std(axis=0),
+            'evaluator_agreement': agreement
+        }
+
+    # --- Entry point -----------------------------------------------------------------
+
+    @timed('group.calculate')
+    def calculate(self, method: str = 'arithmetic') -> Dict[str, Any]:
+        """Per-evaluator rankings, the consensus ranking and dispersion in one pass"""
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown aggregation method: {method}")
+
+        scores = self.evaluator_scores()
+        positions = self.rank_positions(scores)
+        mean_scores = self.evaluator_weights @ scores
+
+        if method in ('arithmetic', 'geometric'):
+            consensus = self.consensus_model(method).score_vector()
+            consensus_order = np.argsort(-consensus, kind='stable')
+        else:
+            consensus = self.borda(positions) if method == 'borda' else self.copeland(positions)
+            # Equal points are broken by the mean evaluator score
+            consensus_order = np.lexsort((-mean_scores, -consensus))
+
+        consensus_positions = np.empty(len(self.alternatives), dtype=np.intp)
+        consensus_positions[consensus_order] = np.arange(len(self.alternatives))
+
+        return {
+            'method': method,
+            'evaluators': self.evaluators,
+            'evaluator_scores': scores,
+            'evaluator_rankings': np.argsort(positions, axis=1),
+            'mean_scores': mean_scores,
+            'consensus_scores': consensus,
+            'consensus_ranking': [(self.alternatives[i], consensus[i]) for i in consensus_order],
+            'dispersion': self.dispersion(scores, positions, consensus_positions)
+        }
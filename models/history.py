@@ -0,0 +1,162 @@
+from collections import deque
+from typing import List, Optional
+
+from config.settings import AppConfig
+
+
+# --- Edit commands ---------------------------------------------------------------
+# Each command stores only its delta (one cell, row or column), so history memory
+# grows with the edits rather than with the matrix size.
+
+class EditCommand:
+    """Base class of undoable model edits"""
+
+    __slots__ = ()
+    structural = False  # True when alternatives or criteria are inserted / removed
+
+    def apply(self, model):
+        raise NotImplementedError
+
+    def revert(self, model):
+        raise NotImplementedError
+
+
+class AddAlternative(EditCommand):
+    __slots__ = ('name', 'row', 'index', 'linked')
+    structural = True
+
+    def __init__(self, name: str, row: Optional[List[Optional[float]]] = None,
+                 index: Optional[int] = None):
+        self.name = name
+        self.row = row
+        self.index = index
+        self.linked = None
+
+    def apply(self, model):
+        self.index = model.add_alternative(self.name, self.row, self.index, self.linked)
+
+    def revert(self, model):
+        _, self.row, self.linked = model.remove_alternative(self.index)
+
+
+class RemoveAlternative(EditCommand):
+    __slots__ = ('index', 'name', 'row', 'linked')
+    structural = True
+
+    def __init__(self, index: int):
+        self.index = index
+        self.name = None
+        self.row = None
+        self.linked = None
+
+    def apply(self, model):
+        self.name, self.row, self.linked = model.remove_alternative(self.index)
+
+    def revert(self, model):
+        model.add_alternative(self.name, self.row, self.index, self.linked)
+
+
+class AddCriterion(EditCommand):
+    __slots__ = ('name', 'weight', 'criteria_type', 'column', 'index', 'linked')
+    structural = True
+
+    def __init__(self, name: str, weight: float, criteria_type: str,
+                 column: Optional[List[Optional[float]]] = None, index: Optional[int] = None):
+        self.name = name
+        self.weight = weight
+        self.criteria_type = criteria_type
+        self.column = column
+        self.index = index
+        self.linked = None
+
+    def apply(self, model):
+        self.index = model.add_criterion(self.name, self.weight, self.criteria_type,
+                                         self.column, self.index, self.linked)
+
+    def revert(self, model):
+        _, _, _, self.column, self.linked = model.remove_criterion(self.index)
+
+
+class RemoveCriterion(EditCommand):
+    __slots__ = ('index', 'name', 'weight', 'criteria_type', 'column', 'linked')
+    structural = True
+
+    def __init__(self, index: int):
+        self.index = index
+        self.name = None
+        self.weight = None
+        self.criteria_type = None
+        self.column = None
+        self.linked = None
+
+    def apply(self, model):
+        (self.name, self.weight, self.criteria_type,
+         self.column, self.linked) = model.remove_criterion(self.index)
+
+    def revert(self, model):
+        model.add_criterion(self.name, self.weight, self.criteria_type, self.column, self.index, self.linked)
+
+
+class SetValue(EditCommand):
+    __slots__ = ('row', 'column', 'value', 'old_value')
+
+    def __init__(self, row: int, column: int, value: Optional[float]):
+        self.row = row
+        self.column = column
+        self.value = value
+        self.old_value = None
+
+    def apply(self, model):
+        self.old_value = model.set_value(self.row, self.column, self.value)
+
+    def revert(self, model):
+        model.set_value(self.row, self.column, self.old_value)
+
+
+# --- History ---------------------------------------------------------------------
+
+class EditHistory:
+    """Bounded undo / redo stacks of edit commands"""
+
+    def __init__(self, model, limit: int = AppConfig.HISTORY_LIMIT):
+        self.model = model
+        self.undo_stack = deque(maxlen=limit)
+        self.redo_stack = deque(maxlen=limit)
+
+    def execute(self, command: EditCommand) -> EditCommand:
+        """Apply a command and make it undoable"""
+        command.apply(self.model)
+        self.undo_stack.append(command)
+        self.redo_stack.clear()
+        return command
+
+    def undo(self) -> Optional[EditCommand]:
+        """Revert the last command; returns it (or None when there is nothing to undo)"""
+        if not self.undo_stack:
+            return None
+        command = self.undo_stack.pop()
+        command.revert(self.model)
+        self.redo_stack.append(command)
+        return command
+
+    def redo(self) -> Optional[EditCommand]:
+        """Re-apply the last undone command"""
+        if not self.redo_stack:
+            return None
+        command = self.redo_stack.pop()
+        command.apply(self.model)
+        self.undo_stack.append(command)
+        return command
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self.undo_stack)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self.redo_stack)
+
+    def clear(self):
+        """Forget all history"""
+        self.undo_stack.clear()
+        self.redo_stack.clear()
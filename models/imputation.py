@@ -0,0 +1,48 @@
+import warnings
+import numpy as np
+from typing import List, Optional
+
+from config.settings import AppConfig
+
+
+METHODS = ('mean', 'median', 'worst')
+
+
+def column_fill_values(matrix: np.ndarray, missing: np.ndarray, criteria_types: List[str],
+                       method: str) -> np.ndarray:
+    """Per-column replacement for missing cells (trailing axes, e.g. fuzzy (l, m, u), kept)"""
+    is_benefit = np.array([t == 'benefit' for t in criteria_types], dtype=bool)
+    is_benefit = is_benefit.reshape(is_benefit.shape + (1,) * (matrix.ndim - 2))
+    present = ~missing
+    counts = present.sum(axis=0)
+
+    with warnings.catch_warnings(), np.errstate(invalid='ignore', divide='ignore'):
+        warnings.simplefilter('ignore', RuntimeWarning)  # columns without any value
+        if method == 'mean':
+            fill = np.where(present, matrix, 0.0).sum(axis=0) / counts
+        elif method == 'median':
+            fill = np.nanmedian(matrix, axis=0)
+        elif method == 'worst':
+            # Worst observed value: the minimum of a benefit, the maximum of a cost criteria
+            fill = np.where(is_benefit, np.nanmin(matrix, axis=0), np.nanmax(matrix, axis=0))
+        else:
+            raise ValueError(f"Unknown imputation method: {method}")
+
+    # A column without any value contributes nothing
+    return np.where(counts > 0, fill, 0.0).astype(matrix.dtype, copy=False)
+
+
+def impute(matrix: np.ndarray, criteria_types: List[str],
+           method: Optional[str] = AppConfig.IMPUTATION_METHOD) -> np.ndarray:
+    """Replace missing (NaN) cells column-wise; the matrix is returned as is when complete
+
+    One mask and one select over the whole matrix, so 10% missing cells cost
+    about the same as none.
+    """
+    missing = np.isnan(matrix)
+    if not missing.any():
+        return matrix
+    if method is None:
+        raise ValueError("Decision matrix has missing values")
+    fill = column_fill_values(matrix, missing, criteria_types, method)
+    return np.where(missing, fill, matrix)
@@ -0,0 +1,106 @@
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+from models.ranking import top_k_indices
+
+
+class IncrementalScorer:
+    """SAW scores kept up to date under single-cell edits
+
+    A cell edit costs O(1) unless it moves its column's max/min, in which case
+    only that column (O(alternatives)) is renormalized. Missing or invalid cells
+    are tracked and count as zero until they are filled in.
+    """
+
+    FULL_REFRESH_EVERY = 1024  # recompute from scratch now and then to drop float drift
+
+    def __init__(self, decision_matrix: List[List[Optional[float]]], weights: List[float],
+                 criteria_types: List[str]):
+        n_alternatives = len(decision_matrix)
+        n_criteria = len(criteria_types)
+        self.matrix = np.array(decision_matrix, dtype=float).reshape(n_alternatives, n_criteria)
+        self.missing = np.isnan(self.matrix)
+        self.is_benefit = np.array([t == 'benefit' for t in criteria_types], dtype=bool)
+
+        weights = np.asarray(weights, dtype=float)
+        total_weight = weights.sum()
+        self.weights = weights / total_weight if total_weight > 0 else weights
+        self.refresh()
+
+    @property
+    def missing_count(self) -> int:
+        return int(self._missing_count)
+
+    @property
+    def complete(self) -> bool:
+        return self._missing_count == 0
+
+    def refresh(self):
+        """Recompute every column extreme, the normalized matrix and the scores"""
+        self.normalized = np.zeros_like(self.matrix)
+        self.extremes = np.zeros(self.matrix.shape[1])
+        for j in range(self.matrix.shape[1]):
+            self.extremes[j] = self._column_extreme(j)
+            self.normalized[:, j] = self._normalize_column(j)
+        self.scores = self.normalized @ self.weights
+        self._missing_count = int(self.missing.sum())
+        self._updates = 0
+
+    def _column_extreme(self, j: int) -> float:
+        """max (benefit) or min (cost) of the valid values of column j"""
+        column = self.matrix[~self.missing[:, j], j]
+        if not column.size:
+            return 0.0
+        return column.max() if self.is_benefit[j] else column.min()
+
+    def _normalize_cells(self, values: np.ndarray, j: int) -> np.ndarray:
+        """SAW normalization of values of column j against its current extreme"""
+        extreme = self.extremes[j]
+        if extreme <= 0:
+            return np.zeros_like(values)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            normalized = values / extreme if self.is_benefit[j] else extreme / values
+        return np.where(np.isfinite(normalized), normalized, 0.0)
+
+    def _normalize_column(self, j: int) -> np.ndarray:
+        return np.where(self.missing[:, j], 0.0, self._normalize_cells(self.matrix[:, j], j))
+
+    def update(self, cells: Dict[Tuple[int, int], Optional[float]]):
+        """Apply a batch of cell edits; None marks a missing / invalid cell"""
+        touched: Dict[int, List[int]] = {}
+        rescan = set()  # columns whose extreme may have moved
+        for (i, j), value in cells.items():
+            was_missing = self.missing[i, j]
+            if not was_missing and self.matrix[i, j] == self.extremes[j]:
+                rescan.add(j)  # the old extreme may be gone
+            if value is not None and (value > self.extremes[j] if self.is_benefit[j]
+                                      else value < self.extremes[j] or self.extremes[j] <= 0):
+                rescan.add(j)
+            self.missing[i, j] = value is None
+            self._missing_count += int(self.missing[i, j]) - int(was_missing)
+            self.matrix[i, j] = np.nan if value is None else value
+            touched.setdefault(j, []).append(i)
+
+        self._updates += len(cells)
+        if self._updates >= self.FULL_REFRESH_EVERY:
+            self.refresh()
+            return
+
+        for j, rows in touched.items():
+            extreme = self._column_extreme(j) if j in rescan else self.extremes[j]
+            if extreme != self.extremes[j]:
+                # The column's reference value moved: renormalize the whole column
+                self.extremes[j] = extreme
+                new_column = self._normalize_column(j)
+                self.scores += self.weights[j] * (new_column - self.normalized[:, j])
+                self.normalized[:, j] = new_column
+            else:
+                rows = np.array(rows)
+                new_cells = np.where(self.missing[rows, j], 0.0,
+                                     self._normalize_cells(self.matrix[rows, j], j))
+                self.scores[rows] += self.weights[j] * (new_cells - self.normalized[rows, j])
+                self.normalized[rows, j] = new_cells
+
+    def top(self, k: int) -> List[Tuple[int, float]]:
+        """(alternative index, score) of the k best alternatives"""
+        return [(int(i), float(self.scores[i])) for i in top_k_indices(self.scores, k)]
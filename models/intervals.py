@@ -0,0 +1,106 @@
+import re
+import numpy as np
+from typing import List, Optional, Tuple
+
+_NUMBER = r'\d+(?:\.\d*)?(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?'
+_INTERVAL = re.compile(rf'^\s*({_NUMBER})\s*-\s*({_NUMBER})\s*$')
+
+
+def is_interval(value) -> bool:
+    """True for a (low, high) cell"""
+    return isinstance(value, (tuple, list, np.ndarray)) and len(value) == 2
+
+
+def interval(value) -> Tuple[float, float]:
+    """(low, high) of a cell: crisp numbers become (x, x), missing cells NaN"""
+    if value is None:
+        return (np.nan, np.nan)
+    if not is_interval(value):
+        value = float(value)
+        return (value, value)
+    low, high = (float(v) for v in value)
+    if low != low or high != high:
+        return (np.nan, np.nan)
+    if not low <= high:
+        raise ValueError("Interval needs low <= high")
+    return (low, high)
+
+
+def interval_cell_value(pair):
+    """Inverse of interval(): None, a crisp number or a (low, high) tuple"""
+    low, high = (float(v) for v in pair)
+    if low != low:
+        return None
+    if low == high:
+        return low
+    return (low, high)
+
+
+def parse_interval(text: str) -> Optional[Tuple[float, float]]:
+    """Parse 'low-high' (e.g. '3-5'); None when the text is not an interval"""
+    match = _INTERVAL.match(text)
+    if match is None:
+        return None
+    return interval((float(match.group(1)), float(match.group(2))))
+
+
+def _others_extreme(values: np.ndarray, use_max: bool) -> np.ndarray:
+    """Column max (or min) over every other alternative, for each alternative (top-2 trick)"""
+    n_alternatives = len(values)
+    if n_alternatives < 2:
+        return np.full_like(values, -np.inf if use_max else np.inf)
+    signed = values if use_max else -values
+    best = signed.argmax(axis=0)
+    columns = np.arange(values.shape[1])
+    first = signed[best, columns]
+    rest = signed.copy()
+    rest[best, columns] = -np.inf
+    second = rest.max(axis=0)
+    extreme = np.where(np.arange(n_alternatives)[:, None] == best[None, :], second, first)
+    return extreme if use_max else -extreme
+
+
+def score_bounds(low: np.ndarray, high: np.ndarray, weights: np.ndarray,
+                 criteria_types: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Exact worst- and best-case SAW score of every alternative over interval cells
+
+    An alternative's best case takes its own cells at their favourable end and
+    every other alternative's at the unfavourable end (that sets the column
+    max / min), column by column; the worst case is the mirror image. Both are
+    (alternatives x criteria) array expressions with a top-2 per column.
+    """
+    low = np.asarray(low, dtype=float)
+    high = np.asarray(high, dtype=float)
+    weights = np.asarray(weights, dtype=float)
+    is_benefit = np.array([t == 'benefit' for t in criteria_types], dtype=bool)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Benefit: R = x / column max
+        best_benefit = high / np.maximum(high, _others_extreme(low, True))
+        worst_benefit = low / np.maximum(low, _others_extreme(high, True))
+        # Cost: R = column min / x
+        best_cost = np.minimum(low, _others_extreme(high, False)) / low
+        worst_cost = np.minimum(high, _others_extreme(low, False)) / high
+        best = np.where(is_benefit, best_benefit, best_cost)
+        worst = np.where(is_benefit, worst_benefit, worst_cost)
+
+    # Non-positive extremes normalize to zero, as in SAWModel.normalize_array
+    best = np.nan_to_num(best, nan=0.0, posinf=0.0, neginf=0.0)
+    worst = np.nan_to_num(worst, nan=0.0, posinf=0.0, neginf=0.0)
+    return worst @ weights, best @ weights
+
+
+def rank_bounds(worst: np.ndarray, best: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Best and worst reachable rank (1 = first) of every alternative from its score bounds
+
+    An alternative surely loses to every other whose worst case beats its best
+    case, and can only lose to those whose best case beats its worst case.
+    """
+    sorted_worst = np.sort(worst)
+    sorted_best = np.sort(best)
+    n = len(worst)
+    surely_above = n - np.searchsorted(sorted_worst, best, side='right')
+    possibly_above = n - np.searchsorted(sorted_best, worst, side='right')
+    # An alternative's own best case is above its worst case unless the interval is degenerate
+    possibly_above -= (best > worst)
+    return surely_above + 1, possibly_above + 1
@@ -0,0 +1,74 @@
+import numpy as np
+from typing import Dict
+
+from config.settings import AppConfig
+
+
+METHODS = ('entropy', 'critic', 'std')
+
+
+def column_statistics(matrix: np.ndarray) -> Dict[str, np.ndarray]:
+    """Per-column statistics of a normalized matrix, streamed over row chunks
+
+    Chunks are merged with the pairwise (Chan et al.) update, so the covariance
+    stays accurate for million-row matrices and float32 input.
+    """
+    matrix = np.asarray(matrix)
+    n_rows, n_columns = matrix.shape
+    count = 0
+    mean = np.zeros(n_columns)
+    comoment = np.zeros((n_columns, n_columns))  # sum of centered cross products
+    total = np.zeros(n_columns)
+    plogp = np.zeros(n_columns)  # sum of r * ln(r), for the entropy method
+
+    rows = max(1, AppConfig.SCORE_CHUNK_CELLS // max(1, n_columns))
+    for start in range(0, n_rows, rows):
+        chunk = matrix[start:start + rows].astype(np.float64)
+        chunk_count = len(chunk)
+        chunk_mean = chunk.mean(axis=0)
+        centered = chunk - chunk_mean
+        chunk_comoment = centered.T @ centered
+
+        delta = chunk_mean - mean
+        merged = count + chunk_count
+        comoment += chunk_comoment + np.outer(delta, delta) * (count * chunk_count / merged)
+        mean += delta * (chunk_count / merged)
+        count = merged
+
+        total += chunk.sum(axis=0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            plogp += np.where(chunk > 0, chunk * np.log(chunk), 0.0).sum(axis=0)
+
+    return {'count': count, 'mean': mean, 'comoment': comoment, 'total': total, 'plogp': plogp}
+
+
+def objective_weights(stats: Dict[str, np.ndarray], method: str) -> np.ndarray:
+    """Weights (summing to one) derived from column statistics"""
+    count = stats['count']
+    std = np.sqrt(np.maximum(np.diag(stats['comoment']), 0.0) / max(count, 1))
+
+    if method == 'entropy':
+        # E_j = -1/ln(m) * sum_i p_ij ln p_ij with p_ij = r_ij / S_j
+        #     = -1/ln(m) * (sum_i r_ij ln r_ij / S_j - ln S_j)
+        total = stats['total']
+        with np.errstate(divide='ignore', invalid='ignore'):
+            entropy = -(stats['plogp'] / total - np.log(total)) / np.log(count)
+        entropy = np.where(total > 0, entropy, 1.0) if count > 1 else np.ones_like(total)
+        scores = 1.0 - entropy
+    elif method == 'std':
+        scores = std
+    elif method == 'critic':
+        # C_j = std_j * sum_k (1 - corr_jk)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            correlation = stats['comoment'] / np.outer(std, std) / max(count, 1)
+        correlation = np.nan_to_num(correlation)
+        scores = std * (1.0 - correlation).sum(axis=1)
+    else:
+        raise ValueError(f"Unknown weighting method: {method}")
+
+    scores = np.maximum(scores, 0.0)
+    total_score = scores.sum()
+    if total_score <= 0:
+        # No column discriminates between the alternatives: equal weights
+        return np.full(len(scores), 1.0 / len(scores))
+    return scores / total_score
@@ -0,0 +1,161 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Dict, Any, Optional
+
+import numpy as np
+
+from config.settings import AppConfig
+from utils.instrumentation import timed
+
+
+# --- Worker side ---------------------------------------------------------------
+# Each worker attaches to the shared normalized matrix once (pool initializer)
+# and builds a lightweight model around the zero-copy view.
+
+_worker_state: Dict[str, Any] = {}
+
+
+def _attach_shared_matrix(name: str) -> shared_memory.SharedMemory:
+    """Attach to the parent's shared memory block without taking ownership of it"""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13: pool workers share the parent's resource tracker, so the
+        # duplicate registration is harmless and the parent's unlink clears it
+        return shared_memory.SharedMemory(name=name)
+
+
+def _init_worker(name: str, shape, dtype: str, alternatives: List[str], criteria: List[str],
+                 criteria_types: List[str], weights: List[float], results_head,
+                 front: Optional[np.ndarray]):
+    """Pool initializer: map the shared matrix and build the worker model"""
+    from models.saw_model import SAWModel
+
+    shm = _attach_shared_matrix(name)
+    model = SAWModel()
+    model.alternatives = alternatives
+    model.criteria = criteria
+    model.criteria_types = criteria_types
+    model.weights = weights
+    model.normalized_matrix = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    model.results = results_head
+    # Reuse the parent's Pareto front instead of recomputing it in every worker
+    model._pareto = (model.normalized_matrix, front,
+                     None if front is None else model.normalized_matrix[front].astype(np.float64))
+    _worker_state['shm'] = shm
+    _worker_state['model'] = model
+
+
+def _sweep_criteria(model, criteria_index: int, weight_range: float) -> Dict[str, Any]:
+    """Winner-only sweep of one criteria plus the original winner's score curve"""
+    sensitivity_results = model.sensitivity_analysis(criteria_index, weight_range, top_k=1)
+    _, _, weight_stack = model.sensitivity_weights(criteria_index, weight_range)
+    winner_index = model.alternatives.index(model.results[0][0])
+    winner_scores = weight_stack @ model.normalized_matrix[winner_index]
+    return {
+        'criteria_index': criteria_index,
+        'results': sensitivity_results,
+        'winner_scores': winner_scores
+    }
+
+
+def _sweep_job(criteria_index: int, weight_range: float) -> Dict[str, Any]:
+    """Process pool job for one criteria"""
+    return _sweep_criteria(_worker_state['model'], criteria_index, weight_range)
+
+
+# --- Parent side ---------------------------------------------------------------
+
+class ParallelSensitivityAnalyzer:
+    """Sweep every criteria in parallel and aggregate a tornado-style stability ranking"""
+
+    def __init__(self, model, workers: Optional[int] = AppConfig.PARALLEL_WORKERS,
+                 min_cells: int = AppConfig.PARALLEL_MIN_CELLS):
+        self.model = model
+        self.workers = workers or os.cpu_count() or 1
+        self.min_cells = min_cells
+
+    @timed('model.sensitivity_all_criteria')
+    def analyze_all(self, weight_range: float) -> Dict[str, Any]:
+        """Run the sweep for all criteria and return per-criteria results and the summary"""
+        model = self.model
+        if not model.results:
+            raise ValueError("No results available. Calculate SAW first.")
+        if model.normalized_matrix is None:
+            model.normalize_matrix()
+
+        indices = list(range(len(model.criteria)))
+        cells = model.normalized_matrix.size
+        if all(w > 0 for w in model.weights):
+            # Winner-only sweeps score just the Pareto front
+            front = model.pareto_front()
+            if front is not None:
+                cells = len(front) * len(indices)
+        if self.workers <= 1 or len(indices) <= 1 or cells < self.min_cells:
+            sweeps = [_sweep_criteria(model, j, weight_range) for j in indices]
+        else:
+            sweeps = self._run_parallel(indices, weight_range)
+            if model.recorder is not None:
+                # Worker models have no recorder; keep the history the same as in-process sweeps
+                for sweep in sweeps:
+                    model.recorder.record_sensitivity(model, sweep['criteria_index'], weight_range,
+                                                      sweep['results'])
+
+        sweeps.sort(key=lambda sweep: sweep['criteria_index'])
+        return {
+            'weight_range': weight_range,
+            'sweeps': {model.criteria[s['criteria_index']]: s['results'] for s in sweeps},
+            'summary': self._summarize(sweeps)
+        }
+
+    def _run_parallel(self, indices: List[int], weight_range: float) -> List[Dict[str, Any]]:
+        """Share the normalized matrix zero-copy and fan criteria out to a process pool"""
+        model = self.model
+        matrix = np.ascontiguousarray(model.normalized_matrix)
+        shm = shared_memory.SharedMemory(create=True, size=max(1, matrix.nbytes))
+        try:
+            np.ndarray(matrix.shape, dtype=matrix.dtype, buffer=shm.buf)[...] = matrix
+            init_args = (shm.name, matrix.shape, matrix.dtype.str, model.alternatives,
+                         model.criteria, model.criteria_types, list(model.weights),
+                         model.results[:1], model.pareto_front())
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(indices)),
+                                     initializer=_init_worker, initargs=init_args) as pool:
+                futures = [pool.submit(_sweep_job, j, weight_range) for j in indices]
+                return [future.result() for future in futures]
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def _summarize(self, sweeps: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Build the tornado ranking: least stable / widest swing criteria first"""
+        model = self.model
+        summary = []
+        for sweep in sweeps:
+            j = sweep['criteria_index']
+            results = sweep['results']
+            stability_info = model.calculate_stability(results)
+            original_winner = stability_info.get('original_winner')
+
+            changes = np.array([r['change'] for r in results])
+            flipped = np.array([r['winner'] != original_winner for r in results], dtype=bool)
+            lower = changes[flipped & (changes < 0)]
+            upper = changes[flipped & (changes > 0)]
+            winner_scores = sweep['winner_scores']
+
+            summary.append({
+                'criteria': model.criteria[j],
+                'original_weight': model.weights[j],
+                'stability': stability_info['stability'],
+                'level': stability_info['level'],
+                'winner_changes': int(flipped.sum()),
+                # Smallest weight decrease / increase that changes the winner
+                'lower_change': float(lower.max()) if lower.size else None,
+                'upper_change': float(upper.min()) if upper.size else None,
+                'low_score': float(winner_scores.min()) if winner_scores.size else 0.0,
+                'high_score': float(winner_scores.max()) if winner_scores.size else 0.0,
+                'swing': float(np.ptp(winner_scores)) if winner_scores.size else 0.0
+            })
+
+        summary.sort(key=lambda item: (item['stability'], -item['swing']))
+        return summary
@@ -0,0 +1,70 @@
+import numpy as np
+from typing import Optional, Tuple
+
+from config.settings import AppConfig
+
+
+def _dominated(front: np.ndarray, front_sums: np.ndarray,
+               block: np.ndarray, block_sums: np.ndarray) -> Tuple[np.ndarray, int]:
+    """Mask of the block rows that some front row dominates, and the row pairs compared"""
+    dominated = np.zeros(len(block), dtype=bool)
+    alive = np.arange(len(block))
+    compared = 0
+    # Front rows come strongest first and knock out most rows early, so the
+    # chunks start small and grow as fewer rows are left alive
+    start, chunk = 0, 8
+    while start < len(front) and len(alive):
+        rows = front[start:start + chunk]
+        compared += len(rows) * len(alive)
+        # >= on every criterion plus a larger sum means strictly better somewhere
+        no_worse = (rows[:, None, :] >= block[None, alive, :]).all(axis=2)
+        better = front_sums[start:start + chunk, None] > block_sums[None, alive]
+        hit = (no_worse & better).any(axis=0)
+        dominated[alive[hit]] = True
+        alive = alive[~hit]
+        start += len(rows)
+        chunk = max(1, min(2 * chunk, AppConfig.SCORE_CHUNK_CELLS // max(1, len(alive) * block.shape[1])))
+    return dominated, compared
+
+
+def pareto_front(matrix: np.ndarray, block_rows: int = AppConfig.PARETO_BLOCK_ROWS,
+                 max_comparisons: int = AppConfig.PARETO_MAX_COMPARISONS) -> Optional[np.ndarray]:
+    """Sorted indices of the rows of a normalized (higher is better) matrix that no row dominates
+
+    Sort-filter skyline: rows are visited in blocks by descending sum, so only rows
+    already on the front can dominate them. Returns None once more than
+    max_comparisons cell comparisons were needed, i.e. when the front is too large
+    for the prefilter to pay off.
+    """
+    matrix = np.asarray(matrix)
+    n_rows, n_columns = matrix.shape
+    sums = matrix.sum(axis=1, dtype=np.float64)
+    order = np.argsort(-sums, kind='stable')
+
+    front = np.empty((0, n_columns), dtype=matrix.dtype)
+    front_sums = np.empty(0)
+    front_indices = []
+    comparisons = 0
+    for start in range(0, n_rows, block_rows):
+        indices = order[start:start + block_rows]
+        block, block_sums = matrix[indices], sums[indices]
+
+        dominated, compared = _dominated(front, front_sums, block, block_sums)
+        keep = ~dominated
+        indices, block, block_sums = indices[keep], block[keep], block_sums[keep]
+        # Rows of the same block can dominate each other
+        dominated, compared_within = _dominated(block, block_sums, block, block_sums)
+        keep = ~dominated
+        indices, block, block_sums = indices[keep], block[keep], block_sums[keep]
+
+        comparisons += (compared + compared_within) * n_columns
+        if comparisons > max_comparisons:
+            return None
+
+        front = np.concatenate([front, block])
+        front_sums = np.concatenate([front_sums, block_sums])
+        front_indices.append(indices)
+
+    if not front_indices:
+        return np.empty(0, dtype=np.intp)
+    return np.sort(np.concatenate(front_indices))
@@ -0,0 +1,150 @@
+import numpy as np
+from typing import Dict, Tuple
+
+from config.settings import AppConfig
+from models.ranking import top_k_indices
+
+
+def _group_starts(new_group: np.ndarray) -> np.ndarray:
+    """Position of the first element of every element's group, given where groups start"""
+    positions = np.broadcast_to(np.arange(new_group.shape[-1]), new_group.shape)
+    return np.maximum.accumulate(np.where(new_group, positions, 0), axis=-1)
+
+
+def _new_groups(sorted_values: np.ndarray) -> np.ndarray:
+    """True where a row-wise sorted value differs from its predecessor"""
+    new_group = np.ones(sorted_values.shape, dtype=bool)
+    new_group[..., 1:] = sorted_values[..., 1:] != sorted_values[..., :-1]
+    return new_group
+
+
+def _tied_pairs(new_group: np.ndarray) -> np.ndarray:
+    """Number of tied pairs per row, given where the sorted groups start"""
+    return (np.arange(new_group.shape[-1]) - _group_starts(new_group)).sum(axis=-1)
+
+
+def rank_rows(scores: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Average ranks (1 = best), dense ranks (0 = best) and tied pairs of every row, from one sort"""
+    scores = np.atleast_2d(np.asarray(scores, dtype=float))
+    order = np.argsort(-scores, axis=-1)
+    new_group = _new_groups(np.take_along_axis(scores, order, axis=-1))
+    positions = np.broadcast_to(np.arange(scores.shape[-1]), scores.shape)
+    if new_group.all():
+        # No ties (the usual case for continuous scores): ranks are sorted positions
+        dense = positions
+        average = positions + 1.0
+        ties = np.zeros(len(scores), dtype=np.int64)
+    else:
+        dense = np.cumsum(new_group, axis=-1) - 1
+        first = _group_starts(new_group)
+        # Last position of a group: first position of the next group - 1
+        next_first = np.empty(scores.shape, dtype=np.intp)
+        next_first[..., :-1] = np.where(new_group[..., 1:], positions[..., 1:], scores.shape[-1])
+        next_first[..., -1] = scores.shape[-1]
+        last = np.minimum.accumulate(next_first[..., ::-1], axis=-1)[..., ::-1] - 1
+        average = (first + last) / 2 + 1
+        ties = _tied_pairs(new_group)
+    average_ranks = np.empty(scores.shape)
+    dense_ranks = np.empty(scores.shape, dtype=np.int64)
+    np.put_along_axis(average_ranks, order, average, axis=-1)
+    np.put_along_axis(dense_ranks, order, dense, axis=-1)
+    return average_ranks, dense_ranks, ties
+
+
+def count_inversions(ranks: np.ndarray) -> np.ndarray:
+    """Pairs i < j with ranks[i] > ranks[j] per row of non-negative integer ranks (O(n log n))
+
+    Bottom-up merge sort over all rows at once. Each key carries its rank and,
+    in the low bit, whether it comes from the right block of its merge, so a
+    merge is one in-place sort of the keys; a right element lands behind every
+    left element not greater than it, and the inversions of the merge follow
+    from where the right elements landed.
+    """
+    ranks = np.atleast_2d(np.asarray(ranks, dtype=np.int64))
+    n_rows, n = ranks.shape
+    inversions = np.zeros(n_rows, dtype=np.int64)
+    if n < 2:
+        return inversions
+    size = 1 << (n - 1).bit_length()
+    positions = np.arange(size, dtype=np.float64)
+    # Cache-sized row blocks: every pass streams the whole block
+    rows = max(1, AppConfig.INVERSION_BLOCK_CELLS // size)
+    for start in range(0, n_rows, rows):
+        block = ranks[start:start + rows]
+        keys = np.empty((len(block), size), dtype=np.int64)
+        keys[:, :n] = block << 1
+        keys[:, n:] = (int(block.max()) + 1) << 1  # padding is largest and last: no inversions
+
+        width = 1
+        while width < size:
+            merges = size // (2 * width)
+            keys &= ~1
+            keys.reshape(len(block), merges, 2, width)[:, :, 1, :] |= 1
+            keys.reshape(len(block), merges, 2 * width).sort(axis=-1)
+            # Sum of the landing positions of the right elements within their merge
+            from_right = (keys & 1).astype(np.float64)
+            landed = np.rint(from_right @ positions).astype(np.int64) \
+                - width * 2 * width * (merges * (merges - 1) // 2)
+            # j-th right element at position p passes width - (p - j) left elements
+            inversions[start:start + rows] += merges * (width * width + width * (width - 1) // 2) - landed
+            width *= 2
+    return inversions
+
+
+def spearman(base_ranks: np.ndarray, ranks: np.ndarray) -> np.ndarray:
+    """Spearman correlation of base average ranks with every row of average ranks"""
+    base = base_ranks - base_ranks.mean()
+    ranks = ranks - ranks.mean(axis=-1, keepdims=True)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (ranks @ base) / np.sqrt(np.einsum('ij,ij->i', ranks, ranks) * (base @ base))
+
+
+def kendall_tau(base_ranks: np.ndarray, base_ties: int, ranks: np.ndarray, ties: np.ndarray) -> np.ndarray:
+    """Kendall tau-b of base dense ranks with every row of dense ranks (Knight's O(n log n) algorithm)"""
+    n = ranks.shape[-1]
+    total_pairs = n * (n - 1) // 2
+    # Order by base rank, then by each row's own rank inside base ties; the
+    # discordant pairs are then the inversions of the row's ranks
+    if base_ties:
+        keys = base_ranks * np.int64(n) + ranks
+        order = np.argsort(keys, axis=-1)
+        ranks = np.take_along_axis(ranks, order, axis=-1)
+        # Pairs tied in both rankings
+        joint_ties = _tied_pairs(_new_groups(np.take_along_axis(keys, order, axis=-1)))
+    else:
+        ranks = ranks[:, np.argsort(base_ranks)]
+        joint_ties = 0
+
+    discordant = count_inversions(ranks)
+    # n_c - n_d over all pairs that are untied in both rankings
+    difference = total_pairs - base_ties - ties + joint_ties - 2 * discordant
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return difference / np.sqrt(float(total_pairs - base_ties) * (total_pairs - ties))
+
+
+def top_k_overlap(base_scores: np.ndarray, score_stack: np.ndarray, k: int) -> np.ndarray:
+    """Share of the base top k that is still in the top k of every row of score_stack"""
+    base_scores = np.asarray(base_scores)
+    k = max(1, min(int(k), len(base_scores)))
+    in_base_top = np.zeros(len(base_scores), dtype=bool)
+    in_base_top[top_k_indices(base_scores, k)] = True
+    return in_base_top[top_k_indices(np.atleast_2d(score_stack), k)].sum(axis=1) / k
+
+
+def rank_correlations(base_scores: np.ndarray, score_stack: np.ndarray,
+                      k: int = AppConfig.RANK_OVERLAP_K) -> Dict[str, np.ndarray]:
+    """Spearman, Kendall tau-b and top-k overlap of every row of score_stack against the base scores"""
+    score_stack = np.atleast_2d(score_stack)
+    base_average, base_dense, base_ties = rank_rows(base_scores)
+    base_average, base_dense, base_ties = base_average[0], base_dense[0], int(base_ties[0])
+    result = {'spearman': np.empty(len(score_stack)), 'kendall': np.empty(len(score_stack)),
+              'top_k_overlap': np.empty(len(score_stack))}
+    # Row blocks keep the sort temporaries bounded for large alternative counts
+    rows = max(1, AppConfig.SCORE_CHUNK_CELLS // max(1, score_stack.shape[1]))
+    for start in range(0, len(score_stack), rows):
+        block = score_stack[start:start + rows]
+        average, dense, ties = rank_rows(block)
+        result['spearman'][start:start + rows] = spearman(base_average, average)
+        result['kendall'][start:start + rows] = kendall_tau(base_dense, base_ties, dense, ties)
+        result['top_k_overlap'][start:start + rows] = top_k_overlap(base_scores, block, k)
+    return result
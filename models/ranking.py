@@ -0,0 +1,222 @@
+import numpy as np
+from typing import Callable, List, Tuple, Optional
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """Get indices of the k best scores along the last axis, best first (O(N) selection)"""
+    scores = np.asarray(scores)
+    n = scores.shape[-1]
+    k = max(0, min(int(k), n))
+    if k == 0:
+        return np.empty(scores.shape[:-1] + (0,), dtype=np.intp)
+    if k == 1:
+        return np.argmax(scores, axis=-1)[..., None]
+    if k >= n // 2:
+        return np.argsort(-scores, axis=-1, kind='stable')[..., :k]
+
+    # k-th best score by partial selection, then keep everything above it plus
+    # the lowest-index ties at the boundary (same set a stable sort would pick)
+    threshold = np.partition(scores, n - k, axis=-1)[..., n - k, None]
+    above = scores > threshold
+    at_threshold = scores == threshold
+    needed = k - above.sum(axis=-1, keepdims=True)
+    selected_mask = above | (at_threshold & (np.cumsum(at_threshold, axis=-1) <= needed))
+    candidates = np.nonzero(selected_mask)[-1].reshape(scores.shape[:-1] + (k,))
+
+    # Sort the selection by (score desc, index asc)
+    selected = np.take_along_axis(scores, candidates, axis=-1)
+    order = np.argsort(-selected, axis=-1, kind='stable')
+    return np.take_along_axis(candidates, order, axis=-1)
+
+
+def _split(a):
+    """Dekker split of a into high and low halves of 26 bits"""
+    c = 134217729.0 * a  # 2**27 + 1
+    hi = c - (c - a)
+    return hi, a - hi
+
+
+def compensated_scores(normalized_matrix: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Row dot products computed as if in twice the working precision (Dot2)
+
+    Vectorized over the rows; loops only over the criteria.
+    """
+    columns = np.ascontiguousarray(np.asarray(normalized_matrix, dtype=float).T)
+    weights = np.asarray(weights, dtype=float)
+    total = np.zeros(columns.shape[1])
+    error = np.zeros(columns.shape[1])
+    for column, weight in zip(columns, weights):
+        # Error-free product (Dekker) and sum (Knuth): column * weight + total
+        product = column * weight
+        column_hi, column_lo = _split(column)
+        weight_hi, weight_lo = _split(weight)
+        product_error = ((column_hi * weight_hi - product) + column_hi * weight_lo
+                         + column_lo * weight_hi) + column_lo * weight_lo
+        new_total = total + product
+        rounded = new_total - total
+        sum_error = (total - (new_total - rounded)) + (product - rounded)
+        total = new_total
+        error += product_error + sum_error
+    return total + error
+
+
+def tie_aware_ranking(normalized_matrix: np.ndarray, weights: np.ndarray,
+                      scores: Optional[np.ndarray] = None, tolerance: float = 1e-9,
+                      tie_break: str = 'criteria',
+                      names: Optional[List[str]] = None) -> Tuple[np.ndarray, np.ndarray, List[np.ndarray]]:
+    """Rank with compensated summation for near-ties and deterministic tie-breaks
+
+    Returns (order best first, refined scores, tie groups as index arrays in rank order).
+    Only neighbours whose fast gap is within the float error bound of the
+    tolerance are re-summed: a smaller gap is a tie either way and a larger one
+    an order either way, so the cost stays close to the plain vectorized ranking.
+    """
+    normalized_matrix = np.asarray(normalized_matrix)  # float32 rows are upcast where needed
+    weights = np.asarray(weights, dtype=float)
+    scores = normalized_matrix @ weights if scores is None else np.array(scores, dtype=float)
+    n = len(scores)
+    if n == 0:
+        return np.empty(0, dtype=np.intp), scores, []
+
+    # Gap error bound: two dot products, each off by n_criteria * eps * sum|w * r| at most
+    eps = np.finfo(float).eps
+    gap_error = 2 * normalized_matrix.shape[1] * eps * float(np.abs(scores).max())
+
+    order = np.argsort(-scores, kind='stable')
+    gaps = -np.diff(scores[order])
+    near = np.flatnonzero((gaps > tolerance - gap_error) & (gaps <= tolerance + gap_error))
+    if near.size:
+        near_mask = np.zeros(n, dtype=bool)
+        near_mask[near] = True
+        near_mask[near + 1] = True
+        rows = order[near_mask]
+        scores[rows] = compensated_scores(normalized_matrix[rows], weights)
+        gaps = -np.diff(scores[order])
+        if (gaps < 0).any():
+            order = np.argsort(-scores, kind='stable')
+            gaps = -np.diff(scores[order])
+
+    # Tie groups: runs of neighbours within the tolerance (chained)
+    tied = np.flatnonzero(gaps <= tolerance)
+    if not tied.size:
+        return order, scores, []
+
+    starts = tied[np.r_[True, np.diff(tied) > 1]]
+    ends = tied[np.r_[np.diff(tied) > 1, True]] + 2
+    lengths = ends - starts
+    positions = np.repeat(ends - lengths.cumsum(), lengths) + np.arange(lengths.sum())
+    group_ids = np.repeat(np.arange(len(starts)), lengths)
+
+    members = order[positions]
+    keys = _tie_break_keys(normalized_matrix, weights, tie_break, names)
+    order[positions] = members[_sort_within_groups(members, group_ids, keys)]
+    groups = np.split(order[positions], lengths.cumsum()[:-1])
+    return order, scores, groups
+
+
+def _sort_within_groups(members: np.ndarray, group_ids: np.ndarray,
+                        keys: List[Callable[[np.ndarray], np.ndarray]]) -> np.ndarray:
+    """Permutation sorting members by group, then by each key in turn (most significant first)
+
+    Equivalent to one lexsort over all keys, but later keys are only computed
+    and sorted where the earlier ones still tie, which is usually a tiny subset.
+    """
+    previous = keys[0](members)
+    perm = np.lexsort([previous, group_ids])
+    for key in keys[1:]:
+        # Segments of neighbours still equal on the group and every key so far
+        same = ((group_ids[perm][1:] == group_ids[perm][:-1]) &
+                (previous[perm][1:] == previous[perm][:-1]))
+        if not same.any():
+            break
+        tied = np.zeros(len(perm), dtype=bool)
+        tied[1:] |= same
+        tied[:-1] |= same
+        segment = np.cumsum(~np.r_[False, same])  # label per sorted position
+        positions = np.flatnonzero(tied)
+        sub = perm[positions]
+        values = key(members[sub])
+        perm[positions] = sub[np.lexsort([values, segment[positions]])]
+        
+        # Later passes only refine inside the segments that are still tied
+        group_ids = np.empty(len(perm), dtype=np.intp)
+        group_ids[perm] = segment
+        previous = np.zeros(len(perm), dtype=values.dtype)
+        previous[sub] = values
+    return perm
+
+
+def _tie_break_keys(normalized_matrix: np.ndarray, weights: np.ndarray, tie_break: str,
+                    names: Optional[List[str]]) -> List[Callable[[np.ndarray], np.ndarray]]:
+    """Sort key functions (most significant first) for tied alternatives; input order settles the rest
+
+    'criteria': better weighted value on the heaviest criteria first, then the next one
+    'name': alphabetical by alternative name
+    'input': input order
+    """
+    def input_order(indices):
+        return indices
+
+    if tie_break == 'criteria':
+        by_weight = np.argsort(-weights, kind='stable')
+        return [lambda indices, c=c: -normalized_matrix[indices, c] * weights[c]
+                for c in by_weight] + [input_order]
+    if tie_break == 'name':
+        if names is None:
+            raise ValueError("Tie-break by name needs the alternative names")
+        return [lambda indices: np.array([names[i] for i in indices]), input_order]
+    if tie_break == 'input':
+        return [input_order]
+    raise ValueError(f"Unknown tie-break rule: {tie_break}")
+
+
+class LazyRanking:
+    """Ranking of alternatives that is only sorted as far as it is read"""
+
+    def __init__(self, alternatives: List[str], scores: np.ndarray):
+        self.alternatives = alternatives
+        self.scores = np.asarray(scores)
+        self._order = np.empty(0, dtype=np.intp)
+
+    def __len__(self):
+        return len(self.scores)
+
+    def _ensure(self, count: int):
+        """Make sure the first `count` positions are ranked"""
+        if count <= len(self._order):
+            return
+        # Grow geometrically so repeated reads stay amortized O(N)
+        count = min(len(self.scores), max(count, 2 * len(self._order), 8))
+        self._order = top_k_indices(self.scores, count)
+
+    def top(self, k: int) -> List[Tuple[str, float]]:
+        """Get the k best (alternative, score) pairs"""
+        self._ensure(k)
+        return [(self.alternatives[i], float(self.scores[i])) for i in self._order[:k]]
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            stop = position.stop if position.stop is not None else len(self)
+            if stop < 0 or (position.start or 0) < 0:
+                stop = len(self)
+            self._ensure(stop)
+            return [(self.alternatives[i], float(self.scores[i])) for i in self._order[position]]
+
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError("Ranking position out of range")
+        self._ensure(position + 1)
+        i = self._order[position]
+        return self.alternatives[i], float(self.scores[i])
+
+    def __iter__(self):
+        self._ensure(len(self))
+        for i in self._order:
+            yield self.alternatives[i], float(self.scores[i])
+
+    def indices(self, k: int = None) -> np.ndarray:
+        """Get ranked alternative indices (all of them when k is None)"""
+        k = len(self) if k is None else k
+        self._ensure(k)
+        return self._order[:k]
@@ -1,10 +1,27 @@
 import numpy as np
-from typing import List, Tuple, Dict, Any
+from typing import List, Tuple, Dict, Any, Optional
+from models.scenario_manager import ScenarioManager, insert_weight, remove_weight
+from models.ranking import LazyRanking, top_k_indices, tie_aware_ranking
+from models.pareto import pareto_front
+from models.objective_weights import column_statistics, objective_weights
+from models.fuzzy import (is_triangular, triangular, cell_value, crisp_value, defuzzify, normalize_fuzzy,
+                          normalize_fuzzy_weights, score_weights, fuzzy_scores)
+from models.intervals import is_interval, interval, interval_cell_value, score_bounds, rank_bounds
+from models.imputation import impute
+from models.rank_correlation import rank_correlations
+from models.weight_solver import minimum_weight_change, single_criterion_changes
+from models.history import EditHistory
+from models.parallel_sensitivity import ParallelSensitivityAnalyzer
+from config.settings import AppConfig
+from utils.instrumentation import timed
 
 
 class SAWModel:
     """SAW calculation model"""
     
+    # Persisted project sections (see utils.project_store)
+    SECTIONS = ('meta', 'weights', 'matrix', 'results', 'analyses')
+    
     def __init__(self):
         self.alternatives = []
         self.criteria = []
@@ -13,66 +30,597 @@ class SAWModel:
         self.criteria_types = []  # 'benefit' or 'cost'
         self.results = []
         self.normalized_matrix = None
+        self.fuzzy_matrix = None  # (alternatives x criteria x 3) triangular cells (l, m, u) in fuzzy mode
+        self.fuzzy_weights = None  # (criteria x 3) triangular weights; None = crisp weights
+        self.fuzzy_normalized = None  # normalized fuzzy_matrix, set together with normalized_matrix
+        self.interval_matrix = None  # (alternatives x criteria x 2) (low, high) cells when any cell is a range
+        self.imputation = AppConfig.IMPUTATION_METHOD  # how missing cells are filled (models.imputation)
+        self.dtype = np.dtype(AppConfig.COMPUTE_DTYPE)  # dtype of the numeric core
+        self._matrix_array = None  # decision_matrix as an array of self.dtype (cached)
+        self._pareto = None  # (normalized matrix, front indices, front rows) cache of pareto_front()
+        self._column_stats = None  # (normalized matrix, statistics) cache of column_statistics()
+        self.weight_method = 'manual'  # 'manual', 'ahp', 'tree' or one of models.objective_weights.METHODS
+        self.manual_weights = []  # weights typed by the user, kept while derived weights are used
+        self.ahp = None  # pairwise comparisons of the criteria (models.ahp.AHPWeights), 'ahp' method
+        self.criteria_tree = None  # criteria hierarchy (models.criteria_tree.CriteriaTree), 'tree' method
+        self.scores = None  # score per alternative, in input order (always float64)
+        self.ranking_mode = AppConfig.RANKING_MODE
+        self.tie_tolerance = AppConfig.TIE_TOLERANCE
+        self.tie_break = AppConfig.TIE_BREAK
+        self.tie_groups = []  # alternative index arrays per tie group, in rank order (tie_aware mode)
+        self.scenarios = ScenarioManager(self)
+        self.analyses = {}  # cached analysis results by name, saved with the project
+        self.dirty_sections = set()  # sections changed since the last save
+        self.revisions = dict.fromkeys(self.SECTIONS, 0)  # change counter per section (render caches)
+        self.recorder = None  # optional run history (utils.decision_store.DecisionStore)
+        self.history = EditHistory(self)  # undo/redo of the edit methods below
+    
+    def mark_dirty(self, *sections: str):
+        """Flag sections for the next (auto)save; no arguments flags everything"""
+        sections = sections or self.SECTIONS
+        self.dirty_sections.update(sections)
+        for section in sections:
+            self.revisions[section] += 1
         
     def set_data(self, alternatives: List[str], criteria: List[str], 
         weights: List[float], decision_matrix: List[List[float]], 
-        criteria_types: List[str]):
-        """Set all data for SAW calculation"""
+        criteria_types: List[str]) -> List[str]:
+        """Set all data for SAW calculation
+        
+        Cells may be None (missing), (low, high) intervals or, like the weights,
+        (l, m, u) fuzzy numbers. Returns the names of stored scenarios dropped
+        because they no longer fit the new shape.
+        """
         self.alternatives = alternatives.copy()
         self.criteria = criteria.copy()
-        self.weights = weights.copy()
-        self.decision_matrix = [row.copy() for row in decision_matrix]
         self.criteria_types = criteria_types.copy()
         
+        # Fuzzy mode stays on once enabled; decision_matrix then holds the
+        # defuzzified cells (interval midpoints) so crisp consumers keep working
+        special = [v for row in decision_matrix for v in row if is_triangular(v) or is_interval(v)]
+        self.interval_matrix = None
+        if self.fuzzy_matrix is not None or any(is_triangular(v) for v in special):
+            self.fuzzy_matrix = np.array([[triangular(v) for v in row] for row in decision_matrix],
+                                         dtype=float).reshape(len(alternatives), len(criteria), 3)
+        elif special:
+            self.interval_matrix = np.array([[interval(v) for v in row] for row in decision_matrix],
+                                            dtype=float).reshape(len(alternatives), len(criteria), 2)
+        if special:
+            self.decision_matrix = [[crisp_value(v) for v in row] for row in decision_matrix]
+        else:
+            self.decision_matrix = [row.copy() for row in decision_matrix]
+        if any(is_triangular(w) for w in weights):
+            self.fuzzy_weights = np.array([triangular(w) for w in weights])
+            self.weights = defuzzify(normalize_fuzzy_weights(self.fuzzy_weights)).tolist()
+        else:
+            self.fuzzy_weights = None
+            self.weights = weights.copy()
+        
+        self._matrix_array = None
+        self._pareto = None
+        self._column_stats = None
+        self.normalized_matrix = None
+        self.fuzzy_normalized = None
+        self.scenarios.scores = None
+        dropped_scenarios = self.scenarios.discard_mismatched()
+        self.analyses = {}
+        self.mark_dirty('meta', 'weights', 'matrix', 'analyses')
+        
         # Normalize weights
         total_weight = sum(self.weights)
         if total_weight > 0:
             self.weights = [w/total_weight for w in self.weights]
+        # An objective method stays active (its weights follow the new matrix)
+        # as long as the manual weights it replaced still fit the criteria
+        if self.weight_method == 'manual' or len(self.manual_weights) != len(self.weights):
+            self.weight_method = 'manual'
+            self.manual_weights = list(self.weights)
+        if self.ahp is not None and len(self.ahp) != len(self.criteria):
+            self.ahp = None
+        return dropped_scenarios
+    
+    # --- Edit API ------------------------------------------------------------------
+    # Keeps decision_matrix shaped (alternatives x criteria); cells not entered yet
+    # are None. Go through self.history.execute(...) to make an edit undoable.
+    # Fuzzy and interval cells live in an array next to decision_matrix, which
+    # always holds the crisp (defuzzified / midpoint) value.
+    
+    def _cell_store(self):
+        """(attribute, to-array, from-array) of the non-crisp cell array, or None"""
+        if self.fuzzy_matrix is not None:
+            return 'fuzzy_matrix', triangular, cell_value
+        if self.interval_matrix is not None:
+            return 'interval_matrix', interval, interval_cell_value
+        return None
+    
+    def _prepare_cells(self, values):
+        """Start an interval array when a range arrives in a crisp matrix"""
+        if self._cell_store() is None and any(is_interval(v) for v in values):
+            cells = np.array(self.decision_matrix, dtype=float).reshape(len(self.alternatives), len(self.criteria))
+            self.interval_matrix = np.repeat(cells[:, :, None], 2, axis=2)
+    
+    def _insert_cells(self, index: int, values, axis: int):
+        """Insert a row (axis 0) or column (axis 1) into the non-crisp cell array"""
+        store = self._cell_store()
+        if store is not None:
+            name, to_array, _ = store
+            setattr(self, name, np.insert(getattr(self, name), index, [to_array(v) for v in values], axis=axis))
+    
+    def _delete_cells(self, index: int, axis: int) -> Optional[list]:
+        """Delete a row or column of the non-crisp cell array and return its cells"""
+        store = self._cell_store()
+        if store is None:
+            return None
+        name, _, from_array = store
+        array = getattr(self, name)
+        cells = [from_array(pair) for pair in np.take(array, index, axis=axis)]
+        setattr(self, name, np.delete(array, index, axis=axis))
+        return cells
+    
+    def _invalidate_results(self):
+        """Drop results computed from the previous data"""
+        self.results = []
+        self.normalized_matrix = None
+        self.fuzzy_normalized = None
+        self._matrix_array = None
+        self._pareto = None
+        self._column_stats = None
+        self.scores = None
+        self.tie_groups = []
+        self.scenarios.scores = None
+        self.mark_dirty('meta', 'weights', 'matrix', 'results')
+    
+    def add_alternative(self, name: str, row: Optional[List[Optional[float]]] = None,
+                        index: Optional[int] = None, linked: Optional[Dict[str, Any]] = None) -> int:
+        """Insert an alternative (default: append) with an optional matrix row
+
+        linked is the dependent state returned by remove_alternative (scenario rows).
+        """
+        index = len(self.alternatives) if index is None else index
+        row = [None] * len(self.criteria) if row is None else list(row)
+        if len(row) != len(self.criteria):
+            raise ValueError("Row does not match the number of criteria")
+        
+        self._prepare_cells(row)
+        self.alternatives.insert(index, name)
+        self.decision_matrix.insert(index, [crisp_value(v) for v in row])
+        self._insert_cells(index, row, axis=0)
+        self.scenarios.insert_alternative(index, self.decision_matrix[index], (linked or {}).get('scenarios'))
+        self._invalidate_results()
+        return index
+    
+    def remove_alternative(self, index: int) -> Tuple[str, List[Optional[float]], Dict[str, Any]]:
+        """Remove an alternative and return its name, matrix row and linked state"""
+        name = self.alternatives.pop(index)
+        row = self.decision_matrix.pop(index)
+        row = self._delete_cells(index, axis=0) or row
+        linked = {'scenarios': self.scenarios.remove_alternative(index)}
+        self._invalidate_results()
+        return name, row, linked
     
+    def add_criterion(self, name: str, weight: float, criteria_type: str,
+                      column: Optional[List[Optional[float]]] = None,
+                      index: Optional[int] = None, linked: Optional[Dict[str, Any]] = None) -> int:
+        """Insert a criteria (default: append) with an optional matrix column
+
+        linked is the dependent state returned by remove_criterion (scenario weights and
+        columns, AHP comparisons).
+        """
+        index = len(self.criteria) if index is None else index
+        column = [None] * len(self.alternatives) if column is None else list(column)
+        if len(column) != len(self.alternatives):
+            raise ValueError("Column does not match the number of alternatives")
+        
+        if is_triangular(weight) and self.fuzzy_weights is None:
+            self.fuzzy_weights = np.array([triangular(w) for w in self.weights]).reshape(-1, 3)
+        if self.fuzzy_weights is not None:
+            self.fuzzy_weights = np.insert(self.fuzzy_weights, index, triangular(weight), axis=0)
+            weight = crisp_value(weight)
+        
+        self.criteria.insert(index, name)
+        # The other weights make room for the new one, as set_data keeps them summing to one
+        self.weights = insert_weight(self.weights, index, weight).tolist()
+        if self.weight_method != 'manual':
+            self.manual_weights = insert_weight(self.manual_weights, index, weight).tolist()
+        if self.ahp is not None:
+            self.ahp.insert(index, (linked or {}).get('ahp'))
+        self._prepare_cells(column)
+        self.criteria_types.insert(index, criteria_type)
+        for row, value in zip(self.decision_matrix, column):
+            row.insert(index, crisp_value(value))
+        self._insert_cells(index, column, axis=1)
+        self.scenarios.insert_criterion(index, weight, [row[index] for row in self.decision_matrix],
+                                        (linked or {}).get('scenarios'))
+        self._invalidate_results()
+        return index
+    
+    def remove_criterion(self, index: int) -> Tuple[str, float, str, List[Optional[float]], Dict[str, Any]]:
+        """Remove a criteria and return its name, weight, type, matrix column and linked state"""
+        name = self.criteria.pop(index)
+        weight = self.weights[index]
+        self.weights = remove_weight(self.weights, index).tolist()
+        if self.weight_method != 'manual':
+            weight = self.manual_weights[index]
+            self.manual_weights = remove_weight(self.manual_weights, index).tolist()
+        comparisons = self.ahp.remove(index) if self.ahp is not None else None
+        if self.fuzzy_weights is not None:
+            weight = cell_value(self.fuzzy_weights[index])
+            self.fuzzy_weights = np.delete(self.fuzzy_weights, index, axis=0)
+        criteria_type = self.criteria_types.pop(index)
+        column = [row.pop(index) for row in self.decision_matrix]
+        column = self._delete_cells(index, axis=1) or column
+        linked = {'scenarios': self.scenarios.remove_criterion(index), 'ahp': comparisons}
+        self._invalidate_results()
+        return name, weight, criteria_type, column, linked
+    
+    def set_value(self, row: int, column: int, value: Optional[float]) -> Optional[float]:
+        """Set one matrix cell (number, None, (low, high) or (l, m, u)) and return the previous value"""
+        old_value = self.cell(row, column)
+        self._prepare_cells([value])
+        self.decision_matrix[row][column] = crisp_value(value)
+        store = self._cell_store()
+        if store is not None:
+            name, to_array, _ = store
+            getattr(self, name)[row, column] = to_array(value)
+        self._invalidate_results()
+        return old_value
+    
+    def cell(self, row: int, column: int):
+        """Matrix cell as entered: None, a number, a (low, high) range or an (l, m, u) tuple"""
+        store = self._cell_store()
+        if store is not None:
+            name, _, from_array = store
+            return from_array(getattr(self, name)[row, column])
+        return self.decision_matrix[row][column]
+    
+    def weight_inputs(self) -> list:
+        """Weights as entered: (l, m, u) tuples when fuzzy weights are set"""
+        if self.fuzzy_weights is not None:
+            return [cell_value(triple) for triple in self.fuzzy_weights]
+        return list(self.weights)
+    
+    def set_fuzzy(self, enabled: bool):
+        """Switch fuzzy mode; crisp cells become (x, x, x) and back to their defuzzified value"""
+        if enabled == (self.fuzzy_matrix is not None):
+            return
+        if enabled:
+            cells = np.array(self.decision_matrix, dtype=float).reshape(len(self.alternatives), len(self.criteria))
+            if self.interval_matrix is not None:
+                # Ranges become (low, midpoint, high)
+                self.fuzzy_matrix = np.stack([self.interval_matrix[:, :, 0], cells,
+                                              self.interval_matrix[:, :, 1]], axis=2)
+                self.interval_matrix = None
+            else:
+                self.fuzzy_matrix = np.repeat(cells[:, :, None], 3, axis=2)
+        else:
+            self.fuzzy_matrix = None
+            self.fuzzy_weights = None
+        self._invalidate_results()
+    
+    def has_complete_matrix(self) -> bool:
+        """True when every cell of the (alternatives x criteria) matrix has a value"""
+        if not self.alternatives or not self.criteria or len(self.decision_matrix) != len(self.alternatives):
+            return False
+        return all(len(row) == len(self.criteria) and
+                   all(value is not None and value == value for value in row)
+                   for row in self.decision_matrix)
+    
+    def has_scorable_matrix(self) -> bool:
+        """True when the matrix is fully shaped and its missing cells (if any) can be imputed"""
+        if not self.alternatives or not self.criteria or len(self.decision_matrix) != len(self.alternatives):
+            return False
+        if any(len(row) != len(self.criteria) for row in self.decision_matrix):
+            return False
+        return self.imputation is not None or self.has_complete_matrix()
+    
+    def missing_count(self) -> int:
+        """Number of missing cells (filled by the imputation method when scoring)"""
+        return int(np.isnan(np.asarray(self.decision_matrix, dtype=float)).sum()) if self.decision_matrix else 0
+    
+    def set_imputation(self, method: Optional[str]):
+        """Choose how missing cells are filled: 'mean', 'median', 'worst' or None (reject)"""
+        if method != self.imputation:
+            self.imputation = method
+            self._invalidate_results()
+    
+    def set_dtype(self, dtype):
+        """Switch the numeric core between float64 and float32"""
+        dtype = np.dtype(dtype)
+        if dtype not in (np.float32, np.float64):
+            raise ValueError("Compute dtype must be float32 or float64")
+        if dtype != self.dtype:
+            self.dtype = dtype
+            self._matrix_array = None
+            self._pareto = None
+            self._column_stats = None
+            self.normalized_matrix = None
+            self.fuzzy_normalized = None
+    
+    def matrix_array(self) -> np.ndarray:
+        """The decision matrix as a cached array of the compute dtype, missing cells imputed"""
+        if self._matrix_array is None:
+            self._matrix_array = impute(np.asarray(self.decision_matrix, dtype=self.dtype),
+                                        self.criteria_types, self.imputation)
+        return self._matrix_array
+    
+    @staticmethod
+    def normalize_array(matrix: np.ndarray, criteria_types: List[str], 
+                        dtype=np.float64) -> np.ndarray:
+        """Normalize a decision matrix column-wise according to the criteria types"""
+        matrix = np.asarray(matrix, dtype=dtype)
+        is_benefit = np.array([t == 'benefit' for t in criteria_types], dtype=bool)
+        
+        # For benefit criteria: R_ij = X_ij / max(X_ij)
+        # For cost criteria: R_ij = min(X_ij) / X_ij
+        max_vals = matrix.max(axis=0)
+        min_vals = matrix.min(axis=0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            normalized_matrix = np.where(is_benefit, matrix / max_vals, min_vals / matrix)
+        
+        # Columns without a positive extreme value stay zero
+        valid = np.where(is_benefit, max_vals > 0, min_vals > 0)
+        normalized_matrix[:, ~valid] = 0.0
+        return normalized_matrix
+    
+    @timed('model.normalize_matrix')
     def normalize_matrix(self) -> np.ndarray:
         """Normalize the decision matrix"""
         if not self.decision_matrix:
             raise ValueError("Decision matrix is empty")
-            
-        matrix = np.array(self.decision_matrix)
-        normalized_matrix = np.zeros_like(matrix, dtype=float)
-        
-        for j in range(len(self.criteria)):
-            if self.criteria_types[j] == 'benefit':
-                # For benefit criteria: R_ij = X_ij / max(X_ij)
-                max_val = np.max(matrix[:, j])
-                if max_val > 0:
-                    normalized_matrix[:, j] = matrix[:, j] / max_val
-            else:
-                # For cost criteria: R_ij = min(X_ij) / X_ij
-                min_val = np.min(matrix[:, j])
-                if min_val > 0:
-                    normalized_matrix[:, j] = min_val / matrix[:, j]
+        
+        if self.fuzzy_matrix is not None:
+            # Crisp weights give defuzzify(sum r (x) w) = defuzzify(r) @ w, so every
+            # weight-sweeping analysis runs unchanged on the defuzzified matrix
+            fuzzy_matrix = impute(self.fuzzy_matrix.astype(self.dtype, copy=False), self.criteria_types,
+                                  self.imputation)
+            self.fuzzy_normalized = normalize_fuzzy(fuzzy_matrix, self.criteria_types, self.dtype)
+            normalized_matrix = defuzzify(self.fuzzy_normalized)
+        else:
+            normalized_matrix = self.normalize_array(self.matrix_array(), self.criteria_types, self.dtype)
         
         self.normalized_matrix = normalized_matrix
         return normalized_matrix
     
-    def calculate_scores(self) -> List[Tuple[str, float]]:
-        """Calculate SAW scores for all alternatives"""
+    def score_vector(self, weights: Optional[List[float]] = None) -> np.ndarray:
+        """Get SAW scores in input order for the given (default: current) weights"""
+        if self.normalized_matrix is None:
+            self.normalize_matrix()
+        
+        weights = np.asarray(self.weights if weights is None else weights, dtype=float)
+        if self.normalized_matrix.dtype == np.float64:
+            return self.normalized_matrix @ weights
+        return self.weighted_scores(weights[None, :])[0]
+    
+    def weighted_scores(self, weight_stack: np.ndarray) -> np.ndarray:
+        """(weight vectors x alternatives) scores, accumulated in float64 for any compute dtype"""
         if self.normalized_matrix is None:
             self.normalize_matrix()
         
-        scores = []
-        for i, alt in enumerate(self.alternatives):
-            score = np.sum(np.array(self.weights) * self.normalized_matrix[i, :])
-            scores.append((alt, score))
+        matrix = self.normalized_matrix
+        weight_stack = np.asarray(weight_stack, dtype=float)
+        if matrix.dtype == np.float64:
+            return weight_stack @ matrix.T
+        
+        # Upcast cache-sized row blocks of the narrow matrix; the temporary stays bounded
+        rows = max(1, AppConfig.UPCAST_BLOCK_CELLS // max(1, matrix.shape[1]))
+        scores = np.empty((len(weight_stack), matrix.shape[0]))
+        for start in range(0, matrix.shape[0], rows):
+            scores[:, start:start + rows] = weight_stack @ matrix[start:start + rows].astype(np.float64).T
+        return scores
+    
+    def fuzzy_score_matrix(self) -> np.ndarray:
+        """(alternatives x 3) fuzzy SAW scores; crisp weights count as (w, w, w)"""
+        if self.fuzzy_matrix is None and self.fuzzy_weights is None:
+            raise ValueError("Fuzzy mode is not enabled")
+        return fuzzy_scores(self._fuzzy_normalized_matrix(), self._scoring_fuzzy_weights())
+    
+    def _fuzzy_normalized_matrix(self) -> np.ndarray:
+        """(alternatives x criteria x 3) normalized matrix; crisp cells count as (x, x, x)"""
+        if self.normalized_matrix is None:
+            self.normalize_matrix()
+        if self.fuzzy_normalized is not None:
+            return self.fuzzy_normalized
+        return np.repeat(self.normalized_matrix[:, :, None], 3, axis=2)
+    
+    def _scoring_fuzzy_weights(self) -> np.ndarray:
+        """(criteria x 3) weights used for fuzzy scoring"""
+        if self.fuzzy_weights is not None and self.weight_method == 'manual':
+            return normalize_fuzzy_weights(self.fuzzy_weights)
+        return np.repeat(np.asarray(self.weights, dtype=float)[:, None], 3, axis=1)
+    
+    @timed('model.calculate_scores')
+    def calculate_scores(self) -> List[Tuple[str, float]]:
+        """Calculate SAW scores for all alternatives"""
+        if self.weight_method != 'manual':
+            # Derived weights follow the matrix / comparisons; free while cached
+            self.weights = self.derived_weights(self.weight_method).tolist()
+        if self.fuzzy_weights is not None and self.weight_method == 'manual':
+            # Fuzzy weights: the defuzzified score is one product over the
+            # (alternatives x criteria * 3) view of the normalized fuzzy matrix
+            ranking_matrix = self._fuzzy_normalized_matrix().reshape(len(self.alternatives), -1)
+            ranking_weights = score_weights(self._scoring_fuzzy_weights())
+            self.scores = defuzzify(self.fuzzy_score_matrix())
+        else:
+            self.scores = self.score_vector()
+            ranking_matrix, ranking_weights = self.normalized_matrix, np.asarray(self.weights, dtype=float)
         
         # Sort by score descending
-        scores.sort(key=lambda x: x[1], reverse=True)
+        if self.ranking_mode == 'tie_aware':
+            order, self.scores, groups = tie_aware_ranking(
+                ranking_matrix, ranking_weights, self.scores,
+                self.tie_tolerance, self.tie_break, self.alternatives)
+            self.tie_groups = groups
+        else:
+            order = np.argsort(-self.scores, kind='stable')
+            self.tie_groups = []
+        scores = [(self.alternatives[i], self.scores[i]) for i in order]
         self.results = scores
+        self.mark_dirty('results')
+        if self.recorder is not None:
+            self.recorder.record_scores(self)
         return scores
     
+    @timed('model.validate_dtype')
+    def validate_dtype(self, tolerance: float = AppConfig.DTYPE_TOLERANCE) -> Dict[str, Any]:
+        """Compare scores and ranking of the compute dtype against a float64 reference"""
+        scores = self.score_vector()
+        if self.fuzzy_matrix is not None:
+            reference_matrix = defuzzify(normalize_fuzzy(
+                impute(self.fuzzy_matrix, self.criteria_types, self.imputation), self.criteria_types))
+        else:
+            reference_matrix = self.normalize_array(
+                impute(np.asarray(self.decision_matrix, dtype=np.float64), self.criteria_types, self.imputation),
+                self.criteria_types)
+        reference = reference_matrix @ np.asarray(self.weights, dtype=float)
+        
+        order = np.argsort(-scores, kind='stable')
+        reference_order = np.argsort(-reference, kind='stable')
+        # A swapped position only counts when the float64 scores are further apart than the tolerance
+        swapped = np.abs(reference[order] - reference[reference_order]) > tolerance
+        max_error = float(np.abs(scores - reference).max()) if len(scores) else 0.0
+        
+        return {
+            'dtype': str(self.normalized_matrix.dtype),
+            'max_score_error': max_error,
+            'rank_mismatches': int(swapped.sum()),
+            'winner_match': bool(len(order) == 0 or not swapped[0]),
+            'ok': max_error <= tolerance and not swapped.any()
+        }
+    
+    def interval_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(low, high) cell arrays, missing cells imputed; fuzzy cells give their (l, u) support"""
+        if self.interval_matrix is not None:
+            low, high = self.interval_matrix[:, :, 0], self.interval_matrix[:, :, 1]
+        elif self.fuzzy_matrix is not None:
+            low, high = self.fuzzy_matrix[:, :, 0], self.fuzzy_matrix[:, :, 2]
+        else:
+            low = high = np.asarray(self.decision_matrix, dtype=float)
+        return (impute(low, self.criteria_types, self.imputation),
+                impute(high, self.criteria_types, self.imputation))
+    
+    @timed('model.score_bounds')
+    def score_bounds(self, weights: Optional[List[float]] = None) -> Dict[str, Any]:
+        """Worst- and best-case score and rank of every alternative over its interval cells"""
+        low, high = self.interval_arrays()
+        weights = np.asarray(self.weights if weights is None else weights, dtype=float)
+        worst, best = score_bounds(low, high, weights, self.criteria_types)
+        best_rank, worst_rank = rank_bounds(worst, best)
+        return {
+            'worst': worst,
+            'best': best,
+            'best_rank': best_rank,
+            'worst_rank': worst_rank
+        }
+    
+    def pareto_front(self) -> Optional[np.ndarray]:
+        """Indices of the non-dominated alternatives, or None when the front is too large to help"""
+        if self.normalized_matrix is None:
+            self.normalize_matrix()
+        
+        # Cached together with the normalized matrix it was computed from
+        if self._pareto is None or self._pareto[0] is not self.normalized_matrix:
+            front = pareto_front(self.normalized_matrix)
+            rows = None if front is None else self.normalized_matrix[front].astype(np.float64)
+            self._pareto = (self.normalized_matrix, front, rows)
+        return self._pareto[1]
+    
+    def winner_indices(self, weight_stack: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Winner index and score for every weight vector of a (vectors x criteria) stack"""
+        weight_stack = np.asarray(weight_stack, dtype=float)
+        winners = np.empty(len(weight_stack), dtype=np.intp)
+        winner_scores = np.empty(len(weight_stack))
+        
+        # With strictly positive weights a dominated alternative can never win, so
+        # only the Pareto front has to be scored. Building the front costs about as
+        # much as a few hundred weight vectors; small stacks only use a cached one.
+        if self.normalized_matrix is None:
+            self.normalize_matrix()
+        cached = self._pareto is not None and self._pareto[0] is self.normalized_matrix
+        front = None
+        if (weight_stack > 0).all() and (cached or len(weight_stack) >= AppConfig.PARETO_MIN_VECTORS):
+            front = self.pareto_front()
+        if front is None:
+            for start, scores in self.iter_weight_stack_scores(weight_stack):
+                best = np.argmax(scores, axis=1)
+                winners[start:start + len(scores)] = best
+                winner_scores[start:start + len(scores)] = scores[np.arange(len(scores)), best]
+            return winners, winner_scores
+        
+        front_rows = self._pareto[2]
+        chunk = max(1, AppConfig.SCORE_CHUNK_CELLS // max(1, len(front)))
+        for start in range(0, len(weight_stack), chunk):
+            scores = weight_stack[start:start + chunk] @ front_rows.T
+            best = np.argmax(scores, axis=1)
+            winners[start:start + len(scores)] = front[best]
+            winner_scores[start:start + len(scores)] = scores[np.arange(len(scores)), best]
+        return winners, winner_scores
+    
+    def winner(self, weights: Optional[List[float]] = None) -> Tuple[str, float]:
+        """Best alternative and its score for the given (default: current) weights"""
+        weights = np.asarray(self.weights if weights is None else weights, dtype=float)
+        winners, winner_scores = self.winner_indices(weights[None, :])
+        return self.alternatives[winners[0]], winner_scores[0]
+    
+    def column_statistics(self) -> Dict[str, np.ndarray]:
+        """Column statistics of the normalized matrix (cached with it)"""
+        if self.normalized_matrix is None:
+            self.normalize_matrix()
+        if self._column_stats is None or self._column_stats[0] is not self.normalized_matrix:
+            self._column_stats = (self.normalized_matrix, column_statistics(self.normalized_matrix))
+        return self._column_stats[1]
+    
+    @timed('model.objective_weights')
+    def objective_weights(self, method: str) -> np.ndarray:
+        """Weights derived from the decision matrix (entropy, critic or std)"""
+        return objective_weights(self.column_statistics(), method)
+    
+    def derived_weights(self, method: str) -> np.ndarray:
+        """Weights of an AHP, criteria tree or objective weighting method"""
+        if method == 'ahp':
+            if self.ahp is None or len(self.ahp) != len(self.criteria):
+                raise ValueError("Pairwise comparisons are missing")
+            return self.ahp.weights()
+        if method == 'tree':
+            if self.criteria_tree is None:
+                raise ValueError("Criteria tree is missing")
+            return self.criteria_tree.criteria_weights(self.criteria)
+        return self.objective_weights(method)
+    
+    def set_weight_method(self, method: str) -> List[float]:
+        """Switch between the manual weights and an AHP or objective weighting method"""
+        if method == self.weight_method and method not in ('ahp', 'tree'):
+            return self.weights
+        if self.weight_method == 'manual':
+            self.manual_weights = list(self.weights)
+        weights = self.manual_weights if method == 'manual' else self.derived_weights(method).tolist()
+        
+        # Only the scores depend on the weights; the normalized matrix and its
+        # statistics stay cached
+        self.weights = list(weights)
+        self.weight_method = method
+        self.results = []
+        self.scores = None
+        self.tie_groups = []
+        self.scenarios.scores = None
+        self.mark_dirty('weights', 'results')
+        return self.weights
+    
+    def top_k(self, k: int, weights: Optional[List[float]] = None) -> List[Tuple[str, float]]:
+        """Get the k best alternatives without sorting the full ranking"""
+        scores = self.score_vector(weights)
+        return [(self.alternatives[i], scores[i]) for i in top_k_indices(scores, k)]
+    
+    def lazy_ranking(self, weights: Optional[List[float]] = None) -> LazyRanking:
+        """Get a ranking that is only sorted as far as it is read"""
+        return LazyRanking(self.alternatives, self.score_vector(weights))
+    
+    @timed('model.get_calculation_steps')
     def get_calculation_steps(self) -> Dict[str, Any]:
         """Get detailed calculation steps for display"""
         if not self.decision_matrix:
             raise ValueError("No data available for calculation")
         
-        matrix = np.array(self.decision_matrix)
+        matrix = np.array(self.decision_matrix, dtype=float)
         normalized_matrix = self.normalize_matrix()
         scores = self.calculate_scores()
         
@@ -83,56 +631,306 @@ class SAWModel:
             'scores': scores,
             'alternatives': self.alternatives,
             'criteria': self.criteria,
-            'criteria_types': self.criteria_types
+            'criteria_types': self.criteria_types,
+            'tie_groups': self.tie_groups
         }
+        if self.weight_method == 'tree':
+            steps['tree_rollup'] = self.tree_rollup()
+        missing = self.missing_count()
+        if missing:
+            steps['missing'] = {'count': missing, 'method': self.imputation}
+        if self.interval_matrix is not None:
+            steps['score_bounds'] = self.score_bounds()
+        if self.fuzzy_matrix is not None:
+            steps['fuzzy'] = {
+                'matrix': self.fuzzy_matrix,
+                'weights': self._scoring_fuzzy_weights(),
+                'normalized': self.fuzzy_normalized,
+                'scores': self.fuzzy_score_matrix()
+            }
         
         return steps
     
-    def sensitivity_analysis(self, criteria_index: int, weight_range: float) -> List[Dict]:
+    def sensitivity_weights(self, criteria_index: int, 
+                            weight_range: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get weight changes, new weights and the renormalized (steps x criteria) weight stack"""
+        weights = np.asarray(self.weights, dtype=float)
+        original_weight = weights[criteria_index]
+        step = AppConfig.SENSITIVITY_STEP
+        weight_changes = np.arange(-weight_range, weight_range + step / 2, step)
+        new_weights = original_weight + weight_changes
+        
+        valid = (new_weights > 0) & (new_weights < 1)
+        weight_changes = weight_changes[valid]
+        new_weights = new_weights[valid]
+        
+        # Renormalize other weights so the vector keeps summing to one
+        weight_stack = np.tile(weights, (len(new_weights), 1))
+        other_weights_sum = weights.sum() - original_weight
+        if other_weights_sum > 0:
+            weight_stack *= ((1 - new_weights) / other_weights_sum)[:, None]
+        weight_stack[:, criteria_index] = new_weights
+        
+        return weight_changes, new_weights, weight_stack
+    
+    def iter_weight_stack_scores(self, weight_stack: np.ndarray):
+        """Yield (start, scores) chunks of (steps x alternatives) scores with bounded memory"""
+        if self.normalized_matrix is None:
+            self.normalize_matrix()
+        
+        n_alternatives = max(1, len(self.alternatives))
+        chunk = max(1, AppConfig.SCORE_CHUNK_CELLS // n_alternatives)
+        for start in range(0, len(weight_stack), chunk):
+            yield start, self.weighted_scores(weight_stack[start:start + chunk])
+    
+    @timed('model.sensitivity_analysis')
+    def sensitivity_analysis(self, criteria_index: int, weight_range: float,
+                             top_k: Optional[int] = 1, correlations: bool = False) -> List[Dict]:
         """Perform sensitivity analysis on a specific criteria"""
+        # top_k sets how much of each step's ranking is kept in 'full_results':
+        # 1 = winner only, k = k best alternatives, None = full ranking.
+        # correlations adds each step's rank agreement with the base ranking
         if not self.results:
             raise ValueError("No results available. Calculate SAW first.")
         
-        original_weight = self.weights[criteria_index]
-        weight_changes = np.arange(-weight_range, weight_range + 0.01, 0.02)
+        weight_changes, new_weights, weight_stack = self.sensitivity_weights(
+            criteria_index, weight_range)
+        k = len(self.alternatives) if top_k is None else top_k
         sensitivity_results = []
         
-        matrix = np.array(self.decision_matrix)
-        
-        for change in weight_changes:
-            new_weight = original_weight + change
-            if new_weight <= 0 or new_weight >= 1:
-                continue
-            
-            # Adjust weights
-            temp_weights = self.weights.copy()
-            temp_weights[criteria_index] = new_weight
-            
-            # Renormalize other weights
-            other_weights_sum = sum(temp_weights) - new_weight
-            if other_weights_sum > 0:
-                for i in range(len(temp_weights)):
-                    if i != criteria_index:
-                        temp_weights[i] = temp_weights[i] * (1 - new_weight) / other_weights_sum
-            
-            # Recalculate scores with new weights
-            scores = []
-            for i in range(len(self.alternatives)):
-                score = np.sum(temp_weights * self.normalized_matrix[i, :])
-                scores.append((self.alternatives[i], score))
-            
-            scores.sort(key=lambda x: x[1], reverse=True)
-            
+        if k == 1:
+            # Winner-only sweep: may run over the Pareto front alone
+            winners, winner_scores = self.winner_indices(weight_stack)
+            ranked_steps = [[(self.alternatives[i], score)] for i, score in zip(winners, winner_scores)]
+        else:
+            ranked_steps = []
+            step_metrics = []
+            for start, scores in self.iter_weight_stack_scores(weight_stack):
+                for row, order in enumerate(top_k_indices(scores, k)):
+                    ranked_steps.append([(self.alternatives[i], scores[row, i]) for i in order])
+                if correlations:
+                    # Reuse the score block instead of scoring the sweep again
+                    step_metrics.append((start, len(scores), self.rank_correlations(scores)))
+        
+        for step, full_results in enumerate(ranked_steps):
             sensitivity_results.append({
-                'change': change,
-                'new_weight': new_weight,
-                'winner': scores[0][0],
-                'score': scores[0][1],
-                'full_results': scores
+                'change': weight_changes[step],
+                'new_weight': new_weights[step],
+                'winner': full_results[0][0],
+                'score': full_results[0][1],
+                'full_results': full_results
             })
+        if correlations and k == 1:
+            # The winner-only sweep never built full score rows
+            for start, scores in self.iter_weight_stack_scores(weight_stack):
+                self._attach_correlations(sensitivity_results[start:start + len(scores)], scores)
+        elif correlations:
+            for start, count, metrics in step_metrics:
+                self._attach_metrics(sensitivity_results[start:start + count], metrics)
+        
+        if self.recorder is not None:
+            self.recorder.record_sensitivity(self, criteria_index, weight_range, sensitivity_results)
+        return sensitivity_results
+    
+    def sensitivity_all_criteria(self, weight_range: float, 
+                                 workers: Optional[int] = AppConfig.PARALLEL_WORKERS) -> Dict[str, Any]:
+        """Sweep every criteria (in parallel for large matrices) with a tornado summary"""
+        return ParallelSensitivityAnalyzer(self, workers).analyze_all(weight_range)
+    
+    def tree_rollup(self) -> Dict[str, Any]:
+        """Partial score of every criteria tree node per alternative (cached segment sums)"""
+        if self.criteria_tree is None:
+            raise ValueError("Criteria tree is missing")
+        if self.normalized_matrix is None:
+            self.normalize_matrix()
         
+        layout = self.criteria_tree.compile(self.criteria)
+        return {
+            'nodes': [self.criteria_tree.names[node] for node in layout['order']],
+            'depth': layout['depth'][layout['order']],
+            'global_weights': layout['global_weights'][layout['order']],
+            'partial_scores': self.criteria_tree.partial_scores(
+                self.normalized_matrix, self.criteria)[:, layout['order']],
+            'top_level': [self.criteria_tree.names[node] for node in layout['roots']]
+        }
+    
+    @timed('model.tree_sensitivity')
+    def tree_sensitivity(self, node_name: str, weight_range: float,
+                         correlations: bool = False) -> List[Dict]:
+        """Winner-only sensitivity of a criteria tree node's local weight (whole subtree)"""
+        if not self.results:
+            raise ValueError("No results available. Calculate SAW first.")
+        if self.weight_method != 'tree':
+            raise ValueError("Criteria tree weights are not in use")
+        if self.normalized_matrix is None:
+            self.normalize_matrix()
+        
+        tree = self.criteria_tree
+        node = tree.node(node_name)
+        original_weight = tree.local_weight(self.criteria, node)
+        step = AppConfig.SENSITIVITY_STEP
+        weight_changes = np.arange(-weight_range, weight_range + step / 2, step)
+        new_weights = original_weight + weight_changes
+        valid = (new_weights > 0) & (new_weights < 1)
+        weight_changes, new_weights = weight_changes[valid], new_weights[valid]
+        
+        sensitivity_results = []
+        chunk = max(1, AppConfig.SCORE_CHUNK_CELLS // max(1, len(self.alternatives)))
+        for start in range(0, len(new_weights), chunk):
+            scores = tree.sensitivity_scores(self.normalized_matrix, self.criteria, node,
+                                             new_weights[start:start + chunk])
+            winners = np.argmax(scores, axis=1)
+            for row, index in enumerate(winners):
+                step = start + row
+                score = scores[row, index]
+                sensitivity_results.append({
+                    'change': weight_changes[step],
+                    'new_weight': new_weights[step],
+                    'winner': self.alternatives[index],
+                    'score': score,
+                    'full_results': [(self.alternatives[index], score)]
+                })
+            if correlations:
+                self._attach_correlations(sensitivity_results[start:], scores)
+        if self.recorder is not None:
+            self.recorder.record_tree_sensitivity(self, node_name, weight_range, sensitivity_results)
         return sensitivity_results
     
+    @timed('model.weight_space_map')
+    def weight_space_map(self, criteria_x: int, criteria_y: int,
+                         grid_size: int = AppConfig.WEIGHT_MAP_GRID,
+                         weight_range: Optional[float] = None) -> Dict[str, Any]:
+        """Compute the winner for every point of a two-criteria weight grid"""
+        if not self.results:
+            raise ValueError("No results available. Calculate SAW first.")
+        if criteria_x == criteria_y:
+            raise ValueError("Choose two different criteria")
+        
+        weights = np.asarray(self.weights, dtype=float)
+        
+        def axis_values(index):
+            # Full open interval (0, 1), or original weight ± range
+            if weight_range is None:
+                return np.linspace(0, 1, grid_size + 2)[1:-1]
+            low = max(weights[index] - weight_range, 1e-6)
+            high = min(weights[index] + weight_range, 1 - 1e-6)
+            return np.linspace(low, high, grid_size)
+        
+        x_values = axis_values(criteria_x)
+        y_values = axis_values(criteria_y)
+        grid_x, grid_y = np.meshgrid(x_values, y_values)
+        grid_x, grid_y = grid_x.ravel(), grid_y.ravel()
+        
+        # Renormalize the remaining weights like sensitivity_analysis does
+        others = np.ones(len(weights), dtype=bool)
+        others[[criteria_x, criteria_y]] = False
+        other_weights_sum = weights[others].sum()
+        remaining = 1 - grid_x - grid_y
+        if other_weights_sum > 0:
+            valid = remaining > 0
+        else:
+            valid = np.ones(len(grid_x), dtype=bool)
+            total = grid_x + grid_y
+            grid_x, grid_y, remaining = grid_x / total, grid_y / total, np.zeros_like(total)
+        
+        weight_stack = np.zeros((int(valid.sum()), len(weights)))
+        if other_weights_sum > 0:
+            weight_stack[:, others] = weights[others] * (remaining[valid] / other_weights_sum)[:, None]
+        weight_stack[:, criteria_x] = grid_x[valid]
+        weight_stack[:, criteria_y] = grid_y[valid]
+        
+        # Only the argmax of each row is kept
+        winners, _ = self.winner_indices(weight_stack)
+        
+        winner_grid = np.full(len(valid), -1, dtype=np.intp)
+        winner_grid[valid] = winners
+        winner_grid = winner_grid.reshape(len(y_values), len(x_values))
+        
+        original_winner = self.alternatives.index(self.results[0][0])
+        return {
+            'criteria': (self.criteria[criteria_x], self.criteria[criteria_y]),
+            'x_weights': x_values,
+            'y_weights': y_values,
+            'winner_grid': winner_grid,
+            'original_weights': (weights[criteria_x], weights[criteria_y]),
+            'original_winner': original_winner,
+            'original_winner_share': float(np.mean(winners == original_winner)) if len(winners) else 0.0
+        }
+    
+    @timed('model.monte_carlo_winners')
+    def monte_carlo_winners(self, samples: int = AppConfig.MONTE_CARLO_SAMPLES,
+                            seed: Optional[int] = None) -> Dict[str, Any]:
+        """Winning share of every alternative over uniformly random weight vectors"""
+        if not self.results:
+            raise ValueError("No results available. Calculate SAW first.")
+        
+        rng = np.random.default_rng(seed)
+        weight_stack = rng.dirichlet(np.ones(len(self.criteria)), samples)
+        winners, _ = self.winner_indices(weight_stack)
+        counts = np.bincount(winners, minlength=len(self.alternatives))
+        
+        ranked = np.flatnonzero(counts)
+        ranked = ranked[np.argsort(-counts[ranked], kind='stable')]
+        original_winner = self.results[0][0]
+        return {
+            'samples': samples,
+            'win_share': [(self.alternatives[i], counts[i] / samples) for i in ranked],
+            'original_winner': original_winner,
+            'original_winner_share': counts[self.alternatives.index(original_winner)] / samples
+        }
+    
+    @timed('model.minimum_weight_change')
+    def minimum_weight_change(self, target: int, k: int = 1, norm: str = 'l1') -> Dict[str, Any]:
+        """Smallest weight change that puts an alternative in the top k, over all and per criteria"""
+        if not self.results:
+            raise ValueError("No results available. Calculate SAW first.")
+        if not 1 <= k < len(self.alternatives):
+            raise ValueError("k must be between 1 and the number of alternatives - 1")
+        
+        if self.normalized_matrix is None:
+            self.normalize_matrix()
+        normalized = self.normalized_matrix.astype(np.float64, copy=False)
+        weights = np.asarray(self.weights, dtype=float)
+        scores = normalized @ weights
+        rank = int((scores > scores[target]).sum()) + 1
+        
+        result = {
+            'target': self.alternatives[target],
+            'k': k,
+            'norm': norm,
+            'rank': rank,
+            'already': rank <= k,
+            'single': [],
+            'solution': None
+        }
+        if rank > k:
+            result['solution'] = minimum_weight_change(normalized, weights, target, k, norm)
+            result['single'] = [dict(change, criteria=self.criteria[change['criteria_index']])
+                                for change in single_criterion_changes(normalized, weights, target, k)
+                                if change is not None]
+            result['single'].sort(key=lambda change: abs(change['change']))
+        return result
+    
+    @timed('model.rank_correlations')
+    def rank_correlations(self, score_stack: np.ndarray,
+                          k: int = AppConfig.RANK_OVERLAP_K) -> Dict[str, np.ndarray]:
+        """Spearman, Kendall tau-b and top-k overlap of every (alternatives) score row against the results"""
+        if not self.results:
+            raise ValueError("No results available. Calculate SAW first.")
+        return rank_correlations(self.scores, score_stack, k)
+    
+    def _attach_correlations(self, sensitivity_results: List[Dict], scores: np.ndarray):
+        """Store the rank agreement of each step's scores in its sensitivity result"""
+        self._attach_metrics(sensitivity_results, self.rank_correlations(scores))
+    
+    @staticmethod
+    def _attach_metrics(sensitivity_results: List[Dict], metrics: Dict[str, np.ndarray]):
+        """Copy per-step correlation arrays into the sensitivity results"""
+        for row, result in enumerate(sensitivity_results):
+            for name, values in metrics.items():
+                result[name] = float(values[row])
+    
+    @timed('model.calculate_stability')
     def calculate_stability(self, sensitivity_results: List[Dict]) -> Dict[str, Any]:
         """Calculate decision stability from sensitivity analysis"""
         if not sensitivity_results or not self.results:
@@ -151,12 +949,19 @@ class SAWModel:
         else:
             level = 'TIDAK STABIL'
         
-        return {
+        stability_info = {
             'stability': stability,
             'level': level,
             'original_winner': original_winner,
             'winners': winners
         }
+        # Reshuffling below first place, when the sweep measured it
+        if 'kendall' in sensitivity_results[0]:
+            for name in ('spearman', 'kendall', 'top_k_overlap'):
+                values = np.array([result[name] for result in sensitivity_results])
+                stability_info[name] = float(np.nanmean(values))
+                stability_info[f'min_{name}'] = float(np.nanmin(values))
+        return stability_info
     
     def reset(self):
         """Reset all data"""
@@ -166,4 +971,21 @@ class SAWModel:
         self.decision_matrix = []
         self.criteria_types = []
         self.results = []
-        self.normalized_matrix = None
\ No newline at end of file
+        self.normalized_matrix = None
+        self.fuzzy_matrix = None
+        self.fuzzy_weights = None
+        self.fuzzy_normalized = None
+        self.interval_matrix = None
+        self._matrix_array = None
+        self._pareto = None
+        self._column_stats = None
+        self.weight_method = 'manual'
+        self.manual_weights = []
+        self.ahp = None
+        self.criteria_tree = None
+        self.scores = None
+        self.tie_groups = []
+        self.scenarios.clear()
+        self.analyses = {}
+        self.history.clear()
+        self.mark_dirty()
\ No newline at end of file
@@ -0,0 +1,216 @@
+import numpy as np
+from typing import List, Tuple, Dict, Optional
+from utils.instrumentation import timed
+
+
+def insert_weight(weights: np.ndarray, index: int, weight: float) -> np.ndarray:
+    """Insert a weight and rescale the others to fill the rest, so the vector keeps summing to one
+
+    Inverse of remove_weight: removing the inserted weight restores the original vector.
+    """
+    weights = np.asarray(weights, dtype=float)
+    others_sum = weights.sum()
+    if others_sum > 0 and 0 <= weight < 1:
+        weights = weights * ((1 - weight) / others_sum)
+    weights = np.insert(weights, index, weight)
+    total_weight = weights.sum()
+    return weights / total_weight if total_weight > 0 else weights
+
+
+def remove_weight(weights: np.ndarray, index: int) -> np.ndarray:
+    """Delete a weight and renormalize the rest"""
+    weights = np.delete(np.asarray(weights, dtype=float), index)
+    total_weight = weights.sum()
+    return weights / total_weight if total_weight > 0 else weights
+
+
+class ScenarioManager:
+    """Named weight / matrix scenarios scored together as one stacked tensor"""
+
+    def __init__(self, model):
+        self.model = model
+        self._scenarios = {}  # name -> (weights or None, decision matrix or None)
+        self.names = []
+        self.scores = None  # (scenarios x alternatives), aligned with model.alternatives
+
+    def add_scenario(self, name: str, weights: Optional[List[float]] = None,
+                     decision_matrix: Optional[List[List[float]]] = None):
+        """Register a scenario; missing parts fall back to the model's current data"""
+        if not name or not name.strip():
+            raise ValueError("Scenario name is empty")
+
+        n_criteria = len(self.model.criteria)
+        if weights is not None:
+            weights = np.asarray(weights, dtype=float)
+            if weights.shape != (n_criteria,):
+                raise ValueError("Scenario weights do not match the number of criteria")
+            total_weight = weights.sum()
+            if total_weight > 0:
+                weights = weights / total_weight
+
+        if decision_matrix is not None:
+            decision_matrix = np.asarray(decision_matrix, dtype=float)
+            if decision_matrix.shape != (len(self.model.alternatives), n_criteria):
+                raise ValueError("Scenario matrix does not match the decision matrix shape")
+
+        self._scenarios[name.strip()] = (weights, decision_matrix)
+        self.scores = None
+        self.model.mark_dirty('analyses')
+
+    def remove_scenario(self, name: str):
+        """Remove a scenario by name"""
+        self._scenarios.pop(name, None)
+        self.scores = None
+        self.model.mark_dirty('analyses')
+
+    def clear(self):
+        """Remove all scenarios"""
+        self._scenarios = {}
+        self.names = []
+        self.scores = None
+        self.model.mark_dirty('analyses')
+
+    # Structural edits keep every stored scenario aligned with the model: the same
+    # row / column is inserted or deleted, and the removed values come back on undo
+
+    def insert_criterion(self, index: int, weight: float, column: List[Optional[float]],
+                         parts: Optional[Dict[str, tuple]] = None):
+        """Insert criteria index; parts (from remove_criterion) restores the removed values"""
+        if not self._scenarios:
+            return
+        for name, (weights, matrix) in self._scenarios.items():
+            scenario_weight, scenario_column = (parts or {}).get(name, (weight, column))
+            if weights is not None:
+                weights = insert_weight(weights, index, scenario_weight)
+            if matrix is not None:
+                matrix = np.insert(matrix, index, np.array(scenario_column, dtype=float), axis=1)
+            self._scenarios[name] = (weights, matrix)
+        self._structure_changed()
+
+    def remove_criterion(self, index: int) -> Dict[str, tuple]:
+        """Delete criteria index from every scenario and return the removed (weight, column) per scenario"""
+        parts = {}
+        if not self._scenarios:
+            return parts
+        for name, (weights, matrix) in self._scenarios.items():
+            parts[name] = (None if weights is None else float(weights[index]),
+                           None if matrix is None else matrix[:, index].copy())
+            if weights is not None:
+                weights = remove_weight(weights, index)
+            if matrix is not None:
+                matrix = np.delete(matrix, index, axis=1)
+            self._scenarios[name] = (weights, matrix)
+        self._structure_changed()
+        return parts
+
+    def insert_alternative(self, index: int, row: List[Optional[float]],
+                           parts: Optional[Dict[str, np.ndarray]] = None):
+        """Insert alternative index into the scenario matrices; parts restores the removed rows"""
+        if not self._scenarios:
+            return
+        for name, (weights, matrix) in self._scenarios.items():
+            if matrix is not None:
+                scenario_row = (parts or {}).get(name, row)
+                matrix = np.insert(matrix, index, np.array(scenario_row, dtype=float), axis=0)
+                self._scenarios[name] = (weights, matrix)
+        self._structure_changed()
+
+    def remove_alternative(self, index: int) -> Dict[str, np.ndarray]:
+        """Delete alternative index from the scenario matrices and return the removed rows"""
+        parts = {}
+        if not self._scenarios:
+            return parts
+        for name, (weights, matrix) in self._scenarios.items():
+            if matrix is not None:
+                parts[name] = matrix[index].copy()
+                self._scenarios[name] = (weights, np.delete(matrix, index, axis=0))
+        self._structure_changed()
+        return parts
+
+    def discard_mismatched(self) -> List[str]:
+        """Drop scenarios whose shape no longer fits the model (after set_data); returns their names"""
+        n_criteria, n_alternatives = len(self.model.criteria), len(self.model.alternatives)
+        dropped = [name for name, (weights, matrix) in self._scenarios.items()
+                   if (weights is not None and weights.shape != (n_criteria,))
+                   or (matrix is not None and matrix.shape != (n_alternatives, n_criteria))]
+        for name in dropped:
+            del self._scenarios[name]
+        if dropped:
+            self._structure_changed()
+        return dropped
+
+    def _structure_changed(self):
+        """Stored scores no longer line up with the model"""
+        self.names = []
+        self.scores = None
+        self.model.mark_dirty('analyses')
+
+    def __len__(self):
+        return len(self._scenarios)
+
+    @timed('model.scenarios.compute')
+    def compute(self) -> np.ndarray:
+        """Score every scenario in one pass and return the (scenarios x alternatives) array"""
+        if not self._scenarios:
+            raise ValueError("No scenarios defined")
+
+        model = self.model
+        if model.normalized_matrix is None:
+            model.normalize_matrix()
+
+        names = list(self._scenarios.keys())
+        base_weights = np.asarray(model.weights, dtype=float)
+        weight_stack = np.empty((len(names), len(model.criteria)))
+        matrix_rows = []
+
+        for s, name in enumerate(names):
+            weights, matrix = self._scenarios[name]
+            weight_stack[s] = base_weights if weights is None else weights
+            if matrix is not None:
+                matrix_rows.append(s)
+
+        # Weight-only scenarios share the base normalized matrix: one matrix product
+        scores = model.weighted_scores(weight_stack)
+
+        # Matrix variants are normalized as a stack and contracted together; cells a
+        # variant lacks (rows / columns added after it was saved) come from the model
+        if matrix_rows:
+            base_matrix = model.matrix_array()
+            variant_stack = np.stack([
+                model.normalize_array(np.where(np.isnan(self._scenarios[names[s]][1]), base_matrix,
+                                               self._scenarios[names[s]][1]), model.criteria_types)
+                for s in matrix_rows
+            ])
+            scores[matrix_rows] = np.einsum('snc,sc->sn', variant_stack, weight_stack[matrix_rows])
+
+        self.names = names
+        self.scores = scores
+        return scores
+
+    def get_results(self, name: str) -> List[Tuple[str, float]]:
+        """Get the sorted (alternative, score) ranking of one scenario"""
+        if self.scores is None:
+            self.compute()
+
+        row = self.scores[self.names.index(name)]
+        order = np.argsort(-row, kind='stable')
+        return [(self.model.alternatives[i], float(row[i])) for i in order]
+
+    @timed('model.scenarios.rank_correlations')
+    def rank_correlations(self) -> Dict[str, np.ndarray]:
+        """Spearman, Kendall tau-b and top-k overlap of every scenario ranking against the current results"""
+        if self.scores is None:
+            self.compute()
+        return self.model.rank_correlations(self.scores)
+
+    def get_comparison_data(self) -> Dict[str, object]:
+        """Get aligned arrays for charts and exporters"""
+        if self.scores is None:
+            self.compute()
+
+        return {
+            'scenario_names': list(self.names),
+            'alternatives': list(self.model.alternatives),
+            'scores': self.scores,
+            'correlations': self.rank_correlations() if self.model.results else None
+        }
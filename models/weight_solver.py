@@ -0,0 +1,189 @@
+import numpy as np
+from scipy.optimize import linprog
+from typing import Dict, Any, List, Optional
+
+from config.settings import AppConfig
+
+
+NORMS = ('l1', 'linf')
+
+
+def _competitor_rows(normalized: np.ndarray, target: int) -> np.ndarray:
+    """Competitors that can ever be ahead of the target (those it dominates never are)"""
+    advantage = normalized[target] - normalized
+    beatable = (advantage < 0).any(axis=1)
+    beatable[target] = False
+    return np.flatnonzero(beatable)
+
+
+def single_competitor_costs(advantage: np.ndarray, weights: np.ndarray, margin: float) -> np.ndarray:
+    """Smallest L1 weight change that puts the target ahead of each competitor alone
+
+    advantage rows are R_target - R_competitor. The optimum moves weight from the
+    criteria with the lowest advantage (lowest first) to the one with the highest,
+    which is a sort and a cumulative sum per row.
+    """
+    gap = margin - advantage @ weights
+    order = np.argsort(advantage, axis=1)
+    sorted_advantage = np.take_along_axis(advantage, order, axis=1)
+    sorted_weights = weights[order]
+    best = sorted_advantage[:, -1:]
+    # Gain per unit of weight moved from each criteria to the best one
+    gain = best - sorted_advantage
+    capacity = np.cumsum(sorted_weights * gain, axis=1)
+    moved_before = np.cumsum(sorted_weights, axis=1) - sorted_weights
+    capacity_before = capacity - sorted_weights * gain
+
+    # First criteria whose weight covers the remaining gap
+    enough = capacity >= gap[:, None]
+    reachable = enough.any(axis=1)
+    step = np.argmax(enough, axis=1)
+    rows = np.arange(len(gap))
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        partial = (gap - capacity_before[rows, step]) / gain[rows, step]
+        moved = moved_before[rows, step] + np.nan_to_num(partial)
+        costs = np.where(reachable, 2 * moved, np.inf)
+    return np.where(gap <= 0, 0.0, costs)
+
+
+def _solve_lp(advantage: np.ndarray, weights: np.ndarray, norm: str, margin: float):
+    """Closest weights (L1 or Linf) on the simplex with advantage @ w >= margin, or None"""
+    n_criteria = len(weights)
+    n_rows = len(advantage)
+    if norm == 'l1':
+        # w' = w + p - q with p, q >= 0; minimize sum(p + q)
+        cost = np.ones(2 * n_criteria)
+        a_ub = np.hstack([-advantage, advantage]) if n_rows else None
+        b_ub = advantage @ weights - margin if n_rows else None
+        a_eq = np.hstack([np.ones(n_criteria), -np.ones(n_criteria)])[None, :]
+        # w' >= 0: q_j - p_j <= w_j
+        non_negative = np.hstack([-np.eye(n_criteria), np.eye(n_criteria)])
+        a_ub = non_negative if a_ub is None else np.vstack([a_ub, non_negative])
+        b_ub = weights if b_ub is None else np.concatenate([b_ub, weights])
+        result = linprog(cost, A_ub=a_ub, b_ub=b_ub, A_eq=a_eq, b_eq=[0.0],
+                         bounds=[(0, None)] * (2 * n_criteria), method='highs')
+        if not result.success:
+            return None
+        return weights + result.x[:n_criteria] - result.x[n_criteria:]
+
+    # Linf: variables (w', s); minimize s with |w' - w| <= s
+    cost = np.zeros(n_criteria + 1)
+    cost[-1] = 1.0
+    eye = np.eye(n_criteria)
+    bound_rows = np.vstack([np.hstack([eye, -np.ones((n_criteria, 1))]),
+                            np.hstack([-eye, -np.ones((n_criteria, 1))])])
+    bound_rhs = np.concatenate([weights, -weights])
+    if n_rows:
+        a_ub = np.vstack([np.hstack([-advantage, np.zeros((n_rows, 1))]), bound_rows])
+        b_ub = np.concatenate([np.full(n_rows, -margin), bound_rhs])
+    else:
+        a_ub, b_ub = bound_rows, bound_rhs
+    a_eq = np.append(np.ones(n_criteria), 0.0)[None, :]
+    result = linprog(cost, A_ub=a_ub, b_ub=b_ub, A_eq=a_eq, b_eq=[1.0],
+                     bounds=[(0, None)] * (n_criteria + 1), method='highs')
+    if not result.success:
+        return None
+    return result.x[:n_criteria]
+
+
+def minimum_weight_change(normalized: np.ndarray, weights: np.ndarray, target: int, k: int = 1,
+                          norm: str = 'l1', margin: float = AppConfig.WHAT_IF_MARGIN) -> Dict[str, Any]:
+    """Closest weight vector (on the simplex) that puts the target in the top k
+
+    Solved by constraint generation: the LP starts with the strongest
+    competitors and adds the ones still ahead until none is, so only a few
+    dozen of 10k+ rows ever enter the solver. For k > 1 the k - 1 competitors
+    that are most expensive to overtake (single_competitor_costs) may stay
+    ahead, which makes the top-k answer an upper bound on the exact minimum.
+    """
+    if norm not in NORMS:
+        raise ValueError(f"Unknown norm: {norm}")
+    normalized = np.asarray(normalized, dtype=float)
+    weights = np.asarray(weights, dtype=float)
+    competitors = _competitor_rows(normalized, target)
+    advantage = normalized[target] - normalized[competitors]
+
+    allowed_ahead = np.empty(0, dtype=np.intp)
+    if k > 1 and len(competitors):
+        costs = single_competitor_costs(advantage, weights, margin)
+        allowed_ahead = np.argsort(-costs, kind='stable')[:k - 1]
+    required = np.ones(len(competitors), dtype=bool)
+    required[allowed_ahead] = False
+    advantage = advantage[required]
+
+    # Start with the competitors that are furthest ahead right now
+    active = np.argsort(advantage @ weights)[:AppConfig.WHAT_IF_BATCH]
+    new_weights = weights
+    iterations = 0
+    while True:
+        iterations += 1
+        new_weights = _solve_lp(advantage[active], weights, norm, margin)
+        if new_weights is None:
+            return {'feasible': False, 'iterations': iterations}
+        slack = advantage @ new_weights
+        # A small tolerance keeps solver round-off from adding rows forever
+        violated = np.flatnonzero(slack < margin - 1e-9)
+        if not violated.size:
+            break
+        worst = violated[np.argsort(slack[violated])[:AppConfig.WHAT_IF_BATCH]]
+        active = np.union1d(active, worst)
+
+    new_weights = np.clip(new_weights, 0.0, None)
+    new_weights /= new_weights.sum()
+    change = new_weights - weights
+    return {
+        'feasible': True,
+        'weights': new_weights,
+        'change': change,
+        'l1': float(np.abs(change).sum()),
+        'linf': float(np.abs(change).max()),
+        'constraints': int(len(active)),
+        'iterations': iterations
+    }
+
+
+def single_criterion_changes(normalized: np.ndarray, weights: np.ndarray, target: int, k: int = 1,
+                             margin: float = AppConfig.WHAT_IF_MARGIN) -> List[Optional[Dict[str, Any]]]:
+    """Closest weight of each criteria alone (others rescaled) that puts the target in the top k
+
+    With w_j = x and the other weights scaled by (1 - x) / (1 - w_j), every score
+    is linear in x, so each competitor overtakes the target at one breakpoint.
+    Counting competitors ahead at all breakpoints is a sort and a searchsorted.
+    None marks a criteria whose weight alone cannot do it.
+    """
+    normalized = np.asarray(normalized, dtype=float)
+    weights = np.asarray(weights, dtype=float)
+    scores = normalized @ weights
+    others = np.arange(len(scores)) != target
+    results: List[Optional[Dict[str, Any]]] = []
+
+    for j, weight in enumerate(weights):
+        if weight >= 1:
+            results.append(None)
+            continue
+        # s_a(x) = intercept_a + slope_a * x
+        intercept = (scores - normalized[:, j] * weight) / (1 - weight)
+        slope = normalized[:, j] - intercept
+        # The target stays ahead of a while margin_a(x) = c + d x >= margin
+        c = (intercept[target] - intercept)[others] - margin
+        d = (slope[target] - slope)[others]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            breakpoints = -c / d
+        rising = d > 0  # ahead for x >= breakpoint
+        falling = d < 0  # ahead for x <= breakpoint
+        always_behind = int(((d == 0) & (c < 0)).sum())
+        lower = np.sort(breakpoints[rising])
+        upper = np.sort(breakpoints[falling])
+
+        candidates = np.concatenate([[weight, 0.0, 1.0], lower, upper])
+        candidates = candidates[(candidates >= 0) & (candidates <= 1)]
+        ahead = (len(lower) - np.searchsorted(lower, candidates, side='right')
+                 + np.searchsorted(upper, candidates, side='left') + always_behind)
+        feasible = candidates[ahead <= k - 1]
+        if not feasible.size:
+            results.append(None)
+            continue
+        new_weight = float(feasible[np.argmin(np.abs(feasible - weight))])
+        results.append({'criteria_index': j, 'weight': float(weight), 'new_weight': new_weight,
+                        'change': new_weight - float(weight)})
+    return results
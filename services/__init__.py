@@ -0,0 +1 @@
+# Run modules directly: python -m services.scoring_service / services.load_test
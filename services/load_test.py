@@ -0,0 +1,166 @@
+import argparse
+import asyncio
+import json
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from config.settings import AppConfig
+
+
+class HTTPClient:
+    """Minimal keep-alive HTTP/1.1 JSON client for load testing"""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.reader = None
+        self.writer = None
+
+    async def connect(self):
+        """Open the connection"""
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+    async def request(self, method: str, path: str, body: Optional[dict] = None) -> Tuple[int, Any]:
+        """Send one request and return (status, decoded JSON)"""
+        data = json.dumps(body).encode('utf-8') if body is not None else b''
+        self.writer.write(
+            f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(data)}\r\n\r\n"
+            .encode('latin-1') + data)
+        await self.writer.drain()
+
+        status = int((await self.reader.readline()).split()[1])
+        length = 0
+        while True:
+            line = await self.reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            key, _, value = line.decode('latin-1').partition(':')
+            if key.strip().lower() == 'content-length':
+                length = int(value)
+        payload = await self.reader.readexactly(length)
+        return status, json.loads(payload) if payload else None
+
+    async def close(self):
+        """Close the connection"""
+        if self.writer is not None:
+            self.writer.close()
+            await self.writer.wait_closed()
+
+
+def synthetic_model(n_alternatives: int, n_criteria: int, seed: int = 0) -> Dict[str, Any]:
+    """Build a random model payload for the service"""
+    rng = np.random.default_rng(seed)
+    return {
+        'alternatives': [f"A{i + 1}" for i in range(n_alternatives)],
+        'criteria': [f"C{j + 1}" for j in range(n_criteria)],
+        'weights': rng.uniform(0.1, 1.0, n_criteria).round(3).tolist(),
+        'criteria_types': ['benefit' if j % 3 else 'cost' for j in range(n_criteria)],
+        'decision_matrix': rng.uniform(1, 100, (n_alternatives, n_criteria)).round(2).tolist()
+    }
+
+
+async def run_load_test(host: str, port: int, path: str, body: Optional[dict],
+                        concurrency: int, total_requests: int) -> Dict[str, Any]:
+    """Fire total_requests POSTs over `concurrency` connections and collect latencies"""
+    latencies: List[float] = []
+    errors = 0
+    remaining = total_requests
+
+    async def worker():
+        nonlocal remaining, errors
+        client = HTTPClient(host, port)
+        await client.connect()
+        try:
+            while remaining > 0:
+                remaining -= 1
+                start = time.perf_counter()
+                status, _ = await client.request('POST', path, body)
+                latencies.append(time.perf_counter() - start)
+                if status != 200:
+                    errors += 1
+        finally:
+            await client.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latency_ms = np.array(latencies) * 1000
+    return {
+        'path': path,
+        'requests': len(latencies),
+        'errors': errors,
+        'concurrency': concurrency,
+        'elapsed_s': elapsed,
+        'requests_per_s': len(latencies) / elapsed if elapsed > 0 else 0.0,
+        'p50_ms': float(np.percentile(latency_ms, 50)),
+        'p99_ms': float(np.percentile(latency_ms, 99)),
+        'max_ms': float(latency_ms.max())
+    }
+
+
+async def _main(args):
+    """Optionally start a local service, upload a model and run the scenarios"""
+    service = None
+    port = args.port
+    if args.spawn:
+        from services.scoring_service import ScoringService
+        service = ScoringService(args.host, 0, args.workers)
+        await service.start()
+        port = service.port
+
+    try:
+        client = HTTPClient(args.host, port)
+        await client.connect()
+        status, payload = await client.request(
+            'PUT', '/models/loadtest', synthetic_model(args.alternatives, args.criteria))
+        await client.close()
+        if status != 201:
+            raise SystemExit(f"Model upload failed: {payload}")
+
+        scenarios = {
+            'scores': ('/models/loadtest/scores', {'top_k': 10}),
+            'sensitivity': ('/models/loadtest/sensitivity', {'criteria': 0}),
+            'stability': ('/models/loadtest/stability', {'criteria': 0})
+        }
+        reports = []
+        for name in args.endpoints:
+            path, body = scenarios[name]
+            report = await run_load_test(args.host, port, path, body,
+                                         args.concurrency, args.requests)
+            reports.append(report)
+            print(f"{name:<12} {report['requests_per_s']:>9.1f} req/s   "
+                  f"p50 {report['p50_ms']:>8.2f} ms   p99 {report['p99_ms']:>8.2f} ms   "
+                  f"errors {report['errors']}")
+
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(reports, f, indent=2)
+    finally:
+        if service is not None:
+            await service.stop()
+
+
+def main():
+    """Load-test harness for the scoring service"""
+    parser = argparse.ArgumentParser(description="Load test the SAW scoring service")
+    parser.add_argument('--host', default=AppConfig.SERVICE_HOST)
+    parser.add_argument('--port', type=int, default=AppConfig.SERVICE_PORT)
+    parser.add_argument('--spawn', action='store_true',
+                        help="start an in-process service on a free port")
+    parser.add_argument('--workers', type=int, default=AppConfig.SERVICE_WORKERS)
+    parser.add_argument('--alternatives', type=int, default=1000)
+    parser.add_argument('--criteria', type=int, default=10)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--endpoints', nargs='+', default=['scores', 'sensitivity', 'stability'],
+                        choices=['scores', 'sensitivity', 'stability'])
+    parser.add_argument('--output', help="write the JSON report to this file")
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
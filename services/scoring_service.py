@@ -0,0 +1,419 @@
+import argparse
+import asyncio
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import numpy as np
+
+from config.settings import AppConfig
+from models.saw_model import SAWModel
+from models.batch_model import BatchSAWModel
+from utils.validators import DataValidator
+
+
+class HTTPError(Exception):
+    """Error that maps directly to an HTTP status code"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+REASONS = {200: 'OK', 201: 'Created', 400: 'Bad Request', 404: 'Not Found',
+           405: 'Method Not Allowed', 413: 'Payload Too Large', 500: 'Internal Server Error'}
+
+
+# --- Process pool jobs -------------------------------------------------------
+# Workers keep restored models cached by (name, version); the parent only ships
+# the compact array snapshot when a worker reports a cache miss.
+
+_WORKER_MODELS: Dict[Tuple[str, int], SAWModel] = {}
+_CACHE_MISS = '__cache_miss__'
+
+
+def _restore_model(state: Dict[str, Any]) -> SAWModel:
+    """Rebuild a SAWModel from a snapshot inside a worker process"""
+    model = SAWModel()
+    model.alternatives = state['alternatives']
+    model.criteria = state['criteria']
+    model.weights = state['weights']
+    model.criteria_types = state['criteria_types']
+    model.normalized_matrix = state['normalized_matrix']
+    # Only the base winner is needed by the stability check
+    model.results = state['results_head']
+    return model
+
+
+def _worker_call(key: Tuple[str, int], state: Optional[Dict[str, Any]], job, *args):
+    """Run a job against a worker-cached model"""
+    model = _WORKER_MODELS.get(key)
+    if model is None:
+        if state is None:
+            return _CACHE_MISS
+        # Drop older versions of the same model before caching the new one
+        for cached_key in [k for k in _WORKER_MODELS if k[0] == key[0]]:
+            del _WORKER_MODELS[cached_key]
+        model = _WORKER_MODELS[key] = _restore_model(state)
+    return job(model, *args)
+
+
+def _score_job(model: SAWModel, weights, top_k: Optional[int]):
+    """Rank alternatives, optionally with custom weights"""
+    ranking = model.lazy_ranking(weights)
+    k = len(ranking) if top_k is None else top_k
+    return ranking.top(k)
+
+
+def _sensitivity_job(model: SAWModel, criteria_index: int, weight_range: float,
+                     top_k: Optional[int], with_stability: bool):
+    """Run a sensitivity sweep and optionally the stability summary"""
+    sensitivity_results = model.sensitivity_analysis(criteria_index, weight_range, top_k=top_k)
+    stability_info = model.calculate_stability(sensitivity_results) if with_stability else None
+    return sensitivity_results, stability_info
+
+
+def _to_json(value):
+    """json.dumps default hook for numpy values"""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class ScoringService:
+    """Local asynchronous HTTP/JSON service exposing SAW scoring and sensitivity"""
+
+    MAX_BODY_BYTES = 256 * 1024 * 1024
+
+    def __init__(self, host: str = AppConfig.SERVICE_HOST, port: int = AppConfig.SERVICE_PORT,
+                 workers: Optional[int] = AppConfig.SERVICE_WORKERS,
+                 inline_max_cells: int = AppConfig.SERVICE_INLINE_MAX_CELLS):
+        self.host = host
+        self.port = port
+        self.workers = workers or os.cpu_count() or 1
+        self.inline_max_cells = inline_max_cells
+        self.models: Dict[str, SAWModel] = {}
+        self._snapshots: Dict[str, Dict[str, Any]] = {}
+        self._versions: Dict[str, int] = {}
+        self.validator = DataValidator()
+        self.executor = None
+        self.server = None
+
+    # --- Model registry ------------------------------------------------------
+
+    def load_model(self, name: str, data: Dict[str, Any]) -> SAWModel:
+        """Validate, score and keep a named model in memory"""
+        try:
+            alternatives = [str(a) for a in data['alternatives']]
+            criteria = [str(c) for c in data['criteria']]
+            weights = [float(w) for w in data['weights']]
+            criteria_types = [str(t) for t in data['criteria_types']]
+            decision_matrix = [[float(v) for v in row] for row in data['decision_matrix']]
+        except (KeyError, TypeError, ValueError) as e:
+            raise HTTPError(400, f"Invalid model payload: {e}")
+
+        is_valid, error_msg = self.validator.validate_complete_data(
+            alternatives, criteria, weights, decision_matrix)
+        if not is_valid:
+            raise HTTPError(400, error_msg)
+        self._check_weights(weights, len(criteria))
+        self._check_problem(decision_matrix, criteria_types, len(criteria))
+
+        model = SAWModel()
+        model.set_data(alternatives, criteria, weights, decision_matrix, criteria_types)
+        model.calculate_scores()
+
+        self.models[name] = model
+        self._versions[name] = self._versions.get(name, 0) + 1
+        self._snapshots[name] = {
+            'alternatives': model.alternatives,
+            'criteria': model.criteria,
+            'weights': model.weights,
+            'criteria_types': model.criteria_types,
+            'normalized_matrix': model.normalized_matrix,
+            'results_head': model.results[:1]
+        }
+        return model
+
+    def score_batch(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """Score many small problems in one vectorized pass"""
+        try:
+            problems = [(p['decision_matrix'], p['weights'], p['criteria_types'])
+                        for p in body['problems']]
+            for i, (matrix, weights, criteria_types) in enumerate(problems):
+                try:
+                    self._check_weights(weights, len(criteria_types))
+                    self._check_problem(matrix, criteria_types, len(criteria_types))
+                except HTTPError as e:
+                    raise HTTPError(400, f"Masalah {i + 1}: {e.message}")
+            packed = BatchSAWModel.pack_problems(problems)
+        except (KeyError, TypeError, ValueError) as e:
+            raise HTTPError(400, f"Invalid batch payload: {e}")
+
+        result = BatchSAWModel.score(**packed)
+        n_alternatives = packed['alternative_mask'].sum(axis=1)
+        return {
+            'winners': result['winners'],
+            'scores': [row[:n].tolist() for row, n in zip(result['scores'], n_alternatives)]
+        }
+
+    def get_model(self, name: str) -> SAWModel:
+        """Get a loaded model or fail with 404"""
+        if name not in self.models:
+            raise HTTPError(404, f"Model '{name}' not found")
+        return self.models[name]
+
+    def _criteria_index(self, model: SAWModel, criteria) -> int:
+        """Resolve a criteria name or index"""
+        if (isinstance(criteria, int) and not isinstance(criteria, bool)
+                and 0 <= criteria < len(model.criteria)):
+            return criteria
+        if criteria in model.criteria:
+            return model.criteria.index(criteria)
+        raise HTTPError(400, f"Unknown criteria: {criteria}")
+
+    @staticmethod
+    def _check_weights(weights, n_criteria: int) -> np.ndarray:
+        """Weights must be finite, non-negative numbers with a positive sum, one per criteria"""
+        if not isinstance(weights, list) or len(weights) != n_criteria:
+            raise HTTPError(400, "Jumlah bobot tidak sesuai dengan jumlah kriteria")
+        if any(isinstance(w, bool) or not isinstance(w, (int, float)) for w in weights):
+            raise HTTPError(400, "Bobot harus berupa angka")
+        weights = np.asarray(weights, dtype=float)
+        if not np.isfinite(weights).all():
+            raise HTTPError(400, "Bobot harus berupa angka berhingga")
+        if (weights < 0).any():
+            raise HTTPError(400, "Bobot tidak boleh negatif")
+        if weights.sum() <= 0:
+            raise HTTPError(400, "Jumlah bobot harus lebih besar dari 0")
+        return weights
+
+    def _check_problem(self, decision_matrix, criteria_types, n_criteria: int):
+        """Criteria types must be known and match the criteria; cells must be finite numbers"""
+        if not isinstance(criteria_types, list) or len(criteria_types) != n_criteria:
+            raise HTTPError(400, "Jumlah tipe kriteria tidak sesuai dengan jumlah kriteria")
+        for criteria_type in criteria_types:
+            is_valid, error_msg = self.validator.validate_criteria_type(criteria_type)
+            if not is_valid:
+                raise HTTPError(400, error_msg)
+        try:
+            matrix = np.asarray(decision_matrix, dtype=float)
+        except (TypeError, ValueError):
+            raise HTTPError(400, "Matriks keputusan harus berisi angka dengan jumlah kolom yang sama")
+        if matrix.ndim != 2 or matrix.shape[0] == 0 or matrix.shape[1] != n_criteria:
+            raise HTTPError(400, "Ukuran matriks keputusan tidak sesuai dengan jumlah kriteria")
+        if not np.isfinite(matrix).all():
+            raise HTTPError(400, "Nilai matriks harus berupa angka berhingga")
+
+    def _custom_weights(self, model: SAWModel, weights) -> Optional[np.ndarray]:
+        """Validate request weights and normalize them to sum to one"""
+        if weights is None:
+            return None
+        weights = self._check_weights(weights, len(model.criteria))
+        return weights / weights.sum()
+
+    @staticmethod
+    def _top_k(value, default: Optional[int]) -> Optional[int]:
+        """Validate a top_k parameter: a positive integer, or null for the full ranking"""
+        if value is None:
+            return default
+        if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+            raise HTTPError(400, "top_k harus berupa bilangan bulat positif")
+        return value
+
+    async def _run(self, name: str, job, *args):
+        """Run small models inline and offload large ones to the process pool"""
+        model = self.models[name]
+        cells = len(model.alternatives) * len(model.criteria)
+        if self.executor is None or cells <= self.inline_max_cells:
+            return job(model, *args)
+
+        loop = asyncio.get_running_loop()
+        key = (name, self._versions[name])
+        # Captured before awaiting: a DELETE or reload meanwhile must not change this request
+        snapshot = self._snapshots[name]
+        result = await loop.run_in_executor(self.executor, _worker_call, key, None, job, *args)
+        if isinstance(result, str) and result == _CACHE_MISS:
+            result = await loop.run_in_executor(
+                self.executor, _worker_call, key, snapshot, job, *args)
+        return result
+
+    # --- Handlers ------------------------------------------------------------
+
+    async def handle(self, method: str, path: str, body: Optional[dict]) -> Tuple[int, Any]:
+        """Dispatch one request and return (status, JSON payload)"""
+        parts = [p for p in urlsplit(path).path.split('/') if p]
+        body = body or {}
+
+        if parts == ['health'] and method == 'GET':
+            return 200, {'status': 'ok', 'models': len(self.models)}
+
+        if parts == ['models'] and method == 'GET':
+            return 200, {'models': [
+                {'name': name, 'alternatives': len(m.alternatives), 'criteria': len(m.criteria)}
+                for name, m in self.models.items()
+            ]}
+
+        if parts == ['batch'] and method == 'POST':
+            return 200, self.score_batch(body)
+
+        if len(parts) == 2 and parts[0] == 'models':
+            name = parts[1]
+            if method in ('PUT', 'POST'):
+                model = self.load_model(name, body)
+                return 201, {'name': name, 'winner': model.results[0][0]}
+            if method == 'GET':
+                model = self.get_model(name)
+                return 200, {'name': name, 'alternatives': model.alternatives,
+                             'criteria': model.criteria, 'weights': model.weights,
+                             'criteria_types': model.criteria_types}
+            if method == 'DELETE':
+                self.get_model(name)
+                del self.models[name]
+                del self._snapshots[name]
+                return 200, {'deleted': name}
+            raise HTTPError(405, "Method not allowed")
+
+        if len(parts) == 3 and parts[0] == 'models':
+            if method != 'POST':
+                raise HTTPError(405, "Method not allowed")
+            name, action = parts[1], parts[2]
+            model = self.get_model(name)
+
+            if action == 'scores':
+                weights = self._custom_weights(model, body.get('weights'))
+                top_k = self._top_k(body.get('top_k'), None)
+                results = await self._run(name, _score_job, weights, top_k)
+                return 200, {'results': results}
+
+            if action in ('sensitivity', 'stability'):
+                criteria_index = self._criteria_index(model, body.get('criteria', 0))
+                is_valid, weight_range, error_msg = self.validator.validate_sensitivity_range(
+                    str(body.get('weight_range', AppConfig.DEFAULT_SENSITIVITY_RANGE)))
+                if not is_valid:
+                    raise HTTPError(400, error_msg)
+                top_k = self._top_k(body.get('top_k', 1), None)
+                sensitivity_results, stability_info = await self._run(
+                    name, _sensitivity_job, criteria_index, weight_range, top_k,
+                    action == 'stability')
+                if action == 'stability':
+                    return 200, stability_info
+                return 200, {'criteria': model.criteria[criteria_index],
+                             'results': sensitivity_results}
+
+        raise HTTPError(404, f"No route for {method} {path}")
+
+    async def _handle_connection(self, reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter):
+        """Serve HTTP/1.1 requests on one keep-alive connection"""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    key, _, value = line.decode('latin-1').partition(':')
+                    headers[key.strip().lower()] = value.strip()
+
+                keep_alive = (headers.get('connection', '').lower() != 'close'
+                              and version == 'HTTP/1.1')
+                try:
+                    try:
+                        length = int(headers.get('content-length', 0) or 0)
+                        if length < 0:
+                            raise ValueError(length)
+                    except ValueError:
+                        keep_alive = False  # the body cannot be skipped without its length
+                        raise HTTPError(400, "Invalid Content-Length header")
+                    if length > self.MAX_BODY_BYTES:
+                        keep_alive = False  # the unread body would be parsed as the next request
+                        raise HTTPError(413, "Request body too large")
+                    raw = await reader.readexactly(length) if length else b''
+                    body = json.loads(raw) if raw else None
+                    if body is not None and not isinstance(body, dict):
+                        raise HTTPError(400, "Request body must be a JSON object")
+                    status, payload = await self.handle(method.upper(), target, body)
+                except HTTPError as e:
+                    status, payload = e.status, {'error': e.message}
+                except json.JSONDecodeError as e:
+                    status, payload = 400, {'error': f"Invalid JSON: {e}"}
+                except Exception as e:
+                    status, payload = 500, {'error': str(e)}
+
+                data = json.dumps(payload, default=_to_json).encode('utf-8')
+                writer.write(
+                    f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+                    .encode('latin-1') + data)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+    # --- Lifecycle -----------------------------------------------------------
+
+    async def start(self):
+        """Start listening; CPU-heavy calls go to a process pool"""
+        if self.workers > 1:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers)
+        self.server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self.server
+
+    async def stop(self):
+        """Stop listening and shut down the process pool"""
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+    async def serve_forever(self):
+        """Run the service until cancelled"""
+        await self.start()
+        print(f"SAW scoring service listening on http://{self.host}:{self.port}")
+        try:
+            await self.server.serve_forever()
+        finally:
+            await self.stop()
+
+
+def main():
+    """Run the scoring service from the command line"""
+    parser = argparse.ArgumentParser(description="Local SAW scoring HTTP service")
+    parser.add_argument('--host', default=AppConfig.SERVICE_HOST)
+    parser.add_argument('--port', type=int, default=AppConfig.SERVICE_PORT)
+    parser.add_argument('--workers', type=int, default=AppConfig.SERVICE_WORKERS,
+                        help="process pool size (1 = run everything inline)")
+    args = parser.parse_args()
+
+    service = ScoringService(args.host, args.port, args.workers)
+    try:
+        asyncio.run(service.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,24 @@
 from .validators import DataValidator
-from .exporters import ResultExporter, SensitivityExporter
+from .exporters import ResultExporter, SensitivityExporter, ScenarioExporter
 from .chart_utils import ChartGenerator, SensitivityChartGenerator, ComparisonChartGenerator
+from .chart_renderer import ChartRenderer
+from .instrumentation import metrics, timed, track
+from .project_store import ProjectStore, ProjectAutosaver
+from .decision_store import DecisionStore
 
 __all__ = [
     'DataValidator',
     'ResultExporter',
     'SensitivityExporter', 
+    'ScenarioExporter',
     'ChartGenerator',
     'SensitivityChartGenerator',
-    'ComparisonChartGenerator'
+    'ComparisonChartGenerator',
+    'ChartRenderer',
+    'metrics',
+    'timed',
+    'track',
+    'ProjectStore',
+    'ProjectAutosaver',
+    'DecisionStore'
 ]
\ No newline at end of file
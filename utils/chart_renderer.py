@@ -0,0 +1,113 @@
+import io
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from config.settings import AppConfig
+from utils.instrumentation import track
+
+
+ChartBuild = Callable[[], Figure]
+
+
+def render_png(build: ChartBuild, width: Optional[int] = None, dpi: int = AppConfig.CHART_DPI) -> bytes:
+    """Build a figure, lay it out at width pixels (figure size when None) and encode it as PNG"""
+    with track('chart.render'):
+        fig = build()
+        FigureCanvasAgg(fig)
+        if width:
+            fig_width, fig_height = fig.get_size_inches()
+            fig.set_size_inches(width / dpi, width / dpi * fig_height / fig_width)
+            fig.tight_layout()
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format='png', dpi=dpi)
+    return buffer.getvalue()
+
+
+class ChartRenderer:
+    """Draws chart figures to PNG on a worker thread, cached per chart key and width
+
+    The chart generators build plain Figure objects (no pyplot state), so a
+    figure can be built and drawn with the Agg backend away from the Tk
+    thread; the UI only decodes the finished PNG. A render of a key that is
+    already cached or in flight is shared instead of drawn again.
+    """
+
+    def __init__(self, cache_size: int = AppConfig.CHART_CACHE_SIZE, dpi: int = AppConfig.CHART_DPI):
+        self.cache_size = cache_size
+        self.dpi = dpi
+        self._cache: "OrderedDict[Tuple, bytes]" = OrderedDict()
+        self._pending: Dict[Tuple, Future] = {}
+        self._lock = threading.RLock()
+        # One worker: matplotlib's font and text caches are not safe for parallel drawing
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='saw-chart')
+
+    def render(self, key: Hashable, build: ChartBuild, width: Optional[int] = None) -> Future:
+        """Future of the PNG bytes of build(), scaled to width pixels (figure size when None)"""
+        cache_key = (key, width)
+        with self._lock:
+            png = self._lookup(cache_key)
+            if png is not None:
+                future = Future()
+                future.set_result(png)
+                return future
+            future = self._pending.get(cache_key)
+            if future is None:
+                future = self._executor.submit(self._draw, cache_key, build, width)
+                self._pending[cache_key] = future
+                future.add_done_callback(lambda _: self._forget(cache_key))
+            return future
+
+    def _forget(self, cache_key: Tuple):
+        """Drop a finished render from the in-flight table"""
+        with self._lock:
+            self._pending.pop(cache_key, None)
+
+    def export(self, charts: List[Tuple[str, Hashable, ChartBuild]], directory: str = '.',
+               width: Optional[int] = None) -> Future:
+        """Write (filename, key, build) charts as PNG files on the worker; the future holds the paths"""
+        def job():
+            paths = []
+            for filename, key, build in charts:
+                cache_key = (key, width)
+                with self._lock:
+                    png = self._lookup(cache_key)
+                if png is None:
+                    png = self._draw(cache_key, build, width)
+                path = os.path.join(directory, filename)
+                with open(path, 'wb') as f:
+                    f.write(png)
+                paths.append(path)
+            return paths
+
+        return self._executor.submit(job)
+
+    def _lookup(self, cache_key: Tuple) -> Optional[bytes]:
+        """Cached PNG (caller holds the lock)"""
+        png = self._cache.get(cache_key)
+        if png is not None:
+            self._cache.move_to_end(cache_key)
+        return png
+
+    def _draw(self, cache_key: Tuple, build: ChartBuild, width: Optional[int]) -> bytes:
+        """Worker: render and cache one chart"""
+        png = render_png(build, width, self.dpi)
+        with self._lock:
+            self._cache[cache_key] = png
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return png
+
+    def clear(self):
+        """Drop the cached images"""
+        with self._lock:
+            self._cache.clear()
+
+    def shutdown(self):
+        """Stop the worker; queued renders are dropped"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
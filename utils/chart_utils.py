@@ -1,12 +1,18 @@
-import matplotlib.pyplot as plt
+import matplotlib
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+from matplotlib.colors import ListedColormap
+from matplotlib.patches import Patch
 import numpy as np
-from typing import List, Tuple, Dict
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
 from assets.styles import AppStyles
+from utils.instrumentation import timed
 
 
 class ChartGenerator:
     """Generate charts for SAW results"""
     
+    @timed('chart.saw')
     def create_saw_charts(self, results: List[Tuple[str, float]]):
         """Create bar and pie charts for SAW results"""
         if not results:
@@ -18,7 +24,8 @@ class ChartGenerator:
         colors = AppStyles.get_color_palette(len(alternatives))
         
         # Create figure with subplots
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
+        fig = Figure(figsize=(12, 5))
+        ax1, ax2 = fig.subplots(1, 2)
         
         # Bar chart
         bars = ax1.bar(alternatives, scores, color=colors)
@@ -38,13 +45,14 @@ class ChartGenerator:
                startangle=90, colors=colors)
         ax2.set_title('Proporsi Skor SAW', fontsize=14, fontweight='bold')
         
-        plt.tight_layout()
+        fig.tight_layout()
         return fig
 
 
 class SensitivityChartGenerator:
     """Generate charts for sensitivity analysis"""
     
+    @timed('chart.sensitivity')
     def create_sensitivity_chart(self, sensitivity_results: List[Dict], criteria_name: str):
         """Create sensitivity analysis chart"""
         if not sensitivity_results:
@@ -56,11 +64,12 @@ class SensitivityChartGenerator:
         winners = [result['winner'] for result in sensitivity_results]
         
         # Create figure
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig = Figure(figsize=(10, 6))
+        ax = fig.subplots()
         
         # Color map for different winners
         unique_winners = list(set(winners))
-        colors = plt.cm.Set3(np.linspace(0, 1, len(unique_winners)))
+        colors = matplotlib.colormaps['Set3'](np.linspace(0, 1, len(unique_winners)))
         color_map = {winner: colors[i] for i, winner in enumerate(unique_winners)}
         
         point_colors = [color_map[winner] for winner in winners]
@@ -76,15 +85,16 @@ class SensitivityChartGenerator:
         ax.grid(True, alpha=0.3)
         
         # Legend
-        legend_elements = [plt.Line2D([0], [0], marker='o', color='w', 
+        legend_elements = [Line2D([0], [0], marker='o', color='w', 
                                     markerfacecolor=color_map[winner], 
                                     markersize=8, label=winner)
                          for winner in unique_winners]
         ax.legend(handles=legend_elements, loc='best')
         
-        plt.tight_layout()
+        fig.tight_layout()
         return fig
     
+    @timed('chart.stability')
     def create_stability_chart(self, sensitivity_results: List[Dict], 
                              original_winner: str, criteria_name: str):
         """Create stability visualization chart"""
@@ -104,7 +114,8 @@ class SensitivityChartGenerator:
                 stability_points.append(0)
         
         # Create figure
-        fig, ax = plt.subplots(figsize=(10, 4))
+        fig = Figure(figsize=(10, 4))
+        ax = fig.subplots()
         
         # Bar chart showing stability
         colors = ['green' if stable else 'red' for stable in stability_points]
@@ -123,7 +134,86 @@ class SensitivityChartGenerator:
                transform=ax.transAxes, fontsize=12, fontweight='bold',
                verticalalignment='top', bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
         
-        plt.tight_layout()
+        fig.tight_layout()
+        return fig
+    
+    @timed('chart.tornado')
+    def create_tornado_chart(self, summary: List[Dict], base_score: float):
+        """Create tornado chart of the original winner's score range per criteria"""
+        if not summary:
+            raise ValueError("No sensitivity results to visualize")
+        
+        # Widest swing on top
+        items = sorted(summary, key=lambda item: item['swing'])
+        names = [item['criteria'] for item in items]
+        lows = np.array([item['low_score'] for item in items])
+        highs = np.array([item['high_score'] for item in items])
+        y_pos = np.arange(len(items))
+        
+        fig = Figure(figsize=(10, max(3, 0.5 * len(items) + 1.5)))
+        ax = fig.subplots()
+        
+        ax.barh(y_pos, base_score - lows, left=lows, color='#d9534f', alpha=0.7,
+                label='Bobot turun')
+        ax.barh(y_pos, highs - base_score, left=base_score, color='#2C8F47', alpha=0.7,
+                label='Bobot naik')
+        ax.axvline(base_score, color='black', linewidth=1)
+        
+        # Stability percentage next to each bar
+        for y, item in zip(y_pos, items):
+            ax.text(max(highs.max(), base_score), y, f"  {item['stability']:.0f}%", va='center')
+        
+        ax.set_yticks(y_pos)
+        ax.set_yticklabels(names)
+        ax.set_xlabel('Skor Alternatif Terbaik Asli')
+        ax.set_title('Tornado Sensitivitas Semua Kriteria', fontsize=14, fontweight='bold')
+        ax.legend(loc='lower right')
+        ax.grid(True, alpha=0.3, axis='x')
+        
+        fig.tight_layout()
+        return fig
+    
+    @timed('chart.weight_map')
+    def create_weight_map_chart(self, map_result: Dict, alternatives: List[str]):
+        """Create two-criteria winner region map rendered as a single image"""
+        winner_grid = map_result['winner_grid']
+        if winner_grid.size == 0:
+            raise ValueError("No sensitivity results to visualize")
+        
+        # Re-index winners to 0..k-1 so the colormap only holds the winning alternatives
+        winner_ids, dense_grid = np.unique(winner_grid, return_inverse=True)
+        dense_grid = dense_grid.reshape(winner_grid.shape)
+        has_invalid = winner_ids[0] < 0
+        colors = matplotlib.colormaps['tab20'](np.linspace(0, 1, max(1, len(winner_ids))))
+        if has_invalid:
+            colors[0] = (1, 1, 1, 0)
+        
+        x_weights = map_result['x_weights']
+        y_weights = map_result['y_weights']
+        name_x, name_y = map_result['criteria']
+        
+        fig = Figure(figsize=(9, 7))
+        ax = fig.subplots()
+        ax.imshow(dense_grid, origin='lower', aspect='auto', interpolation='nearest',
+                  cmap=ListedColormap(colors), vmin=-0.5, vmax=len(winner_ids) - 0.5,
+                  extent=(x_weights[0], x_weights[-1], y_weights[0], y_weights[-1]))
+        
+        # Current weights
+        ax.plot(*map_result['original_weights'], marker='X', color='black', markersize=12,
+                linestyle='none', label='Bobot saat ini')
+        
+        ax.set_xlabel(f'Bobot {name_x}')
+        ax.set_ylabel(f'Bobot {name_y}')
+        ax.set_title(f'Peta Stabilitas Bobot - {name_x} vs {name_y}', 
+                    fontsize=14, fontweight='bold')
+        
+        legend_elements = [Patch(facecolor=colors[i], label=alternatives[winner_id])
+                           for i, winner_id in enumerate(winner_ids) if winner_id >= 0][:20]
+        legend_elements.append(Line2D([0], [0], marker='X', color='w', markerfacecolor='black',
+                                          markersize=10, label='Bobot saat ini'))
+        ax.legend(handles=legend_elements, loc='upper right', fontsize='small')
+        
+        fig.tight_layout()
         return fig
 
 
@@ -135,38 +225,98 @@ class ComparisonChartGenerator:
         if not scenarios:
             raise ValueError("No scenarios to compare")
         
-        # Prepare data
+        # Align every scenario on the same alternative axis with one lookup per result
         scenario_names = list(scenarios.keys())
         all_alternatives = set()
         for results in scenarios.values():
             all_alternatives.update([alt for alt, _ in results])
         all_alternatives = sorted(list(all_alternatives))
+        alt_index = {alt: i for i, alt in enumerate(all_alternatives)}
+        
+        scores = np.zeros((len(scenario_names), len(all_alternatives)))
+        for i, results in enumerate(scenarios.values()):
+            for name, score in results:
+                scores[i, alt_index[name]] = score
+        
+        return self.create_scenario_comparison_chart(scenario_names, all_alternatives, scores)
+    
+    @timed('chart.comparison')
+    def create_scenario_comparison_chart(self, scenario_names: List[str], alternatives: List[str],
+                                         scores: np.ndarray, max_alternatives: int = 15):
+        """Create comparison chart from aligned (scenarios x alternatives) scores"""
+        scores = np.asarray(scores, dtype=float)
+        if scores.size == 0:
+            raise ValueError("No scenarios to compare")
+        
+        # Keep the chart readable: show the alternatives with the best mean score
+        if len(alternatives) > max_alternatives:
+            shown = np.argpartition(-scores.mean(axis=0), max_alternatives - 1)[:max_alternatives]
+            shown = shown[np.argsort(-scores[:, shown].mean(axis=0))]
+            alternatives = [alternatives[i] for i in shown]
+            scores = scores[:, shown]
         
         # Create figure
-        fig, ax = plt.subplots(figsize=(12, 6))
+        fig = Figure(figsize=(12, 6))
+        ax = fig.subplots()
         
         # Bar width
         bar_width = 0.8 / len(scenario_names)
-        x_pos = np.arange(len(all_alternatives))
+        x_pos = np.arange(len(alternatives))
         
         # Plot bars for each scenario
-        for i, (scenario_name, results) in enumerate(scenarios.items()):
-            scores = []
-            for alt in all_alternatives:
-                score = next((score for name, score in results if name == alt), 0)
-                scores.append(score)
-            
-            bars = ax.bar(x_pos + i * bar_width, scores, bar_width, 
-                         label=scenario_name, alpha=0.8)
+        for i, scenario_name in enumerate(scenario_names):
+            ax.bar(x_pos + i * bar_width, scores[i], bar_width, 
+                   label=scenario_name, alpha=0.8)
         
         ax.set_xlabel('Alternatif')
         ax.set_ylabel('Skor SAW')
         ax.set_title('Perbandingan Skor SAW Antar Skenario', 
                     fontsize=14, fontweight='bold')
         ax.set_xticks(x_pos + bar_width * (len(scenario_names) - 1) / 2)
-        ax.set_xticklabels(all_alternatives, rotation=45)
-        ax.legend()
+        ax.set_xticklabels(alternatives, rotation=45)
+        ax.legend(ncol=max(1, len(scenario_names) // 10), fontsize='small')
         ax.grid(True, alpha=0.3, axis='y')
         
-        plt.tight_layout()
-        return fig
\ No newline at end of file
+        fig.tight_layout()
+        return fig
+
+# Charts the model can draw, by export name
+MODEL_CHARTS = ('hasil_saw', 'skenario', 'sensitivitas', 'tornado', 'peta_bobot')
+
+
+def chart_job(model, name: str) -> Optional[Tuple[Hashable, Callable[[], Figure]]]:
+    """(render cache key, figure builder) of one model chart, or None when there is nothing to draw
+
+    The builder only uses data captured here, so it may run on another thread
+    while the model keeps changing; the key changes whenever that data does.
+    """
+    revisions = model.revisions
+    analyses = model.analyses
+    if name == 'hasil_saw' and model.results:
+        results = model.results
+        return ('saw', revisions['results']), lambda: ChartGenerator().create_saw_charts(results)
+    if name == 'skenario' and len(model.scenarios):
+        scores = model.scenarios.scores if model.scenarios.scores is not None else model.scenarios.compute()
+        names, alternatives = list(model.scenarios.names), list(model.alternatives)
+        return (('scenarios', revisions['analyses'], revisions['results']),
+                lambda: ComparisonChartGenerator().create_scenario_comparison_chart(names, alternatives, scores))
+    if name == 'sensitivitas' and 'sensitivity' in analyses:
+        sensitivity = analyses['sensitivity']
+        return (('sensitivity', revisions['analyses']),
+                lambda: SensitivityChartGenerator().create_sensitivity_chart(sensitivity['results'],
+                                                                             sensitivity['criteria']))
+    if name == 'tornado' and 'all_criteria' in analyses and model.results:
+        summary, base_score = analyses['all_criteria']['summary'], model.results[0][1]
+        return (('tornado', revisions['analyses'], revisions['results']),
+                lambda: SensitivityChartGenerator().create_tornado_chart(summary, base_score))
+    if name == 'peta_bobot' and 'weight_map' in analyses:
+        map_result, alternatives = analyses['weight_map'], list(model.alternatives)
+        return (('weight_map', revisions['analyses']),
+                lambda: SensitivityChartGenerator().create_weight_map_chart(map_result, alternatives))
+    return None
+
+
+def model_charts(model) -> Dict[str, Tuple[Hashable, Callable[[], Figure]]]:
+    """Every chart the model's results and analyses can draw right now"""
+    jobs = {name: chart_job(model, name) for name in MODEL_CHARTS}
+    return {name: job for name, job in jobs.items() if job is not None}
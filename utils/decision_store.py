@@ -0,0 +1,243 @@
+import hashlib
+import json
+import os
+import sqlite3
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from config.settings import AppConfig
+from utils.instrumentation import timed
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS models (
+    model_id     INTEGER PRIMARY KEY,
+    fingerprint  TEXT NOT NULL UNIQUE,
+    name         TEXT,
+    alternatives TEXT NOT NULL,
+    criteria     TEXT NOT NULL,
+    created_at   TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS runs (
+    run_id       INTEGER PRIMARY KEY,
+    model_id     INTEGER NOT NULL REFERENCES models(model_id),
+    kind         TEXT NOT NULL,
+    created_at   TEXT NOT NULL,
+    matrix_hash  TEXT NOT NULL,
+    winner       TEXT,
+    winner_score REAL,
+    criterion    TEXT,
+    weight_range REAL
+);
+CREATE TABLE IF NOT EXISTS run_weights (
+    run_id       INTEGER NOT NULL REFERENCES runs(run_id),
+    criterion    TEXT NOT NULL,
+    type         TEXT NOT NULL,
+    weight       REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS run_results (
+    run_id       INTEGER NOT NULL REFERENCES runs(run_id),
+    alternative  TEXT NOT NULL,
+    rank         INTEGER NOT NULL,
+    score        REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sensitivity_steps (
+    run_id       INTEGER NOT NULL REFERENCES runs(run_id),
+    step         INTEGER NOT NULL,
+    change       REAL NOT NULL,
+    new_weight   REAL NOT NULL,
+    winner       TEXT NOT NULL,
+    score        REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_model ON runs(model_id, kind, run_id);
+CREATE INDEX IF NOT EXISTS idx_run_weights_run ON run_weights(run_id);
+CREATE INDEX IF NOT EXISTS idx_run_weights_criterion ON run_weights(criterion, run_id);
+CREATE INDEX IF NOT EXISTS idx_run_results_run ON run_results(run_id, rank);
+CREATE INDEX IF NOT EXISTS idx_run_results_alternative ON run_results(alternative, run_id, rank, score);
+CREATE INDEX IF NOT EXISTS idx_sensitivity_steps_run ON sensitivity_steps(run_id, step);
+"""
+
+
+class DecisionStore:
+    """Optional SQLite history of SAW runs (scores and sensitivity sweeps)"""
+
+    def __init__(self, path: str, model_name: Optional[str] = None):
+        self.path = path
+        self.model_name = model_name
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(SCHEMA)
+        self._model_ids: Dict[str, int] = {}
+
+    @classmethod
+    def from_config(cls) -> Optional['DecisionStore']:
+        """Open the configured store, or None when history is disabled"""
+        path = AppConfig.DECISION_DB_PATH or os.environ.get('SAW_DECISION_DB')
+        return cls(path) if path else None
+
+    def close(self):
+        """Close the database connection"""
+        self.conn.close()
+
+    # --- Recording ---------------------------------------------------------------
+
+    @staticmethod
+    def _fingerprint(model) -> str:
+        """Identify a decision problem by its names and criteria types"""
+        key = json.dumps([model.alternatives, model.criteria, model.criteria_types])
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _matrix_hash(model) -> str:
+        """Hash of the decision matrix values, to tell data changes from weight changes"""
+        matrix = np.ascontiguousarray(model.decision_matrix, dtype=float)
+        return hashlib.sha1(matrix.tobytes()).hexdigest()
+
+    def _model_id(self, model) -> int:
+        """Get or create the models row for this decision problem"""
+        fingerprint = self._fingerprint(model)
+        model_id = self._model_ids.get(fingerprint)
+        if model_id is not None:
+            return model_id
+
+        row = self.conn.execute("SELECT model_id FROM models WHERE fingerprint = ?",
+                                (fingerprint,)).fetchone()
+        if row is None:
+            cursor = self.conn.execute(
+                "INSERT INTO models (fingerprint, name, alternatives, criteria, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (fingerprint, self.model_name, json.dumps(model.alternatives),
+                 json.dumps(model.criteria), datetime.now().isoformat(timespec='seconds')))
+            model_id = cursor.lastrowid
+        else:
+            model_id = row[0]
+        self._model_ids[fingerprint] = model_id
+        return model_id
+
+    def _insert_run(self, model, kind: str, winner: Optional[str], winner_score: Optional[float],
+                    criterion: Optional[str] = None, weight_range: Optional[float] = None) -> int:
+        """Insert the run row and its weight vector"""
+        cursor = self.conn.execute(
+            "INSERT INTO runs (model_id, kind, created_at, matrix_hash, winner, winner_score, "
+            "criterion, weight_range) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (self._model_id(model), kind, datetime.now().isoformat(timespec='milliseconds'),
+             self._matrix_hash(model), winner, winner_score, criterion, weight_range))
+        run_id = cursor.lastrowid
+        self.conn.executemany(
+            "INSERT INTO run_weights (run_id, criterion, type, weight) VALUES (?, ?, ?, ?)",
+            [(run_id, name, criteria_type, float(weight))
+             for name, criteria_type, weight in zip(model.criteria, model.criteria_types, model.weights)])
+        return run_id
+
+    @timed('store.record_scores')
+    def record_scores(self, model) -> int:
+        """Record a calculate_scores run: weights plus the full ranking"""
+        results = model.results
+        with self.conn:
+            run_id = self._insert_run(model, 'scores', results[0][0] if results else None,
+                                      float(results[0][1]) if results else None)
+            self.conn.executemany(
+                "INSERT INTO run_results (run_id, alternative, rank, score) VALUES (?, ?, ?, ?)",
+                [(run_id, name, rank, float(score)) for rank, (name, score) in enumerate(results, 1)])
+        return run_id
+
+    @timed('store.record_sensitivity')
+    def record_sensitivity(self, model, criteria_index: int, weight_range: float,
+                           sensitivity_results: List[Dict]) -> int:
+        """Record a sensitivity sweep: the winner at every weight step"""
+        return self._record_sweep(model, 'sensitivity', model.criteria[criteria_index],
+                                  weight_range, sensitivity_results)
+
+    @timed('store.record_tree_sensitivity')
+    def record_tree_sensitivity(self, model, node_name: str, weight_range: float,
+                                sensitivity_results: List[Dict]) -> int:
+        """Record a criteria tree node sweep; criterion holds the node name"""
+        return self._record_sweep(model, 'tree_sensitivity', node_name, weight_range, sensitivity_results)
+
+    def _record_sweep(self, model, kind: str, criterion: str, weight_range: float,
+                      sensitivity_results: List[Dict]) -> int:
+        """Insert the run row and the winner at every weight step"""
+        original = model.results[0] if model.results else (None, None)
+        with self.conn:
+            run_id = self._insert_run(model, kind, original[0],
+                                      None if original[1] is None else float(original[1]),
+                                      criterion, float(weight_range))
+            self.conn.executemany(
+                "INSERT INTO sensitivity_steps (run_id, step, change, new_weight, winner, score) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(run_id, step, float(r['change']), float(r['new_weight']), r['winner'], float(r['score']))
+                 for step, r in enumerate(sensitivity_results)])
+        return run_id
+
+    # --- Queries -----------------------------------------------------------------
+
+    def _rows(self, sql: str, params=()) -> List[Dict[str, Any]]:
+        cursor = self.conn.execute(sql, params)
+        columns = [c[0] for c in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor]
+
+    @timed('store.rank_history')
+    def rank_history(self, alternative: str, model_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Rank and score of one alternative in every recorded scoring run"""
+        sql = ("SELECT r.run_id, r.model_id, r.created_at, rr.rank, rr.score "
+               "FROM run_results rr JOIN runs r ON r.run_id = rr.run_id "
+               "WHERE rr.alternative = ?")
+        params = [alternative]
+        if model_id is not None:
+            sql += " AND r.model_id = ?"
+            params.append(model_id)
+        return self._rows(sql + " ORDER BY rr.run_id", params)
+
+    @timed('store.winner_changes')
+    def winner_changes(self, model_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Scoring runs whose winner differs from the previous run of the same model"""
+        sql = ("SELECT run_id, model_id, created_at, previous_winner, winner, matrix_changed FROM ("
+               " SELECT run_id, model_id, created_at, winner,"
+               "  LAG(winner) OVER w AS previous_winner,"
+               "  matrix_hash != LAG(matrix_hash) OVER w AS matrix_changed"
+               " FROM runs WHERE kind = 'scores'" + (" AND model_id = ?" if model_id is not None else "") +
+               " WINDOW w AS (PARTITION BY model_id ORDER BY run_id)"
+               ") WHERE previous_winner IS NOT NULL AND previous_winner != winner ORDER BY run_id")
+        return self._rows(sql, () if model_id is None else (model_id,))
+
+    @timed('store.weight_history')
+    def weight_history(self, criterion: str, model_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Weight of one criterion in every recorded run"""
+        sql = ("SELECT r.run_id, r.model_id, r.kind, r.created_at, rw.weight "
+               "FROM run_weights rw JOIN runs r ON r.run_id = rw.run_id "
+               "WHERE rw.criterion = ?")
+        params = [criterion]
+        if model_id is not None:
+            sql += " AND r.model_id = ?"
+            params.append(model_id)
+        return self._rows(sql + " ORDER BY rw.run_id", params)
+
+    def run_results(self, run_id: int) -> List[Dict[str, Any]]:
+        """Full ranking of one scoring run"""
+        return self._rows("SELECT alternative, rank, score FROM run_results "
+                          "WHERE run_id = ? ORDER BY rank", (run_id,))
+
+    def sensitivity_steps(self, run_id: int) -> List[Dict[str, Any]]:
+        """Winner per weight step of one sensitivity run"""
+        return self._rows("SELECT step, change, new_weight, winner, score FROM sensitivity_steps "
+                          "WHERE run_id = ? ORDER BY step", (run_id,))
+
+    def runs(self, model_id: Optional[int] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """Most recent runs first"""
+        sql = "SELECT * FROM runs"
+        params: list = []
+        if model_id is not None:
+            sql += " WHERE model_id = ?"
+            params.append(model_id)
+        params.append(limit)
+        return self._rows(sql + " ORDER BY run_id DESC LIMIT ?", params)
+
+    def current_model_id(self, model) -> Optional[int]:
+        """models row of the given decision problem, if it was ever recorded"""
+        row = self.conn.execute("SELECT model_id FROM models WHERE fingerprint = ?",
+                                (self._fingerprint(model),)).fetchone()
+        return row[0] if row else None
@@ -1,8 +1,10 @@
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from typing import List, Tuple
 from config.settings import AppConfig
 from utils.validators import DataValidator
+from utils.instrumentation import timed
 
 
 class ResultExporter:
@@ -11,6 +13,7 @@ class ResultExporter:
     def __init__(self):
         self.validator = DataValidator()
     
+    @timed('export.csv')
     def export_to_csv(self, results: List[Tuple[str, float]], 
                      custom_filename: str = None) -> str:
         """Export results to CSV file"""
@@ -35,6 +38,7 @@ class ResultExporter:
         df.to_csv(filename, index=False, encoding='utf-8')
         return filename
     
+    @timed('export.excel')
     def export_to_excel(self, results: List[Tuple[str, float]], 
                        calculation_steps: dict = None,
                        custom_filename: str = None) -> str:
@@ -83,6 +87,15 @@ class ResultExporter:
                     'Tipe': calculation_steps['criteria_types']
                 })
                 df_criteria.to_excel(writer, sheet_name='Kriteria', index=False)
+                
+                # Fuzzy scores (l, m, u) next to the defuzzified SAW score
+                if 'fuzzy' in calculation_steps:
+                    fuzzy_scores = calculation_steps['fuzzy']['scores']
+                    df_fuzzy = pd.DataFrame(fuzzy_scores, columns=['l', 'm', 'u'],
+                                            index=calculation_steps['alternatives'])
+                    scores = dict(results)
+                    df_fuzzy['Skor SAW'] = [scores[alt] for alt in calculation_steps['alternatives']]
+                    df_fuzzy.to_excel(writer, sheet_name='Skor Fuzzy')
         
         return filename
 
@@ -93,6 +106,7 @@ class SensitivityExporter:
     def __init__(self):
         self.validator = DataValidator()
     
+    @timed('export.sensitivity_csv')
     def export_sensitivity_to_csv(self, sensitivity_results: List[dict], 
                                  criteria_name: str,
                                  stability_info: dict,
@@ -104,12 +118,16 @@ class SensitivityExporter:
         # Create DataFrame
         data = []
         for result in sensitivity_results:
-            data.append({
+            row = {
                 'Perubahan_Bobot': result['change'],
                 'Bobot_Baru': result['new_weight'],
                 'Alternatif_Terbaik': result['winner'],
                 'Skor_Terbaik': result['score']
-            })
+            }
+            if 'kendall' in result:
+                row.update({'Spearman': result['spearman'], 'Kendall_Tau': result['kendall'],
+                            'Irisan_Top_K': result['top_k_overlap']})
+            data.append(row)
         
         df = pd.DataFrame(data)
         
@@ -119,6 +137,10 @@ class SensitivityExporter:
             f"# Stabilitas: {stability_info['stability']:.1f}% ({stability_info['level']})",
             f"# Alternatif Terbaik Asli: {stability_info['original_winner']}"
         ]
+        if 'kendall' in stability_info:
+            header_info.append(f"# Rata-rata Spearman: {stability_info['spearman']:.4f}, "
+                               f"Kendall tau-b: {stability_info['kendall']:.4f}, "
+                               f"Irisan Top-K: {stability_info['top_k_overlap']:.4f}")
         
         # Generate filename
         if custom_filename:
@@ -138,4 +160,88 @@ class SensitivityExporter:
         
         # Append DataFrame
         df.to_csv(filename, mode='a', index=False, encoding='utf-8')
+        return filename
+
+    
+    @timed('export.tornado_csv')
+    def export_tornado_to_csv(self, summary: List[dict], weight_range: float,
+                              original_winner: str, custom_filename: str = None) -> str:
+        """Export the all-criteria stability ranking to CSV"""
+        if not summary:
+            raise ValueError("No sensitivity results to export")
+        
+        df = pd.DataFrame([{
+            'Peringkat_Sensitivitas': rank,
+            'Kriteria': item['criteria'],
+            'Bobot_Asli': item['original_weight'],
+            'Stabilitas_Persen': item['stability'],
+            'Tingkat': item['level'],
+            'Jumlah_Perubahan_Pemenang': item['winner_changes'],
+            'Penurunan_Kritis': item['lower_change'],
+            'Kenaikan_Kritis': item['upper_change'],
+            'Skor_Min': item['low_score'],
+            'Skor_Maks': item['high_score'],
+            'Rentang_Skor': item['swing']
+        } for rank, item in enumerate(summary, 1)])
+        
+        header_info = [
+            "# Analisis Sensitivitas - Semua Kriteria",
+            f"# Range Perubahan: +/-{weight_range:.3f}",
+            f"# Alternatif Terbaik Asli: {original_winner}"
+        ]
+        
+        # Generate filename
+        if custom_filename:
+            filename = self.validator.sanitize_filename(custom_filename)
+            if not filename.endswith('.csv'):
+                filename += '.csv'
+        else:
+            timestamp = datetime.now().strftime(AppConfig.EXPORT_DATE_FORMAT)
+            filename = f"sensitivitas_semua_kriteria_{timestamp}.csv"
+        
+        with open(filename, 'w', encoding='utf-8') as f:
+            for header in header_info:
+                f.write(header + '\n')
+            f.write('\n')
+        
+        df.to_csv(filename, mode='a', index=False, encoding='utf-8')
+        return filename
+
+
+class ScenarioExporter:
+    """Export multi-scenario comparison results"""
+    
+    def __init__(self):
+        self.validator = DataValidator()
+    
+    @timed('export.scenarios_csv')
+    def export_scenarios_to_csv(self, scenario_names: List[str], alternatives: List[str],
+                                scores: np.ndarray, custom_filename: str = None) -> str:
+        """Export aligned scenario scores and ranks to CSV"""
+        scores = np.asarray(scores, dtype=float)
+        if scores.size == 0:
+            raise ValueError("No scenario results to export")
+        
+        # Rank per scenario: 1 = best
+        order = np.argsort(-scores, axis=1, kind='stable')
+        ranks = np.empty_like(order)
+        np.put_along_axis(ranks, order, np.arange(1, scores.shape[1] + 1)[None, :], axis=1)
+        
+        # One frame from all columns; inserting them one by one copies the block each time
+        columns = {'Alternatif': alternatives}
+        for i, name in enumerate(scenario_names):
+            columns[f'Skor_{name}'] = scores[i]
+            columns[f'Peringkat_{name}'] = ranks[i]
+        df = pd.DataFrame(columns)
+        
+        # Generate filename
+        if custom_filename:
+            filename = self.validator.sanitize_filename(custom_filename)
+            if not filename.endswith('.csv'):
+                filename += '.csv'
+        else:
+            timestamp = datetime.now().strftime(AppConfig.EXPORT_DATE_FORMAT)
+            filename = f"skenario_saw_{timestamp}.csv"
+        
+        df.to_csv(filename, index=False, encoding='utf-8')
         return filename
\ No newline at end of file
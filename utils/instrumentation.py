@@ -0,0 +1,212 @@
+import atexit
+import cProfile
+import io
+import json
+import math
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from collections import deque
+from functools import wraps
+from typing import Any, Dict, Optional
+
+from config.settings import AppConfig
+
+
+class Histogram:
+    """Timing histogram with log-spaced buckets and the last N samples"""
+
+    BUCKETS_PER_DECADE = 4
+
+    def __init__(self, last_n: int):
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self.buckets: Dict[int, int] = {}
+        self.recent = deque(maxlen=last_n)
+
+    def add(self, seconds: float):
+        """Record one sample"""
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+        bucket = math.floor(math.log10(max(seconds, 1e-9)) * self.BUCKETS_PER_DECADE)
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.recent.append(seconds)
+
+    def summary(self) -> Dict[str, Any]:
+        """Count, mean, extremes and percentiles of the recent samples"""
+        recent = sorted(self.recent)
+
+        def percentile(q):
+            return recent[min(len(recent) - 1, int(q * len(recent)))] if recent else 0.0
+
+        return {
+            'count': self.count,
+            'total_s': self.total,
+            'mean_s': self.total / self.count if self.count else 0.0,
+            'min_s': self.min if self.count else 0.0,
+            'max_s': self.max,
+            'p50_s': percentile(0.50),
+            'p95_s': percentile(0.95),
+            'last_s': list(self.recent),
+            'buckets': {f"1e{b / self.BUCKETS_PER_DECADE:+.2f}s": n
+                        for b, n in sorted(self.buckets.items())}
+        }
+
+
+class MetricsRegistry:
+    """In-process counters, timing histograms and optional profiling capture"""
+
+    def __init__(self, enabled: bool = False, last_n: int = 50):
+        self.enabled = enabled
+        self.last_n = last_n
+        self.counters: Dict[str, int] = {}
+        self.histograms: Dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+        self._profiler: Optional[cProfile.Profile] = None
+        self._tracing_memory = False
+
+    def increment(self, name: str, value: int = 1):
+        """Increase a counter"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def record(self, name: str, seconds: float):
+        """Record a timing sample (also counts the call)"""
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram(self.last_n)
+            histogram.add(seconds)
+            self.counters[name] = self.counters.get(name, 0) + 1
+
+    def reset(self):
+        """Clear all collected metrics"""
+        with self._lock:
+            self.counters = {}
+            self.histograms = {}
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Machine-readable copy of all metrics"""
+        with self._lock:
+            return {
+                'enabled': self.enabled,
+                'counters': dict(self.counters),
+                'timings': {name: h.summary() for name, h in sorted(self.histograms.items())}
+            }
+
+    def dump(self) -> str:
+        """Human-readable table of all timings and counters"""
+        snapshot = self.snapshot()
+        lines = [f"Metrics {'aktif' if self.enabled else 'nonaktif'}",
+                 f"{'Nama':<45}{'N':>7}{'Rata2 ms':>11}{'p50 ms':>10}{'p95 ms':>10}{'Maks ms':>10}",
+                 "-" * 93]
+        for name, t in snapshot['timings'].items():
+            lines.append(f"{name:<45}{t['count']:>7}{t['mean_s'] * 1000:>11.2f}"
+                         f"{t['p50_s'] * 1000:>10.2f}{t['p95_s'] * 1000:>10.2f}"
+                         f"{t['max_s'] * 1000:>10.2f}")
+        counters = {k: v for k, v in snapshot['counters'].items() if k not in snapshot['timings']}
+        if counters:
+            lines.append("")
+            lines.extend(f"{name:<45}{value:>7}" for name, value in sorted(counters.items()))
+        return "\n".join(lines)
+
+    # --- Profiling capture ---------------------------------------------------
+
+    @property
+    def profiling(self) -> bool:
+        return self._profiler is not None
+
+    def start_profiling(self, memory: bool = True):
+        """Start cProfile (and optionally tracemalloc) capture"""
+        if self._profiler is not None:
+            return
+        self._profiler = cProfile.Profile()
+        self._profiler.enable()
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._tracing_memory = True
+
+    def stop_profiling(self, top: int = 25) -> str:
+        """Stop capture and return the top functions and allocation sites"""
+        if self._profiler is None:
+            return ""
+        self._profiler.disable()
+        stream = io.StringIO()
+        pstats.Stats(self._profiler, stream=stream).sort_stats('cumulative').print_stats(top)
+        self._profiler = None
+
+        if self._tracing_memory:
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            self._tracing_memory = False
+            stream.write(f"\nPuncak memori: {peak / 1024 / 1024:.2f} MiB\n")
+            for stat in snapshot.statistics('lineno')[:top]:
+                stream.write(f"{stat}\n")
+        return stream.getvalue()
+
+
+metrics = MetricsRegistry(
+    enabled=AppConfig.METRICS_ENABLED or os.environ.get('SAW_METRICS') == '1',
+    last_n=AppConfig.METRICS_LAST_N
+)
+
+
+def timed(name: str):
+    """Decorator recording the call duration under `name` when metrics are enabled"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not metrics.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                metrics.record(name, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+class _TimedBlock:
+    """Context manager behind track()"""
+
+    __slots__ = ('name', 'start')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.start = None
+
+    def __enter__(self):
+        if metrics.enabled:
+            self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.start is not None:
+            metrics.record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+def track(name: str) -> _TimedBlock:
+    """Context manager recording the block duration under `name` when metrics are enabled"""
+    return _TimedBlock(name)
+
+
+def _dump_on_exit(path: str):
+    """Write the metrics snapshot as JSON at interpreter exit"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(metrics.snapshot(), f, indent=2)
+
+
+if os.environ.get('SAW_METRICS_DUMP'):
+    metrics.enabled = True
+    atexit.register(_dump_on_exit, os.environ['SAW_METRICS_DUMP'])
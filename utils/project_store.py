@@ -0,0 +1,318 @@
+import json
+import os
+import threading
+import queue
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+from config.settings import AppConfig
+from models.ahp import AHPWeights
+from models.criteria_tree import CriteriaTree
+from utils.instrumentation import timed
+
+
+class ProjectStore:
+    """Save/load SAW projects as a directory of binary sections plus a JSON sidecar"""
+
+    FORMAT_VERSION = 1
+    SECTIONS = ('meta', 'weights', 'matrix', 'results', 'analyses')
+    METADATA_FILE = 'project.json'
+
+    # --- Snapshot (UI thread) ----------------------------------------------------
+
+    def snapshot(self, model, sections: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Copy the requested sections of the model into plain arrays / JSON values"""
+        sections = set(self.SECTIONS if sections is None else sections)
+        data: Dict[str, Any] = {'sections': sections}
+
+        # The metadata sidecar is always written so the project stays self-describing
+        data['meta'] = {
+            'format_version': self.FORMAT_VERSION,
+            'saved_at': datetime.now().isoformat(timespec='seconds'),
+            'alternatives': list(model.alternatives),
+            'criteria': list(model.criteria),
+            'criteria_types': list(model.criteria_types),
+            'imputation': model.imputation,
+            'dtype': model.dtype.name,
+            'weight_method': model.weight_method,
+            'criteria_tree': None if model.criteria_tree is None else {
+                'names': list(model.criteria_tree.names),
+                'parents': list(model.criteria_tree.parents),
+                'local_weights': list(model.criteria_tree.local_weights)
+            }
+        }
+        if 'weights' in sections:
+            data['weights'] = np.asarray(model.weights, dtype=float)
+            data['fuzzy_weights'] = None if model.fuzzy_weights is None else np.array(model.fuzzy_weights)
+            # Manual weights are kept while an AHP, tree or objective method is active
+            data['manual_weights'] = (np.array(model.manual_weights, dtype=float)
+                                      if model.manual_weights else None)
+            data['ahp_matrix'] = None if model.ahp is None else np.array(model.ahp.matrix)
+        if 'matrix' in sections:
+            data['matrix'] = np.array(model.decision_matrix, dtype=float)
+            data['fuzzy_matrix'] = None if model.fuzzy_matrix is None else np.array(model.fuzzy_matrix)
+            data['interval_matrix'] = None if model.interval_matrix is None else np.array(model.interval_matrix)
+        if 'results' in sections:
+            data['scores'] = None if model.scores is None else np.array(model.scores, dtype=float)
+        if 'analyses' in sections:
+            arrays: Dict[str, np.ndarray] = {}
+            data['analyses'] = self._split_arrays(model.analyses, arrays, 'analysis')
+            scenario_defs = []
+            for i, (name, (weights, matrix)) in enumerate(model.scenarios._scenarios.items()):
+                scenario_defs.append({'name': name,
+                                      'weights': None if weights is None else f"scenario_{i}_weights",
+                                      'matrix': None if matrix is None else f"scenario_{i}_matrix"})
+                if weights is not None:
+                    arrays[f"scenario_{i}_weights"] = weights
+                if matrix is not None:
+                    arrays[f"scenario_{i}_matrix"] = matrix
+            data['scenarios'] = scenario_defs
+            data['analysis_arrays'] = arrays
+        return data
+
+    def _split_arrays(self, value, arrays: Dict[str, np.ndarray], prefix: str):
+        """Replace ndarrays with references and numpy scalars with Python values"""
+        if isinstance(value, np.ndarray):
+            key = f"{prefix}_{len(arrays)}"
+            arrays[key] = value
+            return {'__array__': key}
+        if isinstance(value, np.generic):
+            return value.item()
+        if isinstance(value, dict):
+            return {str(k): self._split_arrays(v, arrays, prefix) for k, v in value.items()}
+        if isinstance(value, tuple):
+            return {'__tuple__': [self._split_arrays(v, arrays, prefix) for v in value]}
+        if isinstance(value, list):
+            return [self._split_arrays(v, arrays, prefix) for v in value]
+        return value
+
+    def _join_arrays(self, value, arrays):
+        """Inverse of _split_arrays"""
+        if isinstance(value, dict):
+            if '__array__' in value:
+                return arrays[value['__array__']]
+            if '__tuple__' in value:
+                return tuple(self._join_arrays(v, arrays) for v in value['__tuple__'])
+            return {k: self._join_arrays(v, arrays) for k, v in value.items()}
+        if isinstance(value, list):
+            return [self._join_arrays(v, arrays) for v in value]
+        return value
+
+    # --- Writing (any thread) ----------------------------------------------------
+
+    @staticmethod
+    def _atomic_write(path: str, writer):
+        """Write through a temporary file and rename it into place"""
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            writer(f)
+        os.replace(tmp_path, path)
+
+    def _write_optional(self, path: str, array: Optional[np.ndarray]):
+        """Write an optional array; None removes a previously written file"""
+        if array is None:
+            if os.path.exists(path):
+                os.remove(path)
+        else:
+            self._atomic_write(path, lambda f: np.save(f, array))
+
+    @timed('project.write')
+    def write(self, path: str, data: Dict[str, Any]):
+        """Write a snapshot; only the sections it contains are touched on disk"""
+        os.makedirs(path, exist_ok=True)
+        sections = data['sections']
+
+        if 'weights' in sections:
+            self._atomic_write(os.path.join(path, 'weights.npy'),
+                               lambda f: np.save(f, data['weights']))
+            self._write_optional(os.path.join(path, 'fuzzy_weights.npy'), data['fuzzy_weights'])
+            self._write_optional(os.path.join(path, 'manual_weights.npy'), data['manual_weights'])
+            self._write_optional(os.path.join(path, 'ahp_matrix.npy'), data['ahp_matrix'])
+        if 'matrix' in sections:
+            self._atomic_write(os.path.join(path, 'matrix.npy'),
+                               lambda f: np.save(f, data['matrix']))
+            self._write_optional(os.path.join(path, 'fuzzy_matrix.npy'), data['fuzzy_matrix'])
+            self._write_optional(os.path.join(path, 'interval_matrix.npy'), data['interval_matrix'])
+        if 'results' in sections:
+            self._write_optional(os.path.join(path, 'scores.npy'), data['scores'])
+        if 'analyses' in sections:
+            self._atomic_write(os.path.join(path, 'analyses.npz'),
+                               lambda f: np.savez_compressed(f, **data['analysis_arrays']))
+            analyses_json = json.dumps({'analyses': data['analyses'],
+                                        'scenarios': data['scenarios']}).encode('utf-8')
+            self._atomic_write(os.path.join(path, 'analyses.json'),
+                               lambda f: f.write(analyses_json))
+
+        # Sidecar last: it marks the project as complete
+        meta_json = json.dumps(data['meta'], indent=2).encode('utf-8')
+        self._atomic_write(os.path.join(path, self.METADATA_FILE), lambda f: f.write(meta_json))
+
+    def save(self, model, path: str, sections: Optional[Iterable[str]] = None) -> str:
+        """Snapshot and write synchronously"""
+        path = self.normalize_path(path)
+        self.write(path, self.snapshot(model, sections))
+        model.dirty_sections.clear()
+        return path
+
+    # --- Loading -----------------------------------------------------------------
+
+    @staticmethod
+    def normalize_path(path: str) -> str:
+        """Accept either the project directory or its project.json"""
+        if os.path.basename(path) == ProjectStore.METADATA_FILE:
+            return os.path.dirname(path)
+        if not path.endswith(AppConfig.PROJECT_EXTENSION):
+            path += AppConfig.PROJECT_EXTENSION
+        return path
+
+    @timed('project.load')
+    def load(self, path: str, model):
+        """Load a project into the given model"""
+        path = self.normalize_path(path)
+        meta_path = os.path.join(path, self.METADATA_FILE)
+        if not os.path.exists(meta_path):
+            raise ValueError(f"Project not found: {path}")
+
+        with open(meta_path, encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get('format_version', 0) > self.FORMAT_VERSION:
+            raise ValueError("Project was saved by a newer version")
+
+        weights = np.load(os.path.join(path, 'weights.npy'))
+        matrix = np.load(os.path.join(path, 'matrix.npy'))
+        # Fuzzy (l, m, u) and interval (low, high) cells are kept next to the crisp matrix
+        if os.path.exists(os.path.join(path, 'fuzzy_weights.npy')):
+            weights = np.load(os.path.join(path, 'fuzzy_weights.npy'))
+        if os.path.exists(os.path.join(path, 'fuzzy_matrix.npy')):
+            matrix = np.load(os.path.join(path, 'fuzzy_matrix.npy'))
+        elif os.path.exists(os.path.join(path, 'interval_matrix.npy')):
+            matrix = np.load(os.path.join(path, 'interval_matrix.npy'))
+
+        model.reset()
+        # Imputation and dtype first: set_data builds the cached matrix with them
+        model.set_imputation(meta.get('imputation', AppConfig.IMPUTATION_METHOD))
+        model.set_dtype(meta.get('dtype', AppConfig.COMPUTE_DTYPE))
+        model.set_data(meta['alternatives'], meta['criteria'], weights.tolist(),
+                       matrix.tolist(), meta['criteria_types'])
+        self._load_weighting(path, meta, model)
+
+        scores_path = os.path.join(path, 'scores.npy')
+        if os.path.exists(scores_path):
+            scores = np.load(scores_path)
+            order = np.argsort(-scores, kind='stable')
+            model.scores = scores
+            model.results = [(model.alternatives[i], scores[i]) for i in order]
+
+        analyses_path = os.path.join(path, 'analyses.json')
+        if os.path.exists(analyses_path):
+            with open(analyses_path, encoding='utf-8') as f:
+                stored = json.load(f)
+            with np.load(os.path.join(path, 'analyses.npz')) as npz:
+                arrays = {key: npz[key] for key in npz.files}
+            for scenario in stored['scenarios']:
+                model.scenarios.add_scenario(
+                    scenario['name'],
+                    weights=None if scenario['weights'] is None else arrays[scenario['weights']],
+                    decision_matrix=None if scenario['matrix'] is None else arrays[scenario['matrix']])
+            model.analyses = self._join_arrays(stored['analyses'], arrays)
+
+        model.dirty_sections.clear()
+        return model
+
+    @staticmethod
+    def _load_weighting(path: str, meta: Dict[str, Any], model):
+        """Restore the weighting method with its manual weights, AHP comparisons and criteria tree"""
+        ahp_path = os.path.join(path, 'ahp_matrix.npy')
+        if os.path.exists(ahp_path):
+            matrix = np.load(ahp_path)
+            model.ahp = AHPWeights(len(matrix), matrix)
+        tree = meta.get('criteria_tree')
+        if tree is not None:
+            model.criteria_tree = CriteriaTree()
+            for name, parent, weight in zip(tree['names'], tree['parents'], tree['local_weights']):
+                model.criteria_tree.add_node(name, weight, None if parent < 0 else parent)
+        manual_path = os.path.join(path, 'manual_weights.npy')
+        if os.path.exists(manual_path):
+            model.manual_weights = np.load(manual_path).tolist()
+        # The saved weights already are the method's weights; only the method is restored
+        model.weight_method = meta.get('weight_method', 'manual')
+
+
+class ProjectAutosaver:
+    """Periodically writes dirty model sections on a background thread"""
+
+    def __init__(self, root, model, store: Optional[ProjectStore] = None,
+                 interval_ms: int = AppConfig.AUTOSAVE_INTERVAL_MS):
+        self.root = root
+        self.model = model
+        self.store = store or ProjectStore()
+        self.interval_ms = interval_ms
+        self.path: Optional[str] = None
+        self.enabled = False
+        self.last_error: Optional[str] = None
+        self._queue: "queue.Queue[Optional[Tuple[str, Dict[str, Any]]]]" = queue.Queue()
+        self._worker = threading.Thread(target=self._run, name='saw-autosave', daemon=True)
+        self._worker.start()
+        self._after_id = None
+
+    def start(self, path: str):
+        """Enable autosave to the given project path"""
+        self.path = self.store.normalize_path(path)
+        self.enabled = True
+        self._schedule()
+
+    def stop(self):
+        """Disable autosave"""
+        self.enabled = False
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _schedule(self):
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+        self._after_id = self.root.after(self.interval_ms, self._tick)
+
+    def _tick(self):
+        """UI-thread tick: snapshot dirty sections and hand them to the worker"""
+        self._after_id = None
+        if not self.enabled or not self.path:
+            return
+        self.flush()
+        self._schedule()
+
+    def flush(self):
+        """Queue the currently dirty sections for writing"""
+        dirty = set(self.model.dirty_sections)
+        if not dirty or not self.path or not self.model.decision_matrix:
+            return
+        data = self.store.snapshot(self.model, dirty)
+        self.model.dirty_sections.difference_update(dirty)
+        self._queue.put((self.path, data))
+
+    def _run(self):
+        """Worker loop: disk writes happen here, never on the Tk thread"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            path, data = item
+            try:
+                self.store.write(path, data)
+                self.last_error = None
+            except Exception as e:
+                # Re-mark the sections so the next tick retries them
+                self.last_error = str(e)
+                self.model.dirty_sections.update(data['sections'])
+            finally:
+                self._queue.task_done()
+
+    def shutdown(self, flush: bool = True):
+        """Flush pending work and stop the worker thread"""
+        if flush and self.enabled:
+            self.flush()
+        self.stop()
+        self._queue.put(None)
+        self._worker.join(timeout=10)
@@ -1,6 +1,9 @@
 from typing import List, Tuple, Optional
 import re
 
+from models.fuzzy import parse_cell, is_triangular
+from models.intervals import parse_interval
+
 
 class DataValidator:
     """Data validation utilities"""
@@ -48,8 +51,11 @@ class DataValidator:
     
     @staticmethod
     def validate_matrix_value(value_str: str) -> Tuple[bool, float, str]:
-        """Validate matrix value"""
+        """Validate matrix value (a number or a 'low-high' range)"""
         try:
+            value = parse_interval(value_str)
+            if value is not None:
+                return True, value, ""
             value = float(value_str)
             if value < 0:
                 return False, 0, "Nilai tidak boleh negatif"
@@ -57,6 +63,18 @@ class DataValidator:
         except ValueError:
             return False, 0, "Nilai harus berupa angka"
     
+    @staticmethod
+    def validate_fuzzy_value(value_str: str) -> Tuple[bool, object, str]:
+        """Validate a fuzzy cell: a number, 'l;m;u' or a linguistic rating"""
+        try:
+            value = parse_cell(value_str)
+        except ValueError:
+            return False, 0, "Nilai harus angka, l;m;u (l <= m <= u) atau rating linguistik"
+        lowest = value[0] if is_triangular(value) else value
+        if lowest < 0:
+            return False, 0, "Nilai tidak boleh negatif"
+        return True, value, ""
+    
     @staticmethod
     def validate_criteria_type(criteria_type: str) -> Tuple[bool, str]:
         """Validate criteria type"""
@@ -85,8 +103,9 @@ class DataValidator:
     
     @staticmethod
     def validate_complete_data(alternatives: List[str], criteria: List[str], 
-                             weights: List[float], decision_matrix: List[List[float]]) -> Tuple[bool, str]:
-        """Validate complete dataset for SAW calculation"""
+                             weights: List[float], decision_matrix: List[List[float]],
+                             allow_missing: bool = False) -> Tuple[bool, str]:
+        """Validate complete dataset for SAW calculation (missing cells only when they are imputed)"""
         if not alternatives:
             return False, "Tidak ada alternatif yang didefinisikan"
         
@@ -107,6 +126,11 @@ class DataValidator:
                 return False, f"Baris {i+1} matriks tidak sesuai dengan jumlah kriteria"
         
         # Check for empty values
+        if allow_missing:
+            for j in range(len(criteria)):
+                if all(row[j] is None for row in decision_matrix):
+                    return False, f"Kolom {j+1} tidak memiliki nilai sama sekali"
+            return True, ""
         for i, row in enumerate(decision_matrix):
             for j, value in enumerate(row):
                 if value is None or (isinstance(value, str) and not value.strip()):
@@ -4,6 +4,8 @@ from .calculation_tab import CalculationTabView
 from .results_tab import ResultsTabView
 from .sensitivity_tab import SensitivityTabView
 from .group_tab import GroupTabView
+from .diagnostics_panel import DiagnosticsPanel
+from .ahp_dialog import AHPDialog
 
 __all__ = [
     'BaseTabView',
@@ -11,5 +13,7 @@ __all__ = [
     'CalculationTabView',
     'ResultsTabView',
     'SensitivityTabView',
-    'GroupTabView'
+    'GroupTabView',
+    'DiagnosticsPanel',
+    'AHPDialog'
 ]
\ No newline at end of file
@@ -0,0 +1,136 @@
+import tkinter as tk
+from tkinter import ttk, messagebox
+from fractions import Fraction
+from models.ahp import AHPWeights
+from config.settings import AppConfig
+
+
+class AHPDialog:
+    """Pairwise comparison window for AHP criteria weights"""
+
+    def __init__(self, root, model, on_apply):
+        self.root = root
+        self.model = model
+        self.on_apply = on_apply
+        n = len(model.criteria)
+        # Edit a copy; the model only changes when the weights are applied
+        self.ahp = AHPWeights(n, None if model.ahp is None or len(model.ahp) != n else model.ahp.matrix)
+        self.entries = {}
+        self._create_window()
+
+    def _create_window(self):
+        """Create the comparison grid and the consistency summary"""
+        self.window = tk.Toplevel(self.root)
+        self.window.title("Perbandingan Berpasangan (AHP)")
+        self.window.geometry("900x600")
+
+        ttk.Label(self.window, text="Isi seberapa penting kriteria baris dibanding kriteria kolom "
+                                    "(skala 1-9, misalnya 3 atau 1/3)").pack(anchor='w', padx=10, pady=5)
+
+        # Scrollable grid: 50+ criteria do not fit on screen
+        grid_frame = ttk.Frame(self.window)
+        grid_frame.pack(fill='both', expand=True, padx=10)
+        canvas = tk.Canvas(grid_frame, highlightthickness=0)
+        y_scroll = ttk.Scrollbar(grid_frame, orient='vertical', command=canvas.yview)
+        x_scroll = ttk.Scrollbar(grid_frame, orient='horizontal', command=canvas.xview)
+        canvas.configure(yscrollcommand=y_scroll.set, xscrollcommand=x_scroll.set)
+        y_scroll.pack(side='right', fill='y')
+        x_scroll.pack(side='bottom', fill='x')
+        canvas.pack(side='left', fill='both', expand=True)
+        table = ttk.Frame(canvas)
+        canvas.create_window((0, 0), window=table, anchor='nw')
+        table.bind('<Configure>', lambda e: canvas.configure(scrollregion=canvas.bbox('all')))
+
+        criteria = self.model.criteria
+        for j, name in enumerate(criteria):
+            ttk.Label(table, text=name, font=('Arial', 9, 'bold')).grid(row=0, column=j + 1, padx=2)
+        for i, name in enumerate(criteria):
+            ttk.Label(table, text=name, font=('Arial', 9, 'bold')).grid(row=i + 1, column=0, sticky='w', padx=2)
+            for j in range(len(criteria)):
+                if j > i:
+                    entry = ttk.Entry(table, width=6, justify='center')
+                    entry.insert(0, self._format(self.ahp.matrix[i, j]))
+                    entry.grid(row=i + 1, column=j + 1, padx=1, pady=1)
+                    entry.bind('<FocusOut>', lambda e, i=i, j=j: self._commit(i, j))
+                    entry.bind('<Return>', lambda e, i=i, j=j: self._commit(i, j))
+                    self.entries[(i, j)] = entry
+                else:
+                    # Diagonal and lower triangle follow from the upper triangle
+                    label = ttk.Label(table, width=6, anchor='center', foreground='gray')
+                    label.grid(row=i + 1, column=j + 1, padx=1, pady=1)
+                    self.entries[(i, j)] = label
+        self._refresh_lower()
+
+        summary_frame = ttk.Frame(self.window)
+        summary_frame.pack(fill='x', padx=10, pady=5)
+        self.summary_label = ttk.Label(summary_frame, text="", font=AppConfig.MONOSPACE_FONT, justify='left')
+        self.summary_label.pack(side='left')
+        ttk.Button(summary_frame, text="Batal", command=self.window.destroy).pack(side='right', padx=5)
+        ttk.Button(summary_frame, text="Terapkan Bobot", command=self._apply,
+                   style='green.TButton').pack(side='right', padx=5)
+        self._update_summary()
+
+    @staticmethod
+    def _format(value):
+        """Show reciprocals as 1/x"""
+        if value >= 1:
+            return f"{value:g}"
+        return f"1/{1 / value:g}"
+
+    @staticmethod
+    def _parse(text):
+        """Parse '3', '1/3' or '0.333'"""
+        value = float(Fraction(text.strip()))
+        if not 0.11 <= value <= 9:
+            raise ValueError
+        return value
+
+    def _commit(self, i, j):
+        """Store one edited comparison and update the weights"""
+        entry = self.entries[(i, j)]
+        try:
+            value = self._parse(entry.get())
+        except (ValueError, ZeroDivisionError):
+            entry.delete(0, tk.END)
+            entry.insert(0, self._format(self.ahp.matrix[i, j]))
+            return
+        if value != self.ahp.matrix[i, j]:
+            self.ahp.set_comparison(i, j, value)
+            self.entries[(j, i)].config(text=self._format(1 / value))
+            self._update_summary()
+
+    def _refresh_lower(self):
+        """Fill the diagonal and lower triangle labels"""
+        n = len(self.ahp)
+        for i in range(n):
+            for j in range(i + 1):
+                self.entries[(i, j)].config(text=self._format(self.ahp.matrix[i, j]))
+
+    def _update_summary(self):
+        """Show weights and the consistency ratio (warm-started, so cheap per edit)"""
+        weights = self.ahp.weights()
+        consistency = self.ahp.consistency()
+        status = "KONSISTEN" if consistency['consistent'] else "TIDAK KONSISTEN"
+        top = sorted(zip(self.model.criteria, weights), key=lambda item: -item[1])[:5]
+        text = (f"λ maks: {consistency['lambda_max']:.4f}   CI: {consistency['ci']:.4f}   "
+                f"CR: {consistency['cr']:.4f} ({status})\n"
+                "Bobot tertinggi: " + ", ".join(f"{name} {weight:.3f}" for name, weight in top))
+        self.summary_label.config(text=text)
+
+    def _apply(self):
+        """Hand the comparisons to the model and use the AHP weights"""
+        try:
+            focused = self.window.focus_get()
+        except KeyError:
+            focused = None  # focus inside a ttk popdown
+        for (i, j), entry in self.entries.items():
+            if entry is focused:
+                self._commit(i, j)
+        consistency = self.ahp.consistency()
+        if not consistency['consistent'] and not messagebox.askyesno(
+                "Konfirmasi", f"Rasio konsistensi {consistency['cr']:.3f} melebihi "
+                              f"{AppConfig.AHP_MAX_CR}. Tetap gunakan bobot ini?", parent=self.window):
+            return
+        self.model.ahp = self.ahp
+        self.window.destroy()
+        self.on_apply()
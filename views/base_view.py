@@ -1,6 +1,10 @@
+import base64
 import tkinter as tk
 from tkinter import ttk
 from abc import ABC, abstractmethod
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from config.settings import AppConfig
+from utils.instrumentation import track
 
 
 class BaseTabView(ABC):
@@ -66,4 +70,44 @@ class BaseTabView(ABC):
     
     def get_validator(self):
         """Get the validator from controller"""
-        return self.controller.get_validator()
\ No newline at end of file
+        return self.controller.get_validator()
+    
+    def get_chart_renderer(self):
+        """Get the shared off-thread chart renderer from controller"""
+        return self.controller.get_chart_renderer()
+    
+    def display_chart(self, frame, key, build):
+        """Replace the frame's content with a chart: an image drawn off the Tk thread, or a live canvas"""
+        for widget in frame.winfo_children():
+            widget.destroy()
+        
+        if AppConfig.CHART_RENDER_MODE == 'canvas':
+            canvas = FigureCanvasTkAgg(build(), frame)
+            with track('view.canvas_draw'):
+                canvas.draw()
+            canvas.get_tk_widget().pack(fill='both', expand=True)
+            return
+        
+        label = ttk.Label(frame, text="Membuat grafik...", anchor='center')
+        label.pack(fill='both', expand=True)
+        frame.update_idletasks()
+        width = frame.winfo_width()
+        future = self.get_chart_renderer().render(key, build, width if width > 1 else None)
+        self._poll_chart(label, future)
+    
+    def _poll_chart(self, label, future):
+        """Show the rendered image once ready; a newer chart destroys the label and ends the polling"""
+        if not label.winfo_exists():
+            return
+        if not future.done():
+            label.after(AppConfig.CHART_POLL_MS, self._poll_chart, label, future)
+            return
+        try:
+            png = future.result()
+        except Exception as e:
+            label.config(text=f"Gagal membuat grafik: {str(e)}")
+            return
+        with track('view.chart_image'):
+            image = tk.PhotoImage(master=label, data=base64.b64encode(png).decode('ascii'))
+        label.config(image=image, text='')
+        label.image = image  # keep a reference; Tk does not
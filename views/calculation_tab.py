@@ -2,6 +2,8 @@ import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import numpy as np
 from views.base_view import BaseTabView
+from config.settings import AppConfig
+from utils.instrumentation import timed
 
 
 class CalculationTabView(BaseTabView):
@@ -18,22 +20,28 @@ class CalculationTabView(BaseTabView):
         ttk.Button(control_frame, text="Reset", 
                   command=self.reset_calculation, style='red.TButton').pack(side='left', padx=5)
         
+        self.tie_aware_var = tk.BooleanVar(value=self.get_model().ranking_mode == 'tie_aware')
+        ttk.Checkbutton(control_frame, text="Deteksi skor seri (presisi tinggi)", 
+                       variable=self.tie_aware_var).pack(side='left', padx=15)
+        
         # Results display
         self.calc_text = scrolledtext.ScrolledText(self.scrollable_frame, height=30, 
                                                   font=('Courier', 10))
         self.calc_text.pack(fill='both', expand=True, padx=10, pady=5)
     
+    @timed('view.calculation.calculate_saw')
     def calculate_saw(self):
         """Perform SAW calculation and display results"""
         model = self.get_model()
         
-        if not model.decision_matrix:
+        if not model.has_scorable_matrix():
             messagebox.showwarning("Peringatan", "Simpan data terlebih dahulu!")
             return
         
         try:
             # Clear previous results
             self.calc_text.delete(1.0, tk.END)
+            model.ranking_mode = 'tie_aware' if self.tie_aware_var.get() else 'fast'
             
             # Get calculation steps
             steps = model.get_calculation_steps()
@@ -46,6 +54,7 @@ class CalculationTabView(BaseTabView):
         except Exception as e:
             messagebox.showerror("Error", f"Terjadi kesalahan dalam perhitungan: {str(e)}")
     
+    @timed('view.calculation.render_steps')
     def _display_calculation_steps(self, steps):
         """Display detailed calculation steps"""
         self.calc_text.insert(tk.END, "=== PERHITUNGAN METODE SAW ===\n\n")
@@ -61,6 +70,17 @@ class CalculationTabView(BaseTabView):
         
         # Step 4: Final ranking
         self._display_ranking(steps)
+        
+        # Optional steps: criteria hierarchy, fuzzy scores, interval bounds
+        number = 5
+        if 'tree_rollup' in steps:
+            self._display_tree_rollup(steps, number)
+            number += 1
+        if 'fuzzy' in steps:
+            self._display_fuzzy_scores(steps, number)
+            number += 1
+        if 'score_bounds' in steps:
+            self._display_score_bounds(steps, number)
     
     def _display_original_matrix(self, steps):
         """Display original decision matrix"""
@@ -75,8 +95,13 @@ class CalculationTabView(BaseTabView):
         for i, alt in enumerate(steps['alternatives']):
             self.calc_text.insert(tk.END, f"{alt:<15}")
             for j in range(len(steps['criteria'])):
-                self.calc_text.insert(tk.END, f"{matrix[i,j]:<12.3f}")
+                value = matrix[i, j]
+                self.calc_text.insert(tk.END, f"{value:<12.3f}" if value == value else f"{'-':<12}")
             self.calc_text.insert(tk.END, "\n")
+        
+        if 'missing' in steps:
+            self.calc_text.insert(tk.END, f"\n{steps['missing']['count']} sel kosong diisi dengan metode "
+                                          f"'{steps['missing']['method']}' per kolom\n")
     
     def _display_normalization(self, steps):
         """Display normalization process"""
@@ -88,11 +113,11 @@ class CalculationTabView(BaseTabView):
         # Show normalization formula for each criteria
         for j, criteria in enumerate(steps['criteria']):
             if steps['criteria_types'][j] == 'benefit':
-                max_val = np.max(matrix[:, j])
+                max_val = np.nanmax(matrix[:, j])
                 self.calc_text.insert(tk.END, 
                     f"Kriteria {criteria} (Benefit): R_ij = X_ij / {max_val:.3f}\n")
             else:
-                min_val = np.min(matrix[:, j])
+                min_val = np.nanmin(matrix[:, j])
                 self.calc_text.insert(tk.END, 
                     f"Kriteria {criteria} (Cost): R_ij = {min_val:.3f} / X_ij\n")
         
@@ -137,8 +162,69 @@ class CalculationTabView(BaseTabView):
         self.calc_text.insert(tk.END, "-" * 45 + "\n")
         
         scores = steps['scores']
+        alternatives = steps['alternatives']
+        tie_groups = [[alternatives[i] for i in group] for group in steps.get('tie_groups', [])]
+        tied = {alt for group in tie_groups for alt in group}
         for rank, (alt, score) in enumerate(scores, 1):
-            self.calc_text.insert(tk.END, f"{rank:<10}{alt:<20}{score:<15.4f}\n")
+            marker = " (seri)" if alt in tied else ""
+            self.calc_text.insert(tk.END, f"{rank:<10}{alt:<20}{score:<15.4f}{marker}\n")
+        
+        for group in tie_groups:
+            self.calc_text.insert(tk.END, f"\nSkor seri: {', '.join(group)} "
+                                          f"(urutan ditentukan aturan '{self.get_model().tie_break}')")
+    
+    def _display_tree_rollup(self, steps, number):
+        """Display the criteria tree weights and per-category partial scores"""
+        rollup = steps['tree_rollup']
+        nodes = rollup['nodes']
+        self.calc_text.insert(tk.END, f"\n\n{number}. ROLL-UP HIERARKI KRITERIA:\n")
+        self.calc_text.insert(tk.END, "Bobot global:\n")
+        for name, depth, weight in zip(nodes, rollup['depth'], rollup['global_weights']):
+            self.calc_text.insert(tk.END, f"{'  ' * depth}{name}: {weight:.3f}\n")
+        
+        top_columns = [nodes.index(name) for name in rollup['top_level']]
+        self.calc_text.insert(tk.END, f"\n{'Alternatif':<20}")
+        for name in rollup['top_level']:
+            self.calc_text.insert(tk.END, f"{name[:11]:<12}")
+        self.calc_text.insert(tk.END, f"{'Total':<12}\n")
+        
+        partial_scores = rollup['partial_scores']
+        index = {alt: i for i, alt in enumerate(steps['alternatives'])}
+        for alt, score in steps['scores']:
+            row = partial_scores[index[alt]]
+            self.calc_text.insert(tk.END, f"{alt:<20}")
+            for column in top_columns:
+                self.calc_text.insert(tk.END, f"{row[column]:<12.4f}")
+            self.calc_text.insert(tk.END, f"{score:<12.4f}\n")
+    
+    def _display_fuzzy_scores(self, steps, number):
+        """Display the triangular fuzzy scores (l, m, u) behind the crisp ranking"""
+        fuzzy = steps['fuzzy']
+        self.calc_text.insert(tk.END, f"\n\n{number}. SKOR FUZZY (l, m, u) DAN DEFUZZIFIKASI "
+                                      f"({AppConfig.FUZZY_DEFUZZIFICATION}):\n")
+        self.calc_text.insert(tk.END, "Bobot fuzzy:\n")
+        for criteria, (lower, middle, upper) in zip(steps['criteria'], fuzzy['weights']):
+            self.calc_text.insert(tk.END, f"{criteria}: ({lower:.3f}, {middle:.3f}, {upper:.3f})\n")
+        
+        self.calc_text.insert(tk.END, f"\n{'Alternatif':<20}{'l':<10}{'m':<10}{'u':<10}{'Skor':<10}\n")
+        index = {alt: i for i, alt in enumerate(steps['alternatives'])}
+        for alt, score in steps['scores']:
+            lower, middle, upper = fuzzy['scores'][index[alt]]
+            self.calc_text.insert(tk.END, f"{alt:<20}{lower:<10.4f}{middle:<10.4f}{upper:<10.4f}"
+                                          f"{score:<10.4f}\n")
+    
+    def _display_score_bounds(self, steps, number):
+        """Display worst/best-case scores and ranks of alternatives with range cells"""
+        bounds = steps['score_bounds']
+        self.calc_text.insert(tk.END, f"\n\n{number}. RENTANG SKOR (DATA INTERVAL):\n")
+        self.calc_text.insert(tk.END, f"{'Alternatif':<20}{'Terburuk':<12}{'Skor':<12}{'Terbaik':<12}"
+                                      f"{'Peringkat':<12}\n")
+        index = {alt: i for i, alt in enumerate(steps['alternatives'])}
+        for alt, score in steps['scores']:
+            i = index[alt]
+            ranks = f"{bounds['best_rank'][i]}-{bounds['worst_rank'][i]}"
+            self.calc_text.insert(tk.END, f"{alt:<20}{bounds['worst'][i]:<12.4f}{score:<12.4f}"
+                                          f"{bounds['best'][i]:<12.4f}{ranks:<12}\n")
     
     def reset_calculation(self):
         """Reset calculation results"""
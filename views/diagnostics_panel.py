@@ -0,0 +1,73 @@
+import tkinter as tk
+from tkinter import ttk, scrolledtext
+from utils.instrumentation import metrics
+
+
+class DiagnosticsPanel:
+    """Hidden diagnostics window (Ctrl+Shift+D) showing metrics and profiles"""
+
+    def __init__(self, root):
+        self.root = root
+        self.window = None
+
+    def toggle(self, event=None):
+        """Open the panel or bring it to front"""
+        if self.window is not None and self.window.winfo_exists():
+            self.window.lift()
+            self.refresh()
+            return
+        self._create_window()
+
+    def _create_window(self):
+        """Create the diagnostics window"""
+        self.window = tk.Toplevel(self.root)
+        self.window.title("Diagnostik")
+        self.window.geometry("900x500")
+
+        control_frame = ttk.Frame(self.window)
+        control_frame.pack(fill='x', padx=10, pady=5)
+
+        self.enabled_var = tk.BooleanVar(value=metrics.enabled)
+        ttk.Checkbutton(control_frame, text="Aktifkan metrics", variable=self.enabled_var,
+                        command=self._toggle_metrics).pack(side='left', padx=5)
+
+        self.profile_button = ttk.Button(control_frame, command=self._toggle_profiling)
+        self.profile_button.pack(side='left', padx=5)
+
+        ttk.Button(control_frame, text="Refresh", command=self.refresh).pack(side='left', padx=5)
+        ttk.Button(control_frame, text="Reset", command=self._reset).pack(side='left', padx=5)
+
+        self.text = scrolledtext.ScrolledText(self.window, font=('Courier', 9))
+        self.text.pack(fill='both', expand=True, padx=10, pady=5)
+
+        self._update_profile_label()
+        self.refresh()
+
+    def refresh(self):
+        """Show the current metrics table"""
+        self.text.delete(1.0, tk.END)
+        self.text.insert(tk.END, metrics.dump())
+
+    def _toggle_metrics(self):
+        """Enable or disable metric collection"""
+        metrics.enabled = self.enabled_var.get()
+        self.refresh()
+
+    def _toggle_profiling(self):
+        """Start profiling or stop it and show the report"""
+        if metrics.profiling:
+            report = metrics.stop_profiling()
+            self.refresh()
+            self.text.insert(tk.END, "\n\n=== PROFIL ===\n" + report)
+        else:
+            metrics.start_profiling()
+        self._update_profile_label()
+
+    def _update_profile_label(self):
+        """Sync the profiling button text"""
+        self.profile_button.config(text="Stop Profil" if metrics.profiling else "Mulai Profil")
+
+    def _reset(self):
+        """Clear collected metrics"""
+        metrics.reset()
+        self.refresh()
@@ -1,14 +1,51 @@
+import json
 import tkinter as tk
-from tkinter import ttk, messagebox
+from bisect import bisect_left
+from tkinter import ttk, messagebox, filedialog
 from views.base_view import BaseTabView
+from models.history import AddAlternative, RemoveAlternative, AddCriterion, RemoveCriterion, SetValue
+from models.incremental import IncrementalScorer
+from models.criteria_tree import CriteriaTree
+from models.fuzzy import is_triangular, cell_value, crisp_value, format_cell
+from views.ahp_dialog import AHPDialog
+from config.settings import AppConfig
+from utils.instrumentation import timed
 
 
 class InputTabView(BaseTabView):
     """Input tab for entering alternatives, criteria, and decision matrix"""
     
+    WEIGHT_METHODS = {
+        'Manual': 'manual',
+        'AHP': 'ahp',
+        'Hierarki (JSON)': 'tree',
+        'Entropy': 'entropy',
+        'CRITIC': 'critic',
+        'Standar Deviasi': 'std'
+    }
+    
+    IMPUTATION_METHODS = {
+        'Rata-rata kolom': 'mean',
+        'Median kolom': 'median',
+        'Nilai terburuk': 'worst',
+        'Tolak sel kosong': None
+    }
+    
     def create_widgets(self):
         """Create input widgets"""
-        self.matrix_entries = []
+        self.matrix_entries = []  # entry widgets, (alternatives x criteria)
+        self.row_headers = []
+        self.col_headers = []
+        self.row_slots = []  # grid row of each alternative (ascending)
+        self.col_slots = []  # grid column of each criteria (ascending)
+        
+        # Undo / redo of model edits
+        history_frame = ttk.Frame(self.scrollable_frame)
+        history_frame.pack(fill='x', padx=10, pady=(5, 0))
+        ttk.Button(history_frame, text="Undo (Ctrl+Z)", command=self.undo).pack(side='left', padx=5)
+        ttk.Button(history_frame, text="Redo (Ctrl+Y)", command=self.redo).pack(side='left', padx=5)
+        self.frame.bind_all('<Control-z>', lambda e: self.undo())
+        self.frame.bind_all('<Control-y>', lambda e: self.redo())
         
         # Alternatives section
         self._create_alternatives_section()
@@ -84,6 +121,14 @@ class InputTabView(BaseTabView):
         ttk.Button(crit_button_frame, text="Hapus Kriteria", 
                   command=self.remove_criteria, style='red.TButton').pack(side='left', padx=5)
         
+        # Objective weighting derived from the saved decision matrix
+        ttk.Label(crit_button_frame, text="Pembobotan:").pack(side='left', padx=(20, 5))
+        self.weight_method_var = tk.StringVar(value='Manual')
+        ttk.Combobox(crit_button_frame, textvariable=self.weight_method_var, state='readonly',
+                     values=list(self.WEIGHT_METHODS), width=16).pack(side='left', padx=5)
+        ttk.Button(crit_button_frame, text="Terapkan", 
+                  command=self.apply_weight_method).pack(side='left', padx=5)
+        
         # Listbox with scrollbar
         crit_list_frame = ttk.Frame(crit_frame)
         crit_list_frame.pack(fill='x', pady=5)
@@ -104,12 +149,53 @@ class InputTabView(BaseTabView):
         ttk.Button(matrix_frame, text="Generate Matriks Input", 
                   command=self.generate_matrix).pack(pady=5)
         
+        self.fuzzy_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(matrix_frame, text="Mode fuzzy (isi l;m;u atau SR/R/S/T/ST)", 
+                       variable=self.fuzzy_var, command=self._toggle_fuzzy).pack()
+        
+        # Empty cells are imputed; 'low-high' cells give score ranges
+        imputation_frame = ttk.Frame(matrix_frame)
+        imputation_frame.pack()
+        ttk.Label(imputation_frame, text="Sel kosong:").pack(side='left')
+        self.imputation_var = tk.StringVar(value=self._imputation_label(self.get_model().imputation))
+        imputation_combo = ttk.Combobox(imputation_frame, textvariable=self.imputation_var, width=16,
+                                        values=list(self.IMPUTATION_METHODS), state='readonly')
+        imputation_combo.pack(side='left', padx=5)
+        imputation_combo.bind('<<ComboboxSelected>>', lambda e: self.get_model().set_imputation(
+            self.IMPUTATION_METHODS[self.imputation_var.get()]))
+        ttk.Label(imputation_frame, text="Rentang: isi 3-5").pack(side='left', padx=5)
+        
         # Matrix container
         self.matrix_container = ttk.Frame(matrix_frame)
         self.matrix_container.pack(fill='both', expand=True, pady=5)
         
         ttk.Button(matrix_frame, text="Simpan Data", 
                   command=self.save_data, style='Accent.TButton').pack(pady=10)
+        
+        self._create_live_section()
+    
+    def _create_live_section(self):
+        """Create the optional live ranking section"""
+        live_frame = ttk.LabelFrame(self.scrollable_frame, text="Peringkat Live", padding=10)
+        live_frame.pack(fill='x', padx=10, pady=5)
+        
+        self.live_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(live_frame, text="Mode live (hitung ulang saat mengetik)", 
+                       variable=self.live_var, command=self._toggle_live).pack(anchor='w')
+        self.live_status = ttk.Label(live_frame, text="")
+        self.live_status.pack(anchor='w', pady=2)
+        
+        self.live_tree = ttk.Treeview(live_frame, columns=('rank', 'alternative', 'score'), 
+                                     show='headings', height=AppConfig.LIVE_TOP_K)
+        for column, heading, width in (('rank', 'Peringkat', 80), ('alternative', 'Alternatif', 250), 
+                                       ('score', 'Skor', 120)):
+            self.live_tree.heading(column, text=heading)
+            self.live_tree.column(column, width=width, anchor='center')
+        self.live_tree.pack(fill='x', pady=5)
+        
+        self.live_scorer = None  # rebuilt lazily after structural edits
+        self.live_pending = {}  # (row, column) -> value typed since the last recompute
+        self.live_after_id = None
     
     def add_alternative(self):
         """Add new alternative"""
@@ -129,12 +215,10 @@ class InputTabView(BaseTabView):
             return
         
         # Add to model and update UI
-        model.alternatives.append(alt_name)
+        command = model.history.execute(AddAlternative(alt_name))
         self.alt_listbox.insert(tk.END, alt_name)
         self.alt_entry.delete(0, tk.END)
-        
-        # Clear matrix if it exists
-        self._clear_matrix()
+        self._grid_insert_row(command.index)
     
     def remove_alternative(self):
         """Remove selected alternative"""
@@ -145,11 +229,10 @@ class InputTabView(BaseTabView):
         
         index = selected[0]
         model = self.get_model()
-        model.alternatives.pop(index)
+        self._commit_focused_entry()
+        model.history.execute(RemoveAlternative(index))
         self.alt_listbox.delete(index)
-        
-        # Clear matrix if it exists
-        self._clear_matrix()
+        self._grid_remove_row(index)
     
     def add_criteria(self):
         """Add new criteria"""
@@ -171,8 +254,12 @@ class InputTabView(BaseTabView):
             messagebox.showwarning("Peringatan", "Nama kriteria sudah ada!")
             return
         
-        # Validate weight
+        # Validate weight; fuzzy mode also takes (l, m, u) weights
         is_valid, weight, error_msg = validator.validate_weight(weight_str)
+        if model.fuzzy_matrix is not None and not is_valid:
+            is_fuzzy, fuzzy_weight, _ = validator.validate_fuzzy_value(weight_str)
+            if is_fuzzy and is_triangular(fuzzy_weight) and fuzzy_weight[1] > 0:
+                is_valid, weight = True, fuzzy_weight
         if not is_valid:
             messagebox.showwarning("Peringatan", error_msg)
             return
@@ -184,12 +271,8 @@ class InputTabView(BaseTabView):
             return
         
         # Add to model and update UI
-        model.criteria.append(crit_name)
-        model.weights.append(weight)
-        model.criteria_types.append(crit_type)
-        
-        display_text = f"{crit_name} (Bobot: {weight}, Tipe: {crit_type})"
-        self.crit_listbox.insert(tk.END, display_text)
+        command = model.history.execute(AddCriterion(crit_name, weight, crit_type))
+        self.crit_listbox.insert(tk.END, self._criteria_label(command.index))
         
         # Clear input fields
         self.crit_entry.delete(0, tk.END)
@@ -197,9 +280,7 @@ class InputTabView(BaseTabView):
         
         # Update sensitivity combo in controller
         self.controller.update_sensitivity_criteria()
-        
-        # Clear matrix if it exists
-        self._clear_matrix()
+        self._grid_insert_column(command.index)
     
     def remove_criteria(self):
         """Remove selected criteria"""
@@ -210,17 +291,63 @@ class InputTabView(BaseTabView):
         
         index = selected[0]
         model = self.get_model()
-        model.criteria.pop(index)
-        model.weights.pop(index)
-        model.criteria_types.pop(index)
+        self._commit_focused_entry()
+        model.history.execute(RemoveCriterion(index))
         self.crit_listbox.delete(index)
         
         # Update sensitivity combo in controller
         self.controller.update_sensitivity_criteria()
+        self._grid_remove_column(index)
+    
+    def apply_weight_method(self):
+        """Switch between manual weights, AHP comparisons and an objective weighting method"""
+        model = self.get_model()
+        method = self.WEIGHT_METHODS[self.weight_method_var.get()]
+        if method == 'ahp':
+            if len(model.criteria) < 2:
+                messagebox.showwarning("Peringatan", "Tambahkan minimal 2 kriteria!")
+                return
+            AHPDialog(self.frame.winfo_toplevel(), model, lambda: self._use_weight_method('ahp'))
+            return
+        if method == 'tree':
+            self._load_criteria_tree()
+            return
+        if method != 'manual' and not model.has_scorable_matrix():
+            messagebox.showwarning("Peringatan", "Simpan matriks keputusan yang lengkap terlebih dahulu!")
+            return
+        self._use_weight_method(method)
+    
+    def _load_criteria_tree(self):
+        """Read a criteria hierarchy from JSON and use its global weights"""
+        model = self.get_model()
+        filename = filedialog.askopenfilename(title="Buka Hierarki Kriteria", 
+                                              filetypes=[("JSON", "*.json"), ("Semua file", "*.*")])
+        if not filename:
+            return
+        try:
+            with open(filename, encoding='utf-8') as f:
+                tree = CriteriaTree.from_nested(json.load(f))
+            tree.compile(model.criteria)
+        except Exception as e:
+            messagebox.showerror("Error", f"Hierarki tidak valid: {str(e)}")
+            return
+        model.criteria_tree = tree
+        self._use_weight_method('tree')
+    
+    def _use_weight_method(self, method):
+        """Let the model derive its weights and refresh the views"""
+        model = self.get_model()
+        try:
+            model.set_weight_method(method)
+        except Exception as e:
+            messagebox.showerror("Error", f"Gagal menghitung bobot: {str(e)}")
+            return
         
-        # Clear matrix if it exists
-        self._clear_matrix()
+        self._refresh_lists()
+        self._live_structure_changed()
+        self.controller.refresh_all_views()
     
+    @timed('view.input.generate_matrix')
     def generate_matrix(self):
         """Generate matrix input grid"""
         model = self.get_model()
@@ -232,28 +359,22 @@ class InputTabView(BaseTabView):
         # Clear previous matrix
         self._clear_matrix()
         
-        # Create matrix input grid
-        self.matrix_entries = []
+        # Rows and columns get grid slots in display order; slots freed by removals
+        # stay empty so later inserts (e.g. undo) don't have to move other widgets
+        self.row_slots = list(range(1, len(model.alternatives) + 1))
+        self.col_slots = list(range(1, len(model.criteria) + 1))
         
         # Headers
-        tk.Label(self.matrix_container, text="Alternatif\\Kriteria", 
-                font=('Arial', 10, 'bold'), relief='ridge', bd=1).grid(row=0, column=0, sticky='nsew')
-        
-        for j, criteria in enumerate(model.criteria):
-            tk.Label(self.matrix_container, text=criteria, 
-                    font=('Arial', 10, 'bold'), relief='ridge', bd=1).grid(row=0, column=j+1, sticky='nsew')
+        self._make_header("Alternatif\\Kriteria", 0, 0)
+        self.col_headers = [self._make_header(criteria, 0, slot)
+                            for criteria, slot in zip(model.criteria, self.col_slots)]
         
         # Matrix entries
         for i, alternative in enumerate(model.alternatives):
-            tk.Label(self.matrix_container, text=alternative, 
-                    font=('Arial', 10, 'bold'), relief='ridge', bd=1).grid(row=i+1, column=0, sticky='nsew')
-            
-            row_entries = []
-            for j in range(len(model.criteria)):
-                entry = tk.Entry(self.matrix_container, width=10, justify='center')
-                entry.grid(row=i+1, column=j+1, padx=1, pady=1)
-                row_entries.append(entry)
-            self.matrix_entries.append(row_entries)
+            row_slot = self.row_slots[i]
+            self.row_headers.append(self._make_header(alternative, row_slot, 0))
+            self.matrix_entries.append([self._make_entry(model.cell(i, j), row_slot, col_slot)
+                                        for j, col_slot in enumerate(self.col_slots)])
         
         # Configure grid weights for resizing
         for i in range(len(model.alternatives) + 1):
@@ -261,6 +382,106 @@ class InputTabView(BaseTabView):
         for j in range(len(model.criteria) + 1):
             self.matrix_container.grid_columnconfigure(j, weight=1)
     
+    def _make_header(self, text, row_slot, col_slot):
+        """Create one header label of the matrix grid"""
+        label = tk.Label(self.matrix_container, text=text, 
+                        font=('Arial', 10, 'bold'), relief='ridge', bd=1)
+        label.grid(row=row_slot, column=col_slot, sticky='nsew')
+        return label
+    
+    def _make_entry(self, value, row_slot, col_slot):
+        """Create one matrix cell entry"""
+        entry = tk.Entry(self.matrix_container, width=10, justify='center')
+        entry.grid(row=row_slot, column=col_slot, padx=1, pady=1)
+        if value is not None and value == value:
+            entry.insert(0, format_cell(value))
+        entry.bind('<FocusOut>', self._on_entry_commit)
+        entry.bind('<Return>', self._on_entry_commit)
+        entry.bind('<KeyRelease>', self._on_entry_key)
+        return entry
+    
+    @staticmethod
+    def _free_slot(slots, index):
+        """Grid slot for a new line at index, or None when no free slot is left there"""
+        low = slots[index - 1] if index > 0 else 0
+        high = slots[index] if index < len(slots) else low + 2
+        return high - 1 if high - low > 1 else None
+    
+    def _shift_slots(self, slots, index, axis):
+        """Move the contiguous lines from index on by one slot to open a gap (rarely needed)"""
+        last = index
+        while last + 1 < len(slots) and slots[last + 1] == slots[last] + 1:
+            last += 1
+        for k in range(last, index - 1, -1):
+            slots[k] += 1
+            if axis == 'row':
+                widgets = [self.row_headers[k]] + self.matrix_entries[k]
+            else:
+                widgets = [self.col_headers[k]] + [row[k] for row in self.matrix_entries]
+            for widget in widgets:
+                widget.grid_configure(**{axis: slots[k]})
+        if axis == 'row':
+            self.matrix_container.grid_rowconfigure(slots[last], weight=1)
+        else:
+            self.matrix_container.grid_columnconfigure(slots[last], weight=1)
+    
+    def _grid_insert_row(self, i):
+        """Insert the grid row of alternative i; O(criteria)"""
+        self._live_structure_changed()
+        if not self.row_slots and not self.col_slots:
+            return  # grid not generated
+        model = self.get_model()
+        slot = self._free_slot(self.row_slots, i)
+        if slot is None:
+            self._shift_slots(self.row_slots, i, 'row')
+            slot = self._free_slot(self.row_slots, i)
+        
+        self.row_slots.insert(i, slot)
+        self.row_headers.insert(i, self._make_header(model.alternatives[i], slot, 0))
+        self.matrix_entries.insert(i, [self._make_entry(model.cell(i, j), slot, col_slot)
+                                       for j, col_slot in enumerate(self.col_slots)])
+        self.matrix_container.grid_rowconfigure(slot, weight=1)
+    
+    def _grid_remove_row(self, i):
+        """Delete the grid row of alternative i; O(criteria)"""
+        self._live_structure_changed()
+        if not self.row_slots:
+            return
+        slot = self.row_slots.pop(i)
+        self.row_headers.pop(i).destroy()
+        for entry in self.matrix_entries.pop(i):
+            entry.destroy()
+        self.matrix_container.grid_rowconfigure(slot, weight=0)
+    
+    def _grid_insert_column(self, j):
+        """Insert the grid column of criteria j; O(alternatives)"""
+        self._live_structure_changed()
+        if not self.row_slots and not self.col_slots:
+            return
+        model = self.get_model()
+        slot = self._free_slot(self.col_slots, j)
+        if slot is None:
+            self._shift_slots(self.col_slots, j, 'column')
+            slot = self._free_slot(self.col_slots, j)
+        
+        self.col_slots.insert(j, slot)
+        self.col_headers.insert(j, self._make_header(model.criteria[j], 0, slot))
+        for i, (row_slot, row_entries) in enumerate(zip(self.row_slots, self.matrix_entries)):
+            row_entries.insert(j, self._make_entry(model.cell(i, j), row_slot, slot))
+        self.matrix_container.grid_columnconfigure(slot, weight=1)
+    
+    def _grid_remove_column(self, j):
+        """Delete the grid column of criteria j; O(alternatives)"""
+        self._live_structure_changed()
+        if not self.col_slots:
+            return
+        slot = self.col_slots.pop(j)
+        self.col_headers.pop(j).destroy()
+        for row_entries in self.matrix_entries:
+            row_entries.pop(j).destroy()
+        self.matrix_container.grid_columnconfigure(slot, weight=0)
+    
+    @timed('view.input.save_data')
     def save_data(self):
         """Save matrix data to model"""
         if not self.matrix_entries:
@@ -278,10 +499,13 @@ class InputTabView(BaseTabView):
                 for j, entry in enumerate(row_entries):
                     value_str = entry.get().strip()
                     if not value_str:
-                        messagebox.showerror("Error", f"Nilai pada baris {i+1}, kolom {j+1} kosong!")
-                        return
+                        if model.imputation is None:
+                            messagebox.showerror("Error", f"Nilai pada baris {i+1}, kolom {j+1} kosong!")
+                            return
+                        row_data.append(None)  # imputed when scoring
+                        continue
                     
-                    is_valid, value, error_msg = validator.validate_matrix_value(value_str)
+                    is_valid, value, error_msg = self._parse_cell(value_str)
                     if not is_valid:
                         messagebox.showerror("Error", f"Baris {i+1}, kolom {j+1}: {error_msg}")
                         return
@@ -291,22 +515,27 @@ class InputTabView(BaseTabView):
             
             # Validate complete data
             is_valid, error_msg = validator.validate_complete_data(
-                model.alternatives, model.criteria, model.weights, decision_matrix
+                model.alternatives, model.criteria, model.weights, decision_matrix,
+                allow_missing=model.imputation is not None
             )
             if not is_valid:
                 messagebox.showerror("Error", error_msg)
                 return
             
             # Set data to model
-            model.set_data(
+            dropped = model.set_data(
                 model.alternatives, 
                 model.criteria, 
-                model.weights, 
+                model.weight_inputs(), 
                 decision_matrix, 
                 model.criteria_types
             )
             
-            messagebox.showinfo("Sukses", "Data berhasil disimpan!")
+            message = "Data berhasil disimpan!"
+            if dropped:
+                message += ("\nSkenario yang tidak sesuai lagi dengan data dihapus: "
+                            + ", ".join(dropped))
+            messagebox.showinfo("Sukses", message)
             
             # Refresh other views
             self.controller.refresh_all_views()
@@ -314,8 +543,231 @@ class InputTabView(BaseTabView):
         except Exception as e:
             messagebox.showerror("Error", f"Terjadi kesalahan: {str(e)}")
     
+    @timed('view.input.load_from_model')
+    def load_from_model(self):
+        """Repopulate lists and the matrix grid from the model (after opening a project)"""
+        model = self.get_model()
+        self.weight_method_var.set(next(label for label, method in self.WEIGHT_METHODS.items()
+                                        if method == model.weight_method))
+        self.fuzzy_var.set(model.fuzzy_matrix is not None)
+        self.imputation_var.set(self._imputation_label(model.imputation))
+        self._refresh_lists()
+        self._live_structure_changed()
+        self._clear_matrix()
+        if model.alternatives and model.criteria:
+            self.generate_matrix()
+    
+    def _criteria_label(self, index):
+        """Listbox text of one criteria"""
+        model = self.get_model()
+        weight = f"{model.weights[index]:.4g}"
+        if model.fuzzy_weights is not None:
+            weight += f" [{format_cell(cell_value(model.fuzzy_weights[index]))}]"
+        return f"{model.criteria[index]} (Bobot: {weight}, Tipe: {model.criteria_types[index]})"
+    
+    def _refresh_lists(self):
+        """Rebuild both listboxes from the model"""
+        model = self.get_model()
+        self.alt_listbox.delete(0, tk.END)
+        for alt_name in model.alternatives:
+            self.alt_listbox.insert(tk.END, alt_name)
+        
+        self.crit_listbox.delete(0, tk.END)
+        for j in range(len(model.criteria)):
+            self.crit_listbox.insert(tk.END, self._criteria_label(j))
+    
+    def _entry_position(self, widget):
+        """(row, column) of a matrix entry widget, or None"""
+        try:
+            info = widget.grid_info()
+        except (AttributeError, tk.TclError):
+            return None
+        if widget.master is not self.matrix_container or not isinstance(widget, tk.Entry):
+            return None
+        i = bisect_left(self.row_slots, int(info['row']))
+        j = bisect_left(self.col_slots, int(info['column']))
+        return i, j
+    
+    def _on_entry_commit(self, event):
+        """Record an edited matrix cell in the model (undoable)"""
+        position = self._entry_position(event.widget)
+        if position is not None:
+            self._commit_entry(*position)
+    
+    def _commit_entry(self, i, j):
+        """Store the value of entry (i, j) in the model when it is valid and changed"""
+        model = self.get_model()
+        value_str = self.matrix_entries[i][j].get().strip()
+        if value_str:
+            is_valid, value, _ = self._parse_cell(value_str)
+            if not is_valid:
+                return  # reported by save_data
+        else:
+            value = None
+        
+        if model.cell(i, j) != value:
+            model.history.execute(SetValue(i, j, value))
+    
+    def _imputation_label(self, method):
+        """Combobox text of an imputation method"""
+        return next(label for label, value in self.IMPUTATION_METHODS.items() if value == method)
+    
+    def _parse_cell(self, value_str):
+        """Validate a typed cell; fuzzy mode also accepts l;m;u and linguistic ratings"""
+        if self.get_model().fuzzy_matrix is not None:
+            return self.get_validator().validate_fuzzy_value(value_str)
+        return self.get_validator().validate_matrix_value(value_str)
+    
+    def _toggle_fuzzy(self):
+        """Switch the model between crisp and triangular fuzzy cells"""
+        model = self.get_model()
+        self._commit_focused_entry()
+        model.set_fuzzy(self.fuzzy_var.get())
+        self._refresh_lists()
+        if self.matrix_entries:
+            self.generate_matrix()
+        self._live_structure_changed()
+    
+    def _commit_focused_entry(self):
+        """Commit the cell being edited before a structural edit moves it"""
+        try:
+            focused = self.frame.focus_get()
+        except KeyError:  # focus inside a ttk popdown
+            return
+        position = self._entry_position(focused)
+        if position is not None:
+            self._commit_entry(*position)
+    
+    def undo(self):
+        """Undo the last model edit"""
+        self._commit_focused_entry()
+        self._show_history_step(self.get_model().history.undo(), applied=False)
+    
+    def redo(self):
+        """Redo the last undone model edit"""
+        self._show_history_step(self.get_model().history.redo(), applied=True)
+    
+    def _show_history_step(self, command, applied):
+        """Update the widgets touched by an undone / redone command"""
+        if command is None:
+            return
+        if command.structural:
+            inserted = isinstance(command, (AddAlternative, AddCriterion)) == applied
+            if isinstance(command, (AddAlternative, RemoveAlternative)):
+                if inserted:
+                    self.alt_listbox.insert(command.index, command.name)
+                    self._grid_insert_row(command.index)
+                else:
+                    self.alt_listbox.delete(command.index)
+                    self._grid_remove_row(command.index)
+            else:
+                if inserted:
+                    self.crit_listbox.insert(command.index, self._criteria_label(command.index))
+                    self._grid_insert_column(command.index)
+                else:
+                    self.crit_listbox.delete(command.index)
+                    self._grid_remove_column(command.index)
+                self.controller.update_sensitivity_criteria()
+            return
+        
+        self._live_queue(command.row, command.column, 
+                         self.get_model().decision_matrix[command.row][command.column])
+        if self.matrix_entries:
+            value = self.get_model().cell(command.row, command.column)
+            entry = self.matrix_entries[command.row][command.column]
+            entry.delete(0, tk.END)
+            if value is not None:
+                entry.insert(0, format_cell(value))
+    
+    # --- Live mode -----------------------------------------------------------------
+    
+    def _toggle_live(self):
+        """Enable or disable live recalculation"""
+        self.live_scorer = None
+        self.live_pending = {}
+        if self.live_var.get():
+            self._schedule_live()
+        else:
+            if self.live_after_id is not None:
+                self.frame.after_cancel(self.live_after_id)
+                self.live_after_id = None
+            self.live_tree.delete(*self.live_tree.get_children())
+            self.live_status.config(text="")
+    
+    def _on_entry_key(self, event):
+        """Validate the typed cell and queue it for the next live recompute"""
+        if not self.live_var.get():
+            return
+        position = self._entry_position(event.widget)
+        if position is None:
+            return
+        is_valid, value, _ = self._parse_cell(event.widget.get().strip())
+        self._live_queue(*position, crisp_value(value) if is_valid else None)
+    
+    def _live_queue(self, i, j, value):
+        """Remember a changed cell and (re)start the debounce timer"""
+        if not self.live_var.get():
+            return
+        self.live_pending[(i, j)] = value
+        self._schedule_live()
+    
+    def _live_structure_changed(self):
+        """Rows or columns moved: rebuild the scorer from the model on the next recompute"""
+        if not self.live_var.get():
+            return
+        self.live_scorer = None
+        self.live_pending = {}
+        self._schedule_live()
+    
+    def _schedule_live(self):
+        """Debounce: a burst of edits leads to one recompute after a quiet period"""
+        if self.live_after_id is not None:
+            self.frame.after_cancel(self.live_after_id)
+        self.live_after_id = self.frame.after(AppConfig.LIVE_DEBOUNCE_MS, self._live_recompute)
+    
+    @timed('view.input.live_recompute')
+    def _live_recompute(self):
+        """Apply the pending cells to the incremental scorer and show the ranking"""
+        self.live_after_id = None
+        model = self.get_model()
+        if not model.alternatives or not model.criteria:
+            self.live_tree.delete(*self.live_tree.get_children())
+            self.live_status.config(text="Tambahkan alternatif dan kriteria terlebih dahulu")
+            return
+        
+        if self.live_scorer is None:
+            # Model values plus whatever is typed in the grid but not committed yet
+            matrix = [row.copy() for row in model.decision_matrix]
+            for i, row_entries in enumerate(self.matrix_entries):
+                for j, entry in enumerate(row_entries):
+                    is_valid, value, _ = self._parse_cell(entry.get().strip())
+                    matrix[i][j] = crisp_value(value) if is_valid else None
+            self.live_scorer = IncrementalScorer(matrix, model.weights, model.criteria_types)
+        elif self.live_pending:
+            self.live_scorer.update(self.live_pending)
+        self.live_pending = {}
+        
+        self.live_tree.delete(*self.live_tree.get_children())
+        missing = self.live_scorer.missing_count
+        if missing:
+            self.live_status.config(text=f"{missing} sel kosong atau tidak valid")
+            return
+        
+        self.live_status.config(text="Semua sel valid")
+        for rank, (i, score) in enumerate(self.live_scorer.top(AppConfig.LIVE_TOP_K), 1):
+            self.live_tree.insert('', 'end', values=(rank, model.alternatives[i], f"{score:.4f}"))
+    
     def _clear_matrix(self):
         """Clear matrix input grid"""
         for widget in self.matrix_container.winfo_children():
             widget.destroy()
-        self.matrix_entries = []
\ No newline at end of file
+        columns, rows = self.matrix_container.grid_size()
+        for slot in range(rows):
+            self.matrix_container.grid_rowconfigure(slot, weight=0)
+        for slot in range(columns):
+            self.matrix_container.grid_columnconfigure(slot, weight=0)
+        self.matrix_entries = []
+        self.row_headers = []
+        self.col_headers = []
+        self.row_slots = []
+        self.col_slots = []
\ No newline at end of file
@@ -1,11 +1,12 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from tkinter import ttk, messagebox, simpledialog
 import numpy as np
+from datetime import datetime
 from views.base_view import BaseTabView
-from utils.exporters import ResultExporter
-from utils.chart_utils import ChartGenerator
+from utils.exporters import ResultExporter, ScenarioExporter
+from utils.chart_utils import chart_job, model_charts
+from utils.instrumentation import timed
+from config.settings import AppConfig
 
 
 class ResultsTabView(BaseTabView):
@@ -22,10 +23,21 @@ class ResultsTabView(BaseTabView):
         ttk.Button(control_frame, text="Export Hasil", 
                   command=self.export_results, style='green.TButton').pack(side='left', padx=5)
         
+        # Scenario controls
+        ttk.Button(control_frame, text="Simpan Skenario", 
+                  command=self.save_scenario).pack(side='left', padx=5)
+        ttk.Button(control_frame, text="Bandingkan Skenario", 
+                  command=self.show_scenario_comparison).pack(side='left', padx=5)
+        ttk.Button(control_frame, text="Export Skenario", 
+                  command=self.export_scenarios).pack(side='left', padx=5)
+        ttk.Button(control_frame, text="Export Semua Grafik", 
+                  command=self.export_charts).pack(side='left', padx=5)
+        
         # Chart container
         self.chart_frame = ttk.Frame(self.scrollable_frame)
         self.chart_frame.pack(fill='both', expand=True, padx=10, pady=5)
     
+    @timed('view.results.show_chart')
     def show_chart(self):
         """Display visualization charts"""
         model = self.get_model()
@@ -35,17 +47,8 @@ class ResultsTabView(BaseTabView):
             return
         
         try:
-            # Clear previous chart
-            self._clear_charts()
-            
-            # Generate charts
-            chart_generator = ChartGenerator()
-            fig = chart_generator.create_saw_charts(model.results)
-            
-            # Embed in tkinter
-            canvas = FigureCanvasTkAgg(fig, self.chart_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill='both', expand=True)
+            # Drawn off the Tk thread; shown again from cache while the results are unchanged
+            self.display_chart(self.chart_frame, *chart_job(model, 'hasil_saw'))
             
         except Exception as e:
             messagebox.showerror("Error", f"Gagal menampilkan grafik: {str(e)}")
@@ -66,6 +69,94 @@ class ResultsTabView(BaseTabView):
         except Exception as e:
             messagebox.showerror("Error", f"Gagal mengekspor: {str(e)}")
     
+    def save_scenario(self):
+        """Save the current weights as a named scenario"""
+        model = self.get_model()
+        
+        if not model.results:
+            messagebox.showwarning("Peringatan", "Lakukan perhitungan terlebih dahulu!")
+            return
+        
+        name = simpledialog.askstring("Simpan Skenario", "Nama skenario:", parent=self.frame)
+        if not name or not name.strip():
+            return
+        
+        try:
+            model.scenarios.add_scenario(name, weights=model.weights)
+            messagebox.showinfo("Sukses", f"Skenario '{name.strip()}' disimpan "
+                                f"({len(model.scenarios)} skenario)")
+        except Exception as e:
+            messagebox.showerror("Error", f"Gagal menyimpan skenario: {str(e)}")
+    
+    @timed('view.results.show_scenario_comparison')
+    def show_scenario_comparison(self):
+        """Display comparison chart for all saved scenarios"""
+        model = self.get_model()
+        
+        if not len(model.scenarios):
+            messagebox.showwarning("Peringatan", "Belum ada skenario yang disimpan!")
+            return
+        
+        try:
+            data = model.scenarios.get_comparison_data()
+            self.display_chart(self.chart_frame, *chart_job(model, 'skenario'))
+            if data['correlations'] is not None:
+                self._show_scenario_correlations(data['scenario_names'], data['correlations'])
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Gagal membandingkan skenario: {str(e)}")
+    
+    def _show_scenario_correlations(self, scenario_names, correlations):
+        """List the rank agreement of every scenario with the current ranking below the chart"""
+        lines = [f"{'Skenario':<25}{'Spearman':<10}{'Kendall':<10}Irisan {AppConfig.RANK_OVERLAP_K} teratas"]
+        for i, name in enumerate(scenario_names):
+            lines.append(f"{name:<25}{correlations['spearman'][i]:<10.4f}{correlations['kendall'][i]:<10.4f}"
+                         f"{correlations['top_k_overlap'][i] * 100:.0f}%")
+        ttk.Label(self.chart_frame, text="\n".join(lines), font=AppConfig.MONOSPACE_FONT,
+                  justify='left').pack(anchor='w', pady=(5, 0))
+    
+    def export_scenarios(self):
+        """Export all saved scenarios to file"""
+        model = self.get_model()
+        
+        if not len(model.scenarios):
+            messagebox.showwarning("Peringatan", "Belum ada skenario yang disimpan!")
+            return
+        
+        try:
+            data = model.scenarios.get_comparison_data()
+            exporter = ScenarioExporter()
+            filename = exporter.export_scenarios_to_csv(
+                data['scenario_names'], data['alternatives'], data['scores'])
+            messagebox.showinfo("Sukses", f"Skenario berhasil diekspor ke {filename}")
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Gagal mengekspor: {str(e)}")
+    
+    def export_charts(self):
+        """Write every available chart (results, scenarios, analyses) as PNG files, off the Tk thread"""
+        model = self.get_model()
+        charts = model_charts(model)
+        if not charts:
+            messagebox.showwarning("Peringatan", "Belum ada grafik untuk diekspor!")
+            return
+        
+        timestamp = datetime.now().strftime(AppConfig.EXPORT_DATE_FORMAT)
+        jobs = [(f"grafik_{name}_{timestamp}.png", key, build) for name, (key, build) in charts.items()]
+        future = self.get_chart_renderer().export(jobs)
+        self._wait_for_export(future)
+    
+    def _wait_for_export(self, future):
+        """Report the chart export once the worker has written the files"""
+        if not future.done():
+            self.frame.after(AppConfig.CHART_POLL_MS, self._wait_for_export, future)
+            return
+        try:
+            paths = future.result()
+            messagebox.showinfo("Sukses", f"{len(paths)} grafik berhasil diekspor:\n" + "\n".join(paths))
+        except Exception as e:
+            messagebox.showerror("Error", f"Gagal mengekspor grafik: {str(e)}")
+    
     def _clear_charts(self):
         """Clear previous charts"""
         for widget in self.chart_frame.winfo_children():
@@ -1,16 +1,18 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import numpy as np
 from views.base_view import BaseTabView
-from utils.chart_utils import SensitivityChartGenerator
+from utils.chart_utils import chart_job
+from utils.exporters import SensitivityExporter
 from config.settings import AppConfig
+from utils.instrumentation import timed
 
 
 class SensitivityTabView(BaseTabView):
     """Sensitivity analysis tab"""
     
+    NORM_LABELS = {'l1': 'L1 (total)', 'linf': 'L∞ (maksimum)'}
+    
     def create_widgets(self):
         """Create sensitivity analysis widgets"""
         # Control frame
@@ -23,6 +25,7 @@ class SensitivityTabView(BaseTabView):
         self.sens_criteria_combo = ttk.Combobox(control_frame, textvariable=self.sens_criteria_var, 
                                                state="readonly")
         self.sens_criteria_combo.pack(side='left', padx=5)
+        self.sens_criteria_combo.bind('<<ComboboxSelected>>', lambda e: self._update_map_button())
         
         ttk.Label(control_frame, text="Range Perubahan (0.1 - 1.0):").pack(side='left', padx=5)
         
@@ -32,6 +35,50 @@ class SensitivityTabView(BaseTabView):
         ttk.Button(control_frame, text="Analisis Sensitivitas", 
                   command=self.sensitivity_analysis, style='green.TButton').pack(side='left', padx=10)
         
+        # Rank agreement needs the full ranking of every step; only computed on request
+        self.correlation_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(control_frame, text="Kesesuaian Peringkat", 
+                       variable=self.correlation_var).pack(side='left', padx=5)
+        
+        # All-criteria sweep
+        all_frame = ttk.Frame(self.scrollable_frame)
+        all_frame.pack(fill='x', pady=(0, 10), padx=10)
+        
+        ttk.Button(all_frame, text="Analisis Semua Kriteria", 
+                  command=self.sensitivity_all_criteria, style='green.TButton').pack(side='left', padx=5)
+        ttk.Button(all_frame, text="Export Semua Kriteria", 
+                  command=self.export_all_criteria).pack(side='left', padx=5)
+        
+        # Two-criteria weight-space map
+        ttk.Label(all_frame, text="Kriteria Kedua:").pack(side='left', padx=(20, 5))
+        self.map_criteria_var = tk.StringVar()
+        self.map_criteria_combo = ttk.Combobox(all_frame, textvariable=self.map_criteria_var, 
+                                              state="readonly")
+        self.map_criteria_combo.pack(side='left', padx=5)
+        # The map needs two leaf criteria; disabled while a tree category is selected
+        self.map_button = ttk.Button(all_frame, text="Peta Stabilitas 2 Kriteria", 
+                                     command=self.weight_space_map, style='green.TButton')
+        self.map_button.pack(side='left', padx=5)
+        
+        # Minimum weight change that lifts an alternative into the top k
+        what_if_frame = ttk.Frame(self.scrollable_frame)
+        what_if_frame.pack(fill='x', pady=(0, 10), padx=10)
+        
+        ttk.Label(what_if_frame, text="Alternatif Target:").pack(side='left', padx=5)
+        self.target_var = tk.StringVar()
+        self.target_combo = ttk.Combobox(what_if_frame, textvariable=self.target_var,
+                                         postcommand=self._update_target_options)
+        self.target_combo.pack(side='left', padx=5)
+        ttk.Label(what_if_frame, text="Peringkat K:").pack(side='left', padx=5)
+        self.target_k_var = tk.StringVar(value="1")
+        ttk.Entry(what_if_frame, textvariable=self.target_k_var, width=5).pack(side='left', padx=5)
+        ttk.Label(what_if_frame, text="Jarak:").pack(side='left', padx=5)
+        self.norm_var = tk.StringVar(value=self.NORM_LABELS['l1'])
+        ttk.Combobox(what_if_frame, textvariable=self.norm_var, values=list(self.NORM_LABELS.values()),
+                     state="readonly", width=14).pack(side='left', padx=5)
+        ttk.Button(what_if_frame, text="Perubahan Bobot Minimum",
+                  command=self.minimum_weight_change, style='green.TButton').pack(side='left', padx=10)
+        
         # Results area
         results_frame = ttk.Frame(self.scrollable_frame)
         results_frame.pack(fill='both', expand=True, padx=10, pady=(0, 10))
@@ -44,6 +91,7 @@ class SensitivityTabView(BaseTabView):
         self.sens_chart_frame = ttk.Frame(results_frame, height=300)
         self.sens_chart_frame.pack(fill='both', expand=True, pady=(10, 0))
     
+    @timed('view.sensitivity.analysis')
     def sensitivity_analysis(self):
         """Perform sensitivity analysis"""
         model = self.get_model()
@@ -63,18 +111,33 @@ class SensitivityTabView(BaseTabView):
         
         try:
             selected_criteria = self.sens_criteria_var.get()
-            criteria_index = model.criteria.index(selected_criteria)
             
-            # Perform sensitivity analysis
-            sensitivity_results = model.sensitivity_analysis(criteria_index, weight_range)
+            # Perform sensitivity analysis; with a criteria tree any node (and its
+            # whole subtree) is reweighted against its siblings
+            if model.weight_method == 'tree':
+                sensitivity_results = model.tree_sensitivity(selected_criteria, weight_range,
+                                                             correlations=self.correlation_var.get())
+                original_weight = model.criteria_tree.local_weight(
+                    model.criteria, model.criteria_tree.node(selected_criteria))
+            else:
+                criteria_index = model.criteria.index(selected_criteria)
+                sensitivity_results = model.sensitivity_analysis(criteria_index, weight_range,
+                                                                 correlations=self.correlation_var.get())
+                original_weight = model.weights[criteria_index]
             stability_info = model.calculate_stability(sensitivity_results)
+            model.analyses['sensitivity'] = {
+                'criteria': selected_criteria,
+                'weight_range': weight_range,
+                'results': sensitivity_results
+            }
+            model.mark_dirty('analyses')
             
             # Display results
-            self._display_sensitivity_results(selected_criteria, model.weights[criteria_index], 
+            self._display_sensitivity_results(selected_criteria, original_weight, 
                                             weight_range, sensitivity_results, stability_info)
             
             # Create chart
-            self._create_sensitivity_chart(sensitivity_results, selected_criteria)
+            self._create_sensitivity_chart()
             
         except Exception as e:
             messagebox.showerror("Error", f"Terjadi kesalahan dalam analisis: {str(e)}")
@@ -88,48 +151,286 @@ class SensitivityTabView(BaseTabView):
         self.sens_text.insert(tk.END, f"Bobot Original: {original_weight:.3f}\n")
         self.sens_text.insert(tk.END, f"Range Perubahan: ±{weight_range:.3f}\n\n")
         
-        # Results table
-        self.sens_text.insert(tk.END, f"{'Perubahan':<12}{'Bobot Baru':<12}{'Alternatif Terbaik':<20}{'Skor':<10}\n")
-        self.sens_text.insert(tk.END, "-" * 60 + "\n")
+        # Results table; correlation columns only when they were computed
+        with_correlations = bool(sensitivity_results) and 'kendall' in sensitivity_results[0]
+        header = f"{'Perubahan':<12}{'Bobot Baru':<12}{'Alternatif Terbaik':<20}{'Skor':<10}"
+        if with_correlations:
+            header += f"{'Spearman':<10}{'Kendall':<10}{'Top-K':<8}"
+        self.sens_text.insert(tk.END, header + "\n")
+        self.sens_text.insert(tk.END, "-" * len(header) + "\n")
         
         for result in sensitivity_results:
-            self.sens_text.insert(tk.END, 
-                f"{result['change']:+.3f}       {result['new_weight']:.3f}       "
-                f"{result['winner']:<20}{result['score']:.4f}\n")
+            line = (f"{result['change']:+.3f}       {result['new_weight']:.3f}       "
+                    f"{result['winner']:<20}{result['score']:<10.4f}")
+            if with_correlations:
+                line += (f"{result['spearman']:<10.4f}{result['kendall']:<10.4f}"
+                         f"{result['top_k_overlap'] * 100:>5.0f}%")
+            self.sens_text.insert(tk.END, line + "\n")
         
         # Stability analysis
         self.sens_text.insert(tk.END, f"\nSTABILITAS KEPUTUSAN:\n")
         self.sens_text.insert(tk.END, f"Alternatif terbaik asli: {stability_info['original_winner']}\n")
         self.sens_text.insert(tk.END, f"Tingkat stabilitas: {stability_info['stability']:.1f}%\n")
         self.sens_text.insert(tk.END, f"Keputusan {stability_info['level']}\n")
+        if 'kendall' in stability_info:
+            self.sens_text.insert(tk.END, 
+                f"\nKESESUAIAN PERINGKAT (rata-rata / terendah):\n"
+                f"Spearman: {stability_info['spearman']:.4f} / {stability_info['min_spearman']:.4f}\n"
+                f"Kendall tau-b: {stability_info['kendall']:.4f} / {stability_info['min_kendall']:.4f}\n"
+                f"Irisan {AppConfig.RANK_OVERLAP_K} teratas: {stability_info['top_k_overlap'] * 100:.1f}% / "
+                f"{stability_info['min_top_k_overlap'] * 100:.1f}%\n")
     
-    def _create_sensitivity_chart(self, sensitivity_results, criteria_name):
-        """Create sensitivity analysis chart"""
-        # Clear previous chart
-        for widget in self.sens_chart_frame.winfo_children():
-            widget.destroy()
+    def _create_sensitivity_chart(self):
+        """Create the chart of the last sensitivity analysis"""
+        model = self.get_model()
+        if not model.analyses['sensitivity']['results']:
+            for widget in self.sens_chart_frame.winfo_children():
+                widget.destroy()
+            return
+
+        try:
+            self.display_chart(self.sens_chart_frame, *chart_job(model, 'sensitivitas'))
+        except Exception as e:
+            messagebox.showerror("Error", f"Gagal membuat grafik: {str(e)}")
+    
+    def _get_weight_range(self):
+        """Validate and return the weight range entry (None when invalid)"""
+        try:
+            range_str = str(self.sens_range_var.get())
+        except tk.TclError:
+            range_str = ''
+        is_valid, weight_range, error_msg = self.get_validator().validate_sensitivity_range(range_str)
+        if not is_valid:
+            messagebox.showwarning("Peringatan", error_msg)
+            return None
+        return weight_range
+    
+    @timed('view.sensitivity.all_criteria')
+    def sensitivity_all_criteria(self):
+        """Sweep every criteria and show the tornado stability ranking"""
+        model = self.get_model()
+        
+        if not model.results:
+            messagebox.showwarning("Peringatan", "Lakukan perhitungan terlebih dahulu!")
+            return
         
-        if not sensitivity_results:
+        weight_range = self._get_weight_range()
+        if weight_range is None:
             return
         
         try:
-            chart_generator = SensitivityChartGenerator()
-            fig = chart_generator.create_sensitivity_chart(sensitivity_results, criteria_name)
+            self.frame.config(cursor='watch')
+            self.frame.update_idletasks()
+            analysis = model.sensitivity_all_criteria(weight_range)
+            model.analyses['all_criteria'] = analysis
+            model.mark_dirty('analyses')
             
-            canvas = FigureCanvasTkAgg(fig, self.sens_chart_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill='both', expand=True)
+            self._display_all_criteria_results(analysis, model.results[0])
+            self._create_tornado_chart()
             
+        except Exception as e:
+            messagebox.showerror("Error", f"Terjadi kesalahan dalam analisis: {str(e)}")
+        finally:
+            self.frame.config(cursor='')
+    
+    def _display_all_criteria_results(self, analysis, original_result):
+        """Display the stability ranking of all criteria"""
+        self.sens_text.delete(1.0, tk.END)
+        self.sens_text.insert(tk.END, "=== ANALISIS SENSITIVITAS SEMUA KRITERIA ===\n")
+        self.sens_text.insert(tk.END, f"Alternatif terbaik asli: {original_result[0]} "
+                                      f"(Skor: {original_result[1]:.4f})\n")
+        self.sens_text.insert(tk.END, f"Range Perubahan: ±{analysis['weight_range']:.3f}\n\n")
+        
+        self.sens_text.insert(tk.END, f"{'Kriteria':<20}{'Bobot':<8}{'Stabilitas':<12}"
+                                      f"{'Turun Kritis':<14}{'Naik Kritis':<13}{'Rentang Skor':<12}\n")
+        self.sens_text.insert(tk.END, "-" * 79 + "\n")
+        
+        def fmt(change):
+            return f"{change:+.3f}" if change is not None else "-"
+        
+        for item in analysis['summary']:
+            self.sens_text.insert(tk.END, 
+                f"{item['criteria']:<20}{item['original_weight']:<8.3f}"
+                f"{item['stability']:>6.1f}%     {fmt(item['lower_change']):<14}"
+                f"{fmt(item['upper_change']):<13}{item['swing']:.4f}\n")
+        
+        most_sensitive = analysis['summary'][0] if analysis['summary'] else None
+        if most_sensitive:
+            self.sens_text.insert(tk.END, f"\nKriteria paling sensitif: {most_sensitive['criteria']} "
+                                          f"({most_sensitive['level']})\n")
+    
+    def _create_tornado_chart(self):
+        """Create tornado chart for the all-criteria analysis"""
+        try:
+            self.display_chart(self.sens_chart_frame, *chart_job(self.get_model(), 'tornado'))
         except Exception as e:
             messagebox.showerror("Error", f"Gagal membuat grafik: {str(e)}")
     
-    def update_criteria_options(self, criteria_list):
-        """Update criteria combo box options"""
-        self.sens_criteria_combo['values'] = criteria_list
+    def export_all_criteria(self):
+        """Export the all-criteria stability ranking"""
+        model = self.get_model()
+        
+        analysis = model.analyses.get('all_criteria')
+        if not analysis or not model.results:
+            messagebox.showwarning("Peringatan", "Lakukan analisis semua kriteria terlebih dahulu!")
+            return
+        
+        try:
+            exporter = SensitivityExporter()
+            filename = exporter.export_tornado_to_csv(
+                analysis['summary'],
+                analysis['weight_range'],
+                model.results[0][0])
+            messagebox.showinfo("Sukses", f"Hasil berhasil diekspor ke {filename}")
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Gagal mengekspor: {str(e)}")
+    
+    @timed('view.sensitivity.weight_map')
+    def weight_space_map(self):
+        """Compute and show the two-criteria winner region map"""
+        model = self.get_model()
+        
+        if not model.results or not self.sens_criteria_var.get() or not self.map_criteria_var.get():
+            messagebox.showwarning("Peringatan", 
+                                 "Lakukan perhitungan dan pilih dua kriteria terlebih dahulu!")
+            return
+        if self.sens_criteria_var.get() not in model.criteria:
+            messagebox.showwarning("Peringatan", "Peta stabilitas hanya untuk kriteria, bukan kategori!")
+            return
+        
+        try:
+            criteria_x = model.criteria.index(self.sens_criteria_var.get())
+            criteria_y = model.criteria.index(self.map_criteria_var.get())
+            if criteria_x == criteria_y:
+                messagebox.showwarning("Peringatan", "Pilih dua kriteria yang berbeda!")
+                return
+            
+            self.frame.config(cursor='watch')
+            self.frame.update_idletasks()
+            map_result = model.weight_space_map(criteria_x, criteria_y)
+            model.analyses['weight_map'] = map_result
+            model.mark_dirty('analyses')
+            
+            self._display_weight_map_results(map_result, model)
+            
+            self.display_chart(self.sens_chart_frame, *chart_job(model, 'peta_bobot'))
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Terjadi kesalahan dalam analisis: {str(e)}")
+        finally:
+            self.frame.config(cursor='')
+    
+    def _display_weight_map_results(self, map_result, model):
+        """Display the winner share of the two-criteria map"""
+        name_x, name_y = map_result['criteria']
+        winner_grid = map_result['winner_grid']
+        valid = winner_grid[winner_grid >= 0]
+        winner_ids, counts = np.unique(valid, return_counts=True)
+        
+        self.sens_text.delete(1.0, tk.END)
+        self.sens_text.insert(tk.END, "=== PETA STABILITAS 2 KRITERIA ===\n")
+        self.sens_text.insert(tk.END, f"Kriteria: {name_x} (sumbu X) vs {name_y} (sumbu Y)\n")
+        self.sens_text.insert(tk.END, f"Titik grid valid: {valid.size}\n\n")
+        
+        self.sens_text.insert(tk.END, f"{'Alternatif':<25}{'Wilayah Menang':<15}\n")
+        self.sens_text.insert(tk.END, "-" * 40 + "\n")
+        for i in np.argsort(-counts):
+            self.sens_text.insert(tk.END, 
+                f"{model.alternatives[winner_ids[i]]:<25}{counts[i] / valid.size * 100:>6.1f}%\n")
+        
+        self.sens_text.insert(tk.END, f"\nAlternatif terbaik asli menang pada "
+                                      f"{map_result['original_winner_share'] * 100:.1f}% wilayah bobot\n")
+    
+    def _update_target_options(self):
+        """List the best-ranked alternatives as targets; any other name can be typed in"""
+        results = self.get_model().results[:AppConfig.WHAT_IF_TARGET_OPTIONS]
+        self.target_combo['values'] = [name for name, _ in results]
+    
+    @timed('view.sensitivity.minimum_weight_change')
+    def minimum_weight_change(self):
+        """Find the smallest weight change that puts the target alternative in the top k"""
+        model = self.get_model()
+        
+        if not model.results or self.target_var.get() not in model.alternatives:
+            messagebox.showwarning("Peringatan",
+                                 "Lakukan perhitungan dan pilih alternatif target terlebih dahulu!")
+            return
+        try:
+            k = int(self.target_k_var.get())
+        except ValueError:
+            k = 0
+        if not 1 <= k < len(model.alternatives):
+            messagebox.showwarning("Peringatan",
+                                 f"Peringkat K harus antara 1 dan {len(model.alternatives) - 1}!")
+            return
+        norm = next(key for key, label in self.NORM_LABELS.items() if label == self.norm_var.get())
+        
+        try:
+            self.frame.config(cursor='watch')
+            self.frame.update_idletasks()
+            result = model.minimum_weight_change(model.alternatives.index(self.target_var.get()), k, norm)
+            model.analyses['minimum_weight_change'] = result
+            model.mark_dirty('analyses')
+            self._display_minimum_weight_change(result, model)
+        except Exception as e:
+            messagebox.showerror("Error", f"Terjadi kesalahan dalam analisis: {str(e)}")
+        finally:
+            self.frame.config(cursor='')
+    
+    def _display_minimum_weight_change(self, result, model):
+        """Display the closest weights and the single-criteria changes"""
+        self.sens_text.delete(1.0, tk.END)
+        self.sens_text.insert(tk.END, "=== PERUBAHAN BOBOT MINIMUM ===\n")
+        self.sens_text.insert(tk.END, f"Alternatif target: {result['target']} "
+                                      f"(peringkat saat ini: {result['rank']})\n")
+        self.sens_text.insert(tk.END, f"Tujuan: peringkat {result['k']} teratas, "
+                                      f"jarak {self.NORM_LABELS[result['norm']]}\n\n")
+        if result['already']:
+            self.sens_text.insert(tk.END, "Target sudah berada di peringkat tersebut dengan bobot saat ini.\n")
+            return
+        
+        solution = result['solution']
+        if not solution['feasible']:
+            self.sens_text.insert(tk.END, "Tidak ada kombinasi bobot yang dapat mencapai peringkat tersebut.\n")
+        else:
+            self.sens_text.insert(tk.END, f"Perubahan total (L1): {solution['l1']:.4f}   "
+                                          f"Perubahan terbesar (L∞): {solution['linf']:.4f}\n")
+            if result['k'] > 1:
+                self.sens_text.insert(tk.END, "(Untuk K > 1 hasil ini batas atas perubahan minimum)\n")
+            self.sens_text.insert(tk.END, f"\n{'Kriteria':<20}{'Bobot':<10}{'Bobot Baru':<12}{'Perubahan':<10}\n")
+            self.sens_text.insert(tk.END, "-" * 52 + "\n")
+            changed = np.flatnonzero(np.abs(solution['change']) > 1e-9)
+            for j in changed[np.argsort(-np.abs(solution['change'][changed]))]:
+                self.sens_text.insert(tk.END,
+                    f"{model.criteria[j]:<20}{model.weights[j]:<10.4f}"
+                    f"{solution['weights'][j]:<12.4f}{solution['change'][j]:+.4f}\n")
+        
+        self.sens_text.insert(tk.END, "\nPERUBAHAN SATU KRITERIA (bobot lain disesuaikan):\n")
+        if not result['single']:
+            self.sens_text.insert(tk.END, "Tidak ada satu kriteria pun yang cukup diubah sendiri.\n")
+        for change in result['single']:
+            self.sens_text.insert(tk.END,
+                f"{change['criteria']:<20}{change['weight']:<10.4f}"
+                f"{change['new_weight']:<12.4f}{change['change']:+.4f}\n")
+    
+    def update_criteria_options(self, criteria_list, tree_nodes=None):
+        """Update criteria combo box options (tree categories can be swept too)"""
+        categories = [name for name in tree_nodes or [] if name not in criteria_list]
+        self.sens_criteria_combo['values'] = categories + list(criteria_list)
+        self.map_criteria_combo['values'] = criteria_list
         if criteria_list:
             self.sens_criteria_combo.current(0)
+            self.map_criteria_combo.current(min(1, len(criteria_list) - 1))
         else:
             self.sens_criteria_var.set('')
+            self.map_criteria_var.set('')
+        self._update_map_button()
+    
+    def _update_map_button(self):
+        """Enable the weight-space map only for a leaf criteria"""
+        is_criteria = self.sens_criteria_var.get() in self.get_model().criteria
+        self.map_button.state(['!disabled'] if is_criteria else ['disabled'])
     
     def clear_results(self):
         """Clear results (called from controller)"""